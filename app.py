@@ -1,45 +1,93 @@
 from shiny import App, ui, render, reactive
+import importlib
 import numpy as np
-import sympy as sp
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import time
 from pathlib import Path
 from shinywidgets import output_widget, render_plotly
 
-# Importar módulos de métodos numéricos
-from modules.equation_parser import EquationParser
+# Sólo el validador se carga al arrancar: no depende de SymPy hasta que se parsea
+# una ecuación. Los métodos numéricos, SymPy y Plotly se importan bajo demanda.
 from modules.validation import InputValidator
-from modules.plotting import InteractivePlotter
 
-# Métodos de búsqueda de raíces
-from modules.root_finding.bisection import BisectionMethod
-from modules.root_finding.false_position import FalsePositionMethod
-from modules.root_finding.newton_raphson import NewtonRaphsonMethod
-from modules.root_finding.secant import SecantMethod
-from modules.root_finding.multiple_roots import MultipleRootsMethod
+# Registro de métodos: id -> (módulo, clase). Se importan en el primer uso.
+METHOD_REGISTRY = {
+    # Métodos de búsqueda de raíces
+    "bisection": ("modules.root_finding.bisection", "BisectionMethod"),
+    "false_position": ("modules.root_finding.false_position", "FalsePositionMethod"),
+    "brent": ("modules.root_finding.brent", "BrentMethod"),
+    "newton_raphson": ("modules.root_finding.newton_raphson", "NewtonRaphsonMethod"),
+    "newton_basins": ("modules.root_finding.newton_raphson", "NewtonRaphsonMethod"),
+    "secant": ("modules.root_finding.secant", "SecantMethod"),
+    "muller": ("modules.root_finding.muller", "MullerMethod"),
+    "multiple_roots": ("modules.root_finding.multiple_roots", "MultipleRootsMethod"),
+    "all_roots": ("modules.root_finding.all_roots", "AllRootsFinder"),
+    "polynomial_roots": ("modules.root_finding.polynomial", "PolynomialRootsMethod"),
+
+    # Sistemas lineales
+    "jacobi": ("modules.linear_systems.jacobi", "JacobiMethod"),
+    "gauss_seidel": ("modules.linear_systems.gauss_seidel", "GaussSeidelMethod"),
+    "sor": ("modules.linear_systems.sor", "SORMethod"),
+    "ssor": ("modules.linear_systems.sor", "SSORMethod"),
+    "conjugate_gradient": ("modules.linear_systems.conjugate_gradient", "ConjugateGradientMethod"),
+    "gaussian_elimination": ("modules.linear_systems.gaussian_elimination", "GaussianElimination"),
+    "gauss_jordan": ("modules.linear_systems.gaussian_elimination", "GaussJordanElimination"),
+
+    # Sistemas no lineales
+    "newton_system": ("modules.nonlinear_systems.newton_system", "NewtonSystemMethod"),
+    "broyden": ("modules.nonlinear_systems.broyden", "BroydenMethod"),
+
+    # Integración numérica
+    "trapezoidal": ("modules.integration.trapecio", "TrapezoidalRule"),
+    "simpson_13": ("modules.integration.simpson", "SimpsonIntegration"),
+    "simpson_38": ("modules.integration.simpson", "SimpsonIntegration"),
+    "gaussian_quadrature": ("modules.integration.gaussian_quadrature", "GaussianQuadrature"),
+
+    # EDOs
+    "euler": ("modules.edo.euler", "EulerMethod"),
+    "euler_modified": ("modules.edo.euler_modified", "ModifiedEulerMethod"),
+    "runge_kutta": ("modules.edo.runge_kutta", "RungeKuttaMethod"),
+
+    # Taylor
+    "taylor": ("modules.taylor", "TaylorPolynomial"),
+}
+
+_method_classes = {}
+_lazy_components = {}
+
+
+def get_method_class(method_id):
+    """Importa (una sola vez) y devuelve la clase que implementa el método"""
+    if method_id not in _method_classes:
+        module_name, class_name = METHOD_REGISTRY[method_id]
+        module = importlib.import_module(module_name)
+        _method_classes[method_id] = getattr(module, class_name)
+    return _method_classes[method_id]
 
-# Sistemas lineales
-from modules.linear_systems.jacobi import JacobiMethod
-from modules.linear_systems.gauss_seidel import GaussSeidelMethod
-from modules.linear_systems.gaussian_elimination import GaussianElimination, GaussJordanElimination
 
-# Integración numérica
-from modules.integration.simpson import SimpsonIntegration
-from modules.integration.trapecio import TrapezoidalRule
-from modules.integration.gaussian_quadrature import GaussianQuadrature
+def get_equation_parser():
+    if "parser" not in _lazy_components:
+        from modules.equation_parser import EquationParser
+        _lazy_components["parser"] = EquationParser()
+    return _lazy_components["parser"]
 
-# EDOs
-from modules.edo.euler import EulerMethod
-from modules.edo.euler_modified import ModifiedEulerMethod
-from modules.edo.runge_kutta import RungeKuttaMethod
 
-# Taylor
-from modules.taylor import TaylorPolynomial
+def get_plotter():
+    if "plotter" not in _lazy_components:
+        from modules.plotting import InteractivePlotter
+        _lazy_components["plotter"] = InteractivePlotter()
+    return _lazy_components["plotter"]
+
 
 # Inicializar componentes globales
-equation_parser = EquationParser()
 validator = InputValidator()
-plotter = InteractivePlotter()
+
+# Métodos que reciben un sistema de ecuaciones en lugar de f(x)
+SYSTEM_METHODS = ["newton_system", "broyden"]
+ITERATIVE_LINEAR_METHODS = ["jacobi", "gauss_seidel", "sor", "ssor", "conjugate_gradient"]
+RELAXATION_METHODS = ["sor", "ssor"]
+
+# Espera tras la última pulsación antes de lanzar la validación completa con SymPy
+VALIDATION_DEBOUNCE_SECONDS = 0.4
 
 # Definir métodos disponibles
 METHODS = {
@@ -48,9 +96,14 @@ METHODS = {
         "methods": {
             "bisection": {"name": "Método de Bisección", "icon": "🔍"},
             "false_position": {"name": "Falsa Posición", "icon": "📐"},
+            "brent": {"name": "Método de Brent", "icon": "🎯"},
             "newton_raphson": {"name": "Newton-Raphson", "icon": "📈"},
+            "newton_basins": {"name": "Cuencas de Newton", "icon": "🗺️"},
             "secant": {"name": "Método de la Secante", "icon": "📊"},
-            "multiple_roots": {"name": "Raíces Múltiples", "icon": "🔢"}
+            "muller": {"name": "Método de Muller", "icon": "🌀"},
+            "multiple_roots": {"name": "Raíces Múltiples", "icon": "🔢"},
+            "all_roots": {"name": "Todas las Raíces", "icon": "🧭"},
+            "polynomial_roots": {"name": "Raíces de Polinomios", "icon": "🧮"}
         }
     },
     "lineales": {
@@ -58,10 +111,20 @@ METHODS = {
         "methods": {
             "jacobi": {"name": "Método de Jacobi", "icon": "🔄"},
             "gauss_seidel": {"name": "Gauss-Seidel", "icon": "⚡"},
+            "sor": {"name": "SOR (Sobrerrelajación)", "icon": "🚀"},
+            "ssor": {"name": "SSOR (SOR Simétrico)", "icon": "🔁"},
+            "conjugate_gradient": {"name": "Gradiente Conjugado", "icon": "📐"},
             "gaussian_elimination": {"name": "Eliminación Gaussiana", "icon": "🎯"},
             "gauss_jordan": {"name": "Gauss-Jordan", "icon": "🔍"}
         }
     },
+    "no_lineales": {
+        "name": "Sistemas No Lineales",
+        "methods": {
+            "newton_system": {"name": "Newton para Sistemas", "icon": "🧩"},
+            "broyden": {"name": "Método de Broyden", "icon": "🔁"}
+        }
+    },
     "integracion": {
         "name": "Integración Numérica",
         "methods": {
@@ -230,6 +293,10 @@ def server(input, output, session):
 
         current_method.set(method_id)
 
+        # Los sistemas se escriben en su propio panel, sin el editor de f(x)
+        if method_id in SYSTEM_METHODS:
+            return generate_specific_inputs(method_id)
+
         equation_input = ui.div(
             ui.div(
                 ui.input_text(
@@ -247,6 +314,9 @@ def server(input, output, session):
         specific_inputs = generate_specific_inputs(method_id)
         return ui.div(equation_input, specific_inputs)
 
+    # Estado del debounce de la validación completa (por sesión)
+    pending_validation = {"equation": None, "since": 0.0}
+
     @output
     @render.ui
     def equation_validation():
@@ -254,8 +324,26 @@ def server(input, output, session):
         if not equation:
             return ui.div()
 
-        variables = get_required_variables(input.method_select())
-        is_valid, message = validator.validate_equation(equation, variables)
+        # 1) Verificación rápida en cada pulsación (sin SymPy)
+        is_valid, message = validator.quick_validate_equation(equation)
+
+        # 2) Validación completa con SymPy sólo cuando el usuario deja de escribir
+        if is_valid:
+            now = time.monotonic()
+            if equation != pending_validation["equation"]:
+                pending_validation.update(equation=equation, since=now)
+
+            remaining = VALIDATION_DEBOUNCE_SECONDS - (now - pending_validation["since"])
+            if remaining > 0:
+                reactive.invalidate_later(remaining)
+                return ui.div(
+                    ui.span("… ", class_="text-muted"),
+                    ui.span("Verificando ecuación", class_="text-muted"),
+                    class_="small"
+                )
+
+            variables = get_required_variables(input.method_select())
+            is_valid, message = validator.validate_equation(equation, variables)
 
         if is_valid:
             return ui.div(
@@ -273,7 +361,7 @@ def server(input, output, session):
     def generate_specific_inputs(method_id):
         inputs = []
 
-        if method_id in ["bisection", "false_position"]:
+        if method_id in ["bisection", "false_position", "brent"]:
             inputs.extend([
                 ui.input_numeric("a_value", "Límite inferior a:", value=-2.0),
                 ui.input_numeric("b_value", "Límite superior b:", value=2.0),
@@ -281,11 +369,48 @@ def server(input, output, session):
                 ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=100, min=1)
             ])
 
+        elif method_id == "all_roots":
+            inputs.extend([
+                ui.input_numeric("a_value", "Límite inferior a:", value=-10.0),
+                ui.input_numeric("b_value", "Límite superior b:", value=10.0),
+                ui.input_numeric("tolerance", "Tolerancia:", value=1e-10, step=1e-8),
+                ui.input_numeric("n_samples", "Muestras iniciales:", value=1000, min=3)
+            ])
+
+        elif method_id == "polynomial_roots":
+            inputs.extend([
+                ui.input_numeric("tolerance", "Tolerancia de pulido:", value=1e-12, step=1e-12),
+                ui.input_numeric("max_iterations", "Máximo de iteraciones de pulido:", value=50, min=1)
+            ])
+
         elif method_id in ["newton_raphson", "multiple_roots"]:
             inputs.extend([
                 ui.input_numeric("initial_guess", "Valor inicial x₀:", value=1.0),
                 ui.input_numeric("tolerance", "Tolerancia:", value=1e-6, step=1e-8),
-                ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=100, min=1)
+                ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=100, min=1),
+                ui.input_select(
+                    "acceleration",
+                    "Aceleración:",
+                    choices={
+                        "none": "Ninguna",
+                        "aitken": "Aitken Δ² (extrapola los iterados)",
+                        "steffensen": "Steffensen (sobre el paso del método)"
+                    }
+                ),
+                ui.input_checkbox(
+                    "complex_mode", "Buscar raíces complejas", value=False
+                ) if method_id == "newton_raphson" else None
+            ])
+
+        elif method_id == "newton_basins":
+            inputs.extend([
+                ui.input_numeric("re_min", "Re(x₀) mínimo:", value=-2.0),
+                ui.input_numeric("re_max", "Re(x₀) máximo:", value=2.0),
+                ui.input_numeric("im_min", "Im(x₀) mínimo:", value=-2.0),
+                ui.input_numeric("im_max", "Im(x₀) máximo (igual al mínimo = sólo reales):", value=2.0),
+                ui.input_numeric("grid_resolution", "Resolución de la malla:", value=200, min=2, max=1000),
+                ui.input_numeric("tolerance", "Tolerancia:", value=1e-8, step=1e-8),
+                ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=50, min=1)
             ])
 
         elif method_id == "secant":
@@ -293,6 +418,16 @@ def server(input, output, session):
                 ui.input_numeric("x0_value", "x₀:", value=0.0),
                 ui.input_numeric("x1_value", "x₁:", value=1.0),
                 ui.input_numeric("tolerance", "Tolerancia:", value=1e-6, step=1e-8),
+                ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=100, min=1),
+                ui.input_checkbox("complex_mode", "Buscar raíces complejas", value=False)
+            ])
+
+        elif method_id == "muller":
+            inputs.extend([
+                ui.input_text("x0_text", "x₀ (admite complejos, p. ej. 1+2i):", value="0"),
+                ui.input_text("x1_text", "x₁:", value="0.5"),
+                ui.input_text("x2_text", "x₂:", value="1"),
+                ui.input_numeric("tolerance", "Tolerancia:", value=1e-10, step=1e-8),
                 ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=100, min=1)
             ])
 
@@ -345,11 +480,16 @@ def server(input, output, session):
                 )
             ])
 
-        elif method_id in ["jacobi", "gauss_seidel"]:
+        elif method_id in ITERATIVE_LINEAR_METHODS:
             inputs.extend([
+                ui.input_select(
+                    "matrix_format",
+                    "Formato de la matriz:",
+                    choices={"dense": "Densa (una fila por línea)", "triplets": "Dispersa (tripletes i j valor)"}
+                ),
                 ui.input_text_area(
                     "matrix_input",
-                    "Matriz A (una fila por línea):",
+                    "Matriz A (una fila por línea, o un triplete 'i j valor' por línea con índices desde 1):",
                     placeholder="2 1\n1 2",
                     rows=4
                 ),
@@ -366,6 +506,39 @@ def server(input, output, session):
                 ui.input_numeric("tolerance", "Tolerancia:", value=1e-6, step=1e-8),
                 ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=100, min=1)
             ])
+            if method_id in RELAXATION_METHODS:
+                inputs.append(
+                    ui.input_numeric(
+                        "omega",
+                        "Factor de relajación ω (opcional, vacío = estimación automática):",
+                        value=None,
+                        min=0,
+                        max=2,
+                        step=0.05
+                    )
+                )
+
+        elif method_id in SYSTEM_METHODS:
+            inputs.extend([
+                ui.input_text_area(
+                    "system_input",
+                    "Sistema F(x) = 0 (una ecuación por línea):",
+                    placeholder="x^2 + y^2 - 4\nx*y - 1",
+                    rows=4
+                ),
+                ui.input_text(
+                    "system_variables",
+                    "Incógnitas (separadas por espacios):",
+                    placeholder="x y"
+                ),
+                ui.input_text(
+                    "initial_guess_input",
+                    "Vector inicial (opcional):",
+                    placeholder="2 0.5"
+                ),
+                ui.input_numeric("tolerance", "Tolerancia:", value=1e-8, step=1e-8),
+                ui.input_numeric("max_iterations", "Máximo de iteraciones:", value=50, min=1)
+            ])
 
         elif method_id in ["gaussian_elimination", "gauss_jordan"]:
             inputs.extend([
@@ -503,6 +676,31 @@ def server(input, output, session):
                     ui.p(f"Raíz encontrada: {result['root']:.8f}")
                 )
 
+            if result.get('accelerated_root') is not None:
+                output_elements.append(
+                    ui.p(f"Raíz extrapolada (Aitken Δ²): {result['accelerated_root']:.8f}")
+                )
+
+            if result.get('estimated_multiplicity', 1) > 1:
+                output_elements.append(
+                    ui.p(f"Multiplicidad estimada: {result['estimated_multiplicity']}")
+                )
+
+            if isinstance(result.get('roots'), list):
+                if result['roots']:
+                    roots_str = ", ".join([f"{x:.8f}" for x in result['roots']])
+                    output_elements.append(ui.p(f"Raíces encontradas: [{roots_str}]"))
+                if result.get('multiplicities'):
+                    mult_str = ", ".join(str(m) for m in result['multiplicities'])
+                    output_elements.append(ui.p(f"Multiplicidades: [{mult_str}]"))
+                if result.get('poles'):
+                    poles_str = ", ".join([f"{x:.6f}" for x in result['poles']])
+                    output_elements.append(ui.p(f"Polos descartados: [{poles_str}]"))
+
+            if result.get('cluster_roots'):
+                roots_str = ", ".join([f"{x:.6g}" for x in result['cluster_roots']])
+                output_elements.append(ui.p(f"Raíces alcanzadas: [{roots_str}]"))
+
             if 'integral' in result:
                 output_elements.append(
                     ui.p(f"Valor de la integral: {result['integral']:.8f}")
@@ -522,6 +720,29 @@ def server(input, output, session):
                     ui.p(f"Número de iteraciones: {len(result['iterations'])}")
                 )
 
+            if 'jacobian_evaluations' in result:
+                output_elements.append(
+                    ui.p(f"Evaluaciones del jacobiano: {result['jacobian_evaluations']}")
+                )
+
+            if 'omega' in result:
+                output_elements.append(
+                    ui.p(f"Factor de relajación ω: {result['omega']:.4f}")
+                )
+
+            if 'sweeps_saved' in result:
+                output_elements.append(
+                    ui.p(
+                        f"Gauss-Seidel (ω = 1): {result['gauss_seidel_iterations']} iteraciones "
+                        f"({result['sweeps_saved']} barridos ahorrados)"
+                    )
+                )
+
+            if result.get('condition_estimate') is not None:
+                output_elements.append(
+                    ui.p(f"Número de condición estimado (Lanczos): {result['condition_estimate']:.4g}")
+                )
+
             if 'final_error' in result:
                 output_elements.append(
                     ui.p(f"Error final: {result['final_error']:.2e}")
@@ -548,17 +769,24 @@ def server(input, output, session):
         if not result or not result.get('success', False):
             return create_empty_plot("Ejecute un cálculo para ver la gráfica")
 
+        if method_id in SYSTEM_METHODS:
+            return create_empty_plot("Gráfica no disponible para sistemas no lineales")
+
         try:
             equation = input.equation_input()
             if not equation:
                 return create_empty_plot("No hay ecuación para graficar")
 
             variables = get_required_variables(method_id)
-            eq_data = equation_parser.parse_equation(equation, variables)
+            eq_data = get_equation_parser().parse_equation(equation, variables)
+
+            if method_id == "newton_basins":
+                return get_plotter().plot_basins(result)
 
             if method_id in [
-                "bisection", "false_position",
-                "newton_raphson", "secant", "multiple_roots"
+                "bisection", "false_position", "brent",
+                "newton_raphson", "secant", "muller", "multiple_roots", "all_roots",
+                "polynomial_roots"
             ]:
                 x_range = (-10, 10)
                 try:
@@ -569,7 +797,7 @@ def server(input, output, session):
                 except Exception:
                     pass
 
-                return plotter.plot_root_finding(
+                return get_plotter().plot_root_finding(
                     equation_data=eq_data,
                     root_data=result,
                     x_range=x_range
@@ -581,7 +809,7 @@ def server(input, output, session):
             ]:
                 a = input.a_value() if 'a_value' in input else 0
                 b = input.b_value() if 'b_value' in input else 1
-                return plotter.plot_integration(
+                return get_plotter().plot_integration(
                     equation_data=eq_data,
                     integration_data=result,
                     a=a,
@@ -589,7 +817,7 @@ def server(input, output, session):
                 )
 
             elif method_id in ["euler", "euler_modified", "runge_kutta"]:
-                return plotter.plot_edo_solution(result)
+                return get_plotter().plot_edo_solution(result)
 
             else:
                 return create_empty_plot("Gráfica no disponible para este método")
@@ -640,6 +868,20 @@ def server(input, output, session):
     @reactive.event(input.calculate)
     def perform_calculation():
         method_id = input.method_select()
+
+        # Los sistemas no lineales se validan al parsearlos en el propio método
+        if method_id in SYSTEM_METHODS:
+            result = execute_method(method_id, None)
+            calculation_result.set(result)
+            if result.get('success', False):
+                ui.notification_show("Cálculo completado exitosamente!", type="message")
+            else:
+                ui.notification_show(
+                    f"Error en el cálculo: {result.get('error', 'Error desconocido')}",
+                    type="error"
+                )
+            return
+
         equation = input.equation_input()
 
         if not method_id or not equation:
@@ -686,8 +928,17 @@ def server(input, output, session):
 
     def execute_method(method_id, equation):
         try:
+            if method_id not in METHOD_REGISTRY:
+                return {
+                    'success': False,
+                    'error': f"Método '{method_id}' no implementado"
+                }
+
+            # Importación perezosa del módulo del método
+            method = get_method_class(method_id)()
+
             if method_id == "bisection":
-                return BisectionMethod().solve(
+                return method.solve(
                     equation,
                     input.a_value(),
                     input.b_value(),
@@ -695,8 +946,8 @@ def server(input, output, session):
                     input.max_iterations()
                 )
 
-            elif method_id == "false_position":
-                return FalsePositionMethod().solve(
+            elif method_id in ["false_position", "brent"]:
+                return method.solve(
                     equation,
                     input.a_value(),
                     input.b_value(),
@@ -705,32 +956,78 @@ def server(input, output, session):
                 )
 
             elif method_id == "newton_raphson":
-                return NewtonRaphsonMethod().solve(
+                return method.solve(
                     equation,
                     input.initial_guess(),
                     input.tolerance(),
+                    input.max_iterations(),
+                    complex_mode=input.complex_mode(),
+                    accelerate=None if input.acceleration() == "none" else input.acceleration()
+                )
+
+            elif method_id == "newton_basins":
+                imag_range = None
+                if input.im_max() != input.im_min():
+                    imag_range = (input.im_min(), input.im_max())
+                starts = method.starting_grid(
+                    (input.re_min(), input.re_max()),
+                    imag_range,
+                    int(input.grid_resolution())
+                )
+                return method.solve_multistart(
+                    equation,
+                    starts,
+                    input.tolerance(),
                     input.max_iterations()
                 )
 
             elif method_id == "secant":
-                return SecantMethod().solve(
+                return method.solve(
                     equation,
                     input.x0_value(),
                     input.x1_value(),
                     input.tolerance(),
+                    input.max_iterations(),
+                    complex_mode=input.complex_mode()
+                )
+
+            elif method_id == "muller":
+                return method.solve(
+                    equation,
+                    input.x0_text(),
+                    input.x1_text(),
+                    input.x2_text(),
+                    input.tolerance(),
                     input.max_iterations()
                 )
 
             elif method_id == "multiple_roots":
-                return MultipleRootsMethod().solve(
+                return method.solve(
                     equation,
                     input.initial_guess(),
                     input.tolerance(),
+                    input.max_iterations(),
+                    accelerate=None if input.acceleration() == "none" else input.acceleration()
+                )
+
+            elif method_id == "all_roots":
+                return method.find_all_roots(
+                    equation,
+                    input.a_value(),
+                    input.b_value(),
+                    input.tolerance(),
+                    input.n_samples()
+                )
+
+            elif method_id == "polynomial_roots":
+                return method.solve(
+                    equation,
+                    input.tolerance(),
                     input.max_iterations()
                 )
 
             elif method_id == "trapezoidal":
-                return TrapezoidalRule().solve(
+                return method.solve(
                     equation,
                     input.a_value(),
                     input.b_value(),
@@ -738,7 +1035,7 @@ def server(input, output, session):
                 )
 
             elif method_id == "simpson_13":
-                return SimpsonIntegration().simpson_13(
+                return method.simpson_13(
                     equation,
                     input.a_value(),
                     input.b_value(),
@@ -746,7 +1043,7 @@ def server(input, output, session):
                 )
 
             elif method_id == "simpson_38":
-                return SimpsonIntegration().simpson_38(
+                return method.simpson_38(
                     equation,
                     input.a_value(),
                     input.b_value(),
@@ -754,7 +1051,7 @@ def server(input, output, session):
                 )
 
             elif method_id == "gaussian_quadrature":
-                return GaussianQuadrature().solve(
+                return method.solve(
                     equation,
                     input.a_value(),
                     input.b_value(),
@@ -762,7 +1059,7 @@ def server(input, output, session):
                 )
 
             elif method_id == "euler":
-                return EulerMethod().solve(
+                return method.solve(
                     equation,
                     input.y0_value(),
                     input.t0_value(),
@@ -771,7 +1068,7 @@ def server(input, output, session):
                 )
 
             elif method_id == "euler_modified":
-                return ModifiedEulerMethod().solve(
+                return method.solve(
                     equation,
                     input.y0_value(),
                     input.t0_value(),
@@ -780,7 +1077,7 @@ def server(input, output, session):
                 )
 
             elif method_id == "runge_kutta":
-                return RungeKuttaMethod().solve(
+                return method.solve(
                     equation,
                     input.y0_value(),
                     input.t0_value(),
@@ -790,7 +1087,7 @@ def server(input, output, session):
                 )
 
             elif method_id == "taylor":
-                taylor_result = TaylorPolynomial().expand(
+                taylor_result = method.expand(
                     equation,
                     input.variable(),
                     input.expansion_point(),
@@ -798,7 +1095,7 @@ def server(input, output, session):
                 )
 
                 if input.approximation_point() is not None:
-                    approx_result = TaylorPolynomial().approximate(
+                    approx_result = method.approximate(
                         equation,
                         input.variable(),
                         input.expansion_point(),
@@ -809,37 +1106,47 @@ def server(input, output, session):
 
                 return taylor_result
 
-            elif method_id in ["jacobi", "gauss_seidel"]:
-                matrix = parse_matrix_input(input.matrix_input())
+            elif method_id in ITERATIVE_LINEAR_METHODS:
                 vector = parse_vector_input(input.vector_input())
+                if input.matrix_format() == "triplets":
+                    matrix = parse_triplet_input(input.matrix_input(), len(vector))
+                else:
+                    matrix = parse_matrix_input(input.matrix_input())
                 initial_guess = (
                     parse_vector_input(input.initial_guess_input())
                     if input.initial_guess_input() else None
                 )
 
-                if method_id == "jacobi":
-                    return JacobiMethod().solve(
-                        matrix, vector, initial_guess,
-                        input.tolerance(), input.max_iterations()
-                    )
-                else:
-                    return GaussSeidelMethod().solve(
+                if method_id in RELAXATION_METHODS:
+                    return method.solve(
                         matrix, vector, initial_guess,
-                        input.tolerance(), input.max_iterations()
+                        input.tolerance(), input.max_iterations(),
+                        omega=input.omega(), compare=True
                     )
 
+                return method.solve(
+                    matrix, vector, initial_guess,
+                    input.tolerance(), input.max_iterations()
+                )
+
+            elif method_id in SYSTEM_METHODS:
+                initial_guess = (
+                    parse_vector_input(input.initial_guess_input())
+                    if input.initial_guess_input() else None
+                )
+
+                return method.solve(
+                    input.system_input(), input.system_variables(), initial_guess,
+                    input.tolerance(), input.max_iterations()
+                )
+
             elif method_id in ["gaussian_elimination", "gauss_jordan"]:
                 matrix = parse_matrix_input(input.matrix_input())
                 vector = parse_vector_input(input.vector_input())
 
-                if method_id == "gaussian_elimination":
-                    return GaussianElimination().solve(
-                        matrix, vector, input.pivot_type()
-                    )
-                else:
-                    return GaussJordanElimination().solve(
-                        matrix, vector, input.pivot_type()
-                    )
+                return method.solve(
+                    matrix, vector, input.pivot_type()
+                )
 
             else:
                 return {
@@ -855,6 +1162,8 @@ def server(input, output, session):
 
 # Funciones auxiliares
 def create_empty_plot(message):
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     fig.add_annotation(
         text=message,
@@ -881,6 +1190,25 @@ def parse_matrix_input(matrix_str):
         matrix.append(elements)
     return matrix
 
+def parse_triplet_input(matrix_str, size):
+    """Matriz dispersa n x n a partir de líneas 'i j valor' (índices desde 1)"""
+    from modules.linear_systems.sparse import CSRMatrix
+
+    if not matrix_str or matrix_str.strip() == "":
+        raise ValueError("La matriz no puede estar vacía")
+
+    rows, cols, values = [], [], []
+    for line_number, line in enumerate(matrix_str.strip().split('\n'), start=1):
+        elements = line.strip().split()
+        if not elements:
+            continue
+        if len(elements) != 3:
+            raise ValueError(f"Línea {line_number}: se esperaba 'i j valor'")
+        rows.append(int(elements[0]) - 1)
+        cols.append(int(elements[1]) - 1)
+        values.append(float(elements[2]))
+    return CSRMatrix.from_triplets(rows, cols, values, (size, size))
+
 def parse_vector_input(vector_str):
     if not vector_str or vector_str.strip() == "":
         raise ValueError("El vector no puede estar vacía")
@@ -897,13 +1225,23 @@ def get_method_description(method_id, detailed=False):
     descriptions = {
         "bisection": "Método robusto que divide repetidamente el intervalo donde la función cambia de signo.",
         "false_position": "Variante mejorada de bisección que utiliza interpolación lineal para acelerar la convergencia.",
+        "brent": "Combina interpolación cuadrática inversa, secante y bisección. Conserva la garantía de convergencia de bisección con convergencia superlineal.",
         "newton_raphson": "Método rápido que usa derivadas para aproximar la raíz. Requiere un buen valor inicial.",
+        "newton_basins": "Ejecuta Newton-Raphson desde toda una malla de valores iniciales (reales o complejos) y colorea cada punto según la raíz a la que converge. Sirve para elegir valores iniciales robustos.",
         "secant": "Método que aproxima la derivada usando diferencias finitas. No necesita f'(x).",
+        "muller": "Ajusta una parábola por tres puntos y toma su raíz más cercana. Trabaja con números complejos, así que encuentra raíces complejas aun partiendo de valores reales.",
         "multiple_roots": "Versión modificada de Newton para funciones con raíces de multiplicidad mayor que 1.",
+        "polynomial_roots": "Si la ecuación es un polinomio, obtiene todas sus raíces reales y complejas a la vez como autovalores de la matriz compañera, las pule con Newton (evaluación de Horner) e informa su multiplicidad.",
+        "all_roots": "Barre el intervalo [a, b] buscando cambios de signo y mínimos de |f| cercanos a cero, y refina todas las raíces a la vez. No requiere elegir un intervalo con cambio de signo.",
         "jacobi": "Método iterativo que actualiza todas las componentes simultáneamente. Converge con matrices diagonalmente dominantes.",
         "gauss_seidel": "Similar a Jacobi pero usa valores actualizados en cada iteración, por lo general converge más rápido.",
+        "sor": "Gauss-Seidel con sobrerrelajación: mezcla cada valor nuevo con el anterior mediante un factor ω. Si no se indica ω se estima el óptimo a partir del radio espectral de Jacobi; en mallas grandes reduce las iteraciones en un orden de magnitud.",
+        "ssor": "SOR simétrico: cada iteración hace un barrido hacia adelante y otro hacia atrás. Converge de forma parecida a SOR y su matriz de iteración es simétrica cuando A lo es.",
+        "conjugate_gradient": "Método de Krylov para matrices simétricas definidas positivas. Sólo necesita productos matriz-vector (sirve para matrices densas y dispersas) y converge en unas sqrt(κ) iteraciones, mucho menos que Jacobi o Gauss-Seidel en sistemas mal condicionados.",
         "gaussian_elimination": "Método directo que transforma la matriz en una forma triangular para resolver el sistema.",
         "gauss_jordan": "Extiende la eliminación gaussiana hasta obtener la matriz identidad, útil para invertir matrices.",
+        "newton_system": "Generaliza Newton-Raphson a varias incógnitas: en cada iteración evalúa el jacobiano del sistema y resuelve J·Δx = -F(x) con una factorización LU.",
+        "broyden": "Variante cuasi-Newton que sólo evalúa el jacobiano al inicio y después lo corrige con actualizaciones de rango uno. Conviene cuando el jacobiano es caro (muchas incógnitas).",
         "trapezoidal": "Método simple que aproxima el área bajo la curva usando trapecios.",
         "simpson_13": "Método preciso que usa parábolas para aproximar la integral. Requiere número par de subintervalos.",
         "simpson_38": "Variante de Simpson que usa polinomios cúbicos. Útil cuando el número de subintervalos es múltiplo de 3.",
@@ -917,13 +1255,23 @@ def get_method_description(method_id, detailed=False):
     simple_descs = {
         "bisection": "Encuentra raíces dividiendo intervalos sucesivamente.",
         "false_position": "Encuentra raíces usando interpolación lineal.",
+        "brent": "Intervalo garantizado con convergencia rápida.",
         "newton_raphson": "Método rápido basado en derivadas.",
+        "newton_basins": "Mapa de cuencas de atracción de Newton.",
         "secant": "Encuentra raíces sin derivadas usando dos puntos.",
+        "muller": "Raíces reales o complejas con tres puntos.",
         "multiple_roots": "Versión de Newton para raíces múltiples.",
+        "all_roots": "Encuentra todas las raíces de un intervalo.",
+        "polynomial_roots": "Todas las raíces de un polinomio (matriz compañera).",
         "jacobi": "Resuelve sistemas lineales iterativamente.",
         "gauss_seidel": "Iterativo, usa valores actualizados en cada paso.",
+        "sor": "Gauss-Seidel acelerado con un factor de relajación ω.",
+        "ssor": "SOR con barridos hacia adelante y hacia atrás.",
+        "conjugate_gradient": "Para matrices simétricas definidas positivas.",
         "gaussian_elimination": "Resuelve sistemas lineales directamente.",
         "gauss_jordan": "Extiende Gauss para obtener la solución directa.",
+        "newton_system": "Newton con jacobiano para sistemas no lineales.",
+        "broyden": "Cuasi-Newton sin reevaluar el jacobiano.",
         "trapezoidal": "Aproxima integrales con trapecios.",
         "simpson_13": "Integra usando parábolas (Simpson 1/3).",
         "simpson_38": "Integra usando polinomios cúbicos.",
@@ -958,24 +1306,71 @@ def get_method_formula(method_id):
        c = b - f(b) * (a - b) / (f(a) - f(b))
     3. Si f(c) es suficientemente pequeño, detener.
     4. Igual que en bisección, ajustar a o b según el signo.
+    """,
+
+        "brent": """
+    Método de Brent:
+    1. Elegir un intervalo [a, b] donde f(a) y f(b) tengan signos opuestos.
+    2. Proponer un paso por interpolación cuadrática inversa (o secante si sólo hay dos puntos).
+    3. Aceptarlo sólo si cae dentro del intervalo y lo reduce lo suficiente;
+       en caso contrario, dar un paso de bisección.
+    4. Mantener siempre el cambio de signo y repetir hasta que el intervalo sea menor que la tolerancia.
     """,
 
         "newton_raphson": """
     Método de Newton-Raphson:
     x_nuevo = x - f(x) / f'(x)
     Repetir hasta que la diferencia entre valores consecutivos sea pequeña.
+
+    Aceleración (opcional), con g(x) el paso del método:
+    Aitken Δ²:  x* = x2 - (x2 - x1)^2 / (x2 - 2 x1 + x0)  sobre tres iterados
+    Steffensen: x_nuevo = Aitken Δ² de (x, g(x), g(g(x)))
+    """,
+
+        "newton_basins": """
+    Cuencas de atracción de Newton:
+    1. Tomar una malla de valores iniciales x₀ (reales o complejos).
+    2. Aplicar x_nuevo = x - f(x) / f'(x) a todos a la vez.
+    3. Retirar los que convergen y agrupar las raíces obtenidas.
+    4. Colorear cada x₀ según la raíz a la que llegó.
     """,
 
         "secant": """
     Método de la Secante:
     x_nuevo = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
     No requiere derivadas. Usa dos valores iniciales.
+    """,
+
+        "muller": """
+    Método de Muller:
+    Con tres puntos x0, x1, x2 se ajusta la parábola p(x) = a(x-x2)^2 + b(x-x2) + c.
+    x_nuevo = x2 - 2c / (b ± sqrt(b^2 - 4ac))   (signo que maximiza |denominador|)
+    La raíz cuadrada es compleja, por eso puede alcanzar raíces complejas.
     """,
 
         "multiple_roots": """
     Método para Raíces Múltiples:
     x_nuevo = x - [ f(x) * f'(x) ] / [ (f'(x))^2 - f(x) * f''(x) ]
     Mejora Newton cuando la raíz tiene multiplicidad mayor que 1.
+    Admite la misma aceleración Aitken Δ² / Steffensen que Newton-Raphson.
+    """,
+
+        "polynomial_roots": """
+    Raíces de Polinomios (matriz compañera):
+    p(x) = a_n x^n + ... + a_1 x + a_0
+    1. Construir la matriz compañera C del polinomio mónico; sus autovalores son las raíces.
+    2. Agrupar autovalores casi iguales como una raíz múltiple (multiplicidad m).
+    3. Pulir cada raíz con Newton modificado: x_nuevo = x - m * p(x) / p'(x),
+       evaluando p y p' con el esquema de Horner.
+    """,
+
+        "all_roots": """
+    Búsqueda de Todas las Raíces:
+    1. Evaluar f en una malla de [a, b] con una sola llamada vectorizada.
+    2. Refinar la malla donde |f| tiene mínimos locales o hay indicios de polos.
+    3. Cada cambio de signo se refina con bisección (todos a la vez).
+    4. Cada mínimo de |f| cercano a cero se refina con sección áurea (raíces dobles).
+    5. Se descartan los polos y las raíces repetidas.
     """,
 
         "jacobi": """
@@ -987,6 +1382,29 @@ def get_method_formula(method_id):
         "gauss_seidel": """
     Método de Gauss-Seidel:
     Similar a Jacobi pero usa valores nuevos tan pronto como se calculan.
+    """,
+
+        "sor": """
+    Método SOR (sobrerrelajación sucesiva):
+    x_i(nuevo) = (1 - ω) * x_i(anterior) + ω * x_i(Gauss-Seidel)
+    En forma matricial: (D/ω + L) x_(k+1) = b - ((1 - 1/ω) D + U) x_k
+    Factor óptimo: ω = 2 / (1 + sqrt(1 - ρ²)), con ρ el radio espectral de la
+    matriz de Jacobi (estimado por iteración de potencia).
+    """,
+
+        "ssor": """
+    Método SSOR (SOR simétrico):
+    1. Barrido hacia adelante: (D/ω + L) x_(k+1/2) = b - ((1 - 1/ω) D + U) x_k
+    2. Barrido hacia atrás:    (D/ω + U) x_(k+1) = b - ((1 - 1/ω) D + L) x_(k+1/2)
+    """,
+
+        "conjugate_gradient": """
+    Método del Gradiente Conjugado (A simétrica definida positiva):
+    r_0 = b - A x_0,  p_0 = r_0
+    α_k = (r_k · r_k) / (p_k · A p_k)
+    x_(k+1) = x_k + α_k p_k,  r_(k+1) = r_k - α_k A p_k
+    β_k = (r_(k+1) · r_(k+1)) / (r_k · r_k),  p_(k+1) = r_(k+1) + β_k p_k
+    Se detiene cuando ||r_k|| / ||b|| < tolerancia.
     """,
 
         "gaussian_elimination": """
@@ -998,6 +1416,20 @@ def get_method_formula(method_id):
     Método Gauss-Jordan:
     Transforma la matriz en la identidad, dejando la solución directamente.
     Permite obtener también la matriz inversa.
+    """,
+
+        "newton_system": """
+    Newton para sistemas no lineales:
+    1. Evaluar F(x_k) y el jacobiano J(x_k).
+    2. Resolver J(x_k) * Δx = -F(x_k) (factorización LU).
+    3. x_(k+1) = x_k + Δx, hasta que ||Δx|| o ||F(x)|| < tolerancia.
+    """,
+
+        "broyden": """
+    Método de Broyden:
+    H_0 = J(x_0)^(-1),  s_k = -H_k * F(x_k),  x_(k+1) = x_k + s_k
+    y_k = F(x_(k+1)) - F(x_k)
+    H_(k+1) = H_k + (s_k - H_k y_k) s_k^T H_k / (s_k^T H_k y_k)
     """,
 
         "trapezoidal": """
@@ -1093,6 +1525,23 @@ def get_method_examples(method_id):
             }
         ],
 
+        "brent": [
+            {
+                "description":
+                    "Ejemplo 1: Raíz de exp(x) - 10 en el intervalo [0, 5]\n"
+                    "- Ecuación: exp(x) - 10\n"
+                    "- Intervalo: a = 0, b = 5\n"
+                    "- Tolerancia: 1e-12 (≈10 evaluaciones, falsa posición necesita cientos)"
+            },
+            {
+                "description":
+                    "Ejemplo 2: Raíz de cos(x) - x en el intervalo [0, 1]\n"
+                    "- Ecuación: cos(x) - x\n"
+                    "- Intervalo: a = 0, b = 1\n"
+                    "- Tolerancia: 1e-10"
+            }
+        ],
+
         "newton_raphson": [
             {
                 "description":
@@ -1110,6 +1559,23 @@ def get_method_examples(method_id):
             }
         ],
 
+        "newton_basins": [
+            {
+                "description":
+                    "Ejemplo 1: Cuencas de x^3 - 1 en el plano complejo\n"
+                    "- Ecuación: x^3 - 1\n"
+                    "- Re(x₀) en [-2, 2], Im(x₀) en [-2, 2]\n"
+                    "- Resultado: tres cuencas con frontera fractal"
+            },
+            {
+                "description":
+                    "Ejemplo 2: Valores iniciales reales para cos(x) - x/5\n"
+                    "- Ecuación: cos(x) - x/5\n"
+                    "- Re(x₀) en [-10, 10], Im(x₀) = 0\n"
+                    "- Muestra qué x₀ llevan a cada una de las raíces reales"
+            }
+        ],
+
         "secant": [
             {
                 "description":
@@ -1127,6 +1593,22 @@ def get_method_examples(method_id):
             }
         ],
 
+        "muller": [
+            {
+                "description":
+                    "Ejemplo 1: Raíces complejas de x^2 + 1\n"
+                    "- Ecuación: x^2 + 1\n"
+                    "- Valores iniciales: x₀ = 0, x₁ = 0.5, x₂ = 1\n"
+                    "- Resultado: x = i (partiendo de valores reales)"
+            },
+            {
+                "description":
+                    "Ejemplo 2: Raíz compleja de sin(x) - 2\n"
+                    "- Ecuación: sin(x) - 2\n"
+                    "- Valores iniciales: x₀ = 0, x₁ = 0.5, x₂ = 1\n"
+                    "- Resultado: x ≈ 1.5708 - 1.3170i"
+            }
+        ],
         "multiple_roots": [
             {
                 "description":
@@ -1143,6 +1625,36 @@ def get_method_examples(method_id):
                     "- Tolerancia: 1e-5"
             }
         ],
+        "polynomial_roots": [
+            {
+                "description":
+                    "Ejemplo 1: Raíces de x^3 - 2x - 5\n"
+                    "- Ecuación: x^3 - 2*x - 5\n"
+                    "- Resultado: una raíz real (≈2.0946) y un par complejo conjugado"
+            },
+            {
+                "description":
+                    "Ejemplo 2: Raíces múltiples de (x - 1)^4 * (x - 3)^2\n"
+                    "- Ecuación: (x - 1)^4 * (x - 3)^2\n"
+                    "- Resultado: x = 1 (multiplicidad 4), x = 3 (multiplicidad 2)"
+            }
+        ],
+        "all_roots": [
+            {
+                "description":
+                    "Ejemplo 1: Todas las raíces de sin(x) en [-10, 10]\n"
+                    "- Ecuación: sin(x)\n"
+                    "- Intervalo: a = -10, b = 10\n"
+                    "- Resultado: 7 raíces (múltiplos de π)"
+            },
+            {
+                "description":
+                    "Ejemplo 2: Raíz doble y polo en (x - 1)^2 / (x + 2)\n"
+                    "- Ecuación: (x - 1)^2 / (x + 2)\n"
+                    "- Intervalo: a = -5, b = 5\n"
+                    "- Resultado: raíz tangente en x = 1, polo descartado en x = -2"
+            }
+        ],
         "jacobi": [
             {
                 "description":
@@ -1169,6 +1681,47 @@ def get_method_examples(method_id):
             }
         ],
 
+        "sor": [
+            {
+                "description":
+                    "Ejemplo 1: Sistema tridiagonal (laplaciano 1D) con ω automático\n"
+                    "Matriz A:\n"
+                    "2 -1 0 0\n"
+                    "-1 2 -1 0\n"
+                    "0 -1 2 -1\n"
+                    "0 0 -1 2\n"
+                    "Vector b: 1 0 0 1\n"
+                    "Tolerancia: 1e-8\n"
+                    "- Resultado: x = [1, 1, 1, 1] con menos barridos que Gauss-Seidel"
+            }
+        ],
+
+        "ssor": [
+            {
+                "description":
+                    "Ejemplo 1: El mismo sistema en formato disperso (tripletes)\n"
+                    "Matriz A:\n"
+                    "1 1 2\n1 2 -1\n2 1 -1\n2 2 2\n2 3 -1\n"
+                    "3 2 -1\n3 3 2\n3 4 -1\n4 3 -1\n4 4 2\n"
+                    "Vector b: 1 0 0 1\n"
+                    "Factor de relajación ω: 1.2"
+            }
+        ],
+
+        "conjugate_gradient": [
+            {
+                "description":
+                    "Ejemplo 1: Sistema simétrico definido positivo\n"
+                    "Matriz A:\n"
+                    "4 1 0\n"
+                    "1 3 -1\n"
+                    "0 -1 2\n"
+                    "Vector b: 5 3 1\n"
+                    "Tolerancia: 1e-10\n"
+                    "- Resultado: x = [1, 1, 1] en a lo sumo 3 iteraciones"
+            }
+        ],
+
         "gaussian_elimination": [
             {
                 "description":
@@ -1193,6 +1746,32 @@ def get_method_examples(method_id):
             }
         ],
 
+        "newton_system": [
+            {
+                "description":
+                    "Ejemplo 1: Intersección de la circunferencia x^2 + y^2 = 4 con la hipérbola x*y = 1\n"
+                    "Sistema:\n"
+                    "x^2 + y^2 - 4\n"
+                    "x*y - 1\n"
+                    "Incógnitas: x y\n"
+                    "Vector inicial: 2 0.5\n"
+                    "Resultado: x ≈ 1.93185, y ≈ 0.51764"
+            }
+        ],
+
+        "broyden": [
+            {
+                "description":
+                    "Ejemplo 1: El mismo sistema que Newton, con una sola evaluación del jacobiano\n"
+                    "Sistema:\n"
+                    "x^2 + y^2 - 4\n"
+                    "x*y - 1\n"
+                    "Incógnitas: x y\n"
+                    "Vector inicial: 2 0.5\n"
+                    "Resultado: x ≈ 1.93185, y ≈ 0.51764"
+            }
+        ],
+
         "trapezoidal": [
             {
                 "description":
@@ -0,0 +1,50 @@
+# benchmarks/bench_bracketing.py
+"""Evaluaciones de f necesarias por los métodos de intervalo: bisección, falsa posición y Brent.
+
+Uso:
+    python -m benchmarks.bench_bracketing [--tolerance 1e-12]
+"""
+import argparse
+
+from modules.root_finding.bisection import BisectionMethod
+from modules.root_finding.brent import BrentMethod
+from modules.root_finding.false_position import FalsePositionMethod
+
+CASES = [
+    ("exp(x) - 10", 0, 5),
+    ("x^2 - 2", 0, 2),
+    ("cos(x) - x", 0, 1),
+    ("x^3 - 2x - 5", 2, 3),
+    ("x^10 - 1", 0, 1.3),
+    ("log(x) + x", 0.1, 1),
+]
+
+METHODS = [
+    ("Bisección", BisectionMethod),
+    ("Falsa posición", FalsePositionMethod),
+    ("Brent", BrentMethod),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tolerance", type=float, default=1e-12)
+    parser.add_argument("--max-iterations", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    print(f"{'Ecuación':<16}" + "".join(f"{name:>18}" for name, _ in METHODS))
+    print("-" * (16 + 18 * len(METHODS)))
+    for equation, a, b in CASES:
+        row = f"{equation:<16}"
+        for _, method_class in METHODS:
+            result = method_class().solve(equation, a, b, args.tolerance, args.max_iterations)
+            if not result['success']:
+                row += f"{'error':>18}"
+                continue
+            mark = "" if result['converged'] else " (no conv.)"
+            row += f"{str(result['function_calls']) + mark:>18}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
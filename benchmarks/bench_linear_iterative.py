@@ -0,0 +1,102 @@
+# benchmarks/bench_linear_iterative.py
+"""Tiempo por barrido de los métodos iterativos para sistemas lineales.
+
+Matrices densas de tamaño n y, en formato CSR, el laplaciano 2D de 5 puntos en
+una malla grid x grid (10^5 incógnitas con --grid 316). Al final compara las
+iteraciones hasta converger de Gauss-Seidel, SOR, SSOR (ω estimado) y gradiente
+conjugado en el laplaciano de una malla --convergence-grid.
+
+Uso:
+    python -m benchmarks.bench_linear_iterative [--sizes 200 1000 2000] [--grid 316] [--sweeps 50]
+                                               [--convergence-grid 30]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from modules.linear_systems.conjugate_gradient import ConjugateGradientMethod
+from modules.linear_systems.gauss_seidel import GaussSeidelMethod
+from modules.linear_systems.jacobi import JacobiMethod
+from modules.linear_systems.sor import SORMethod, SSORMethod
+from modules.linear_systems.sparse import CSRMatrix
+
+METHODS = [
+    ("Jacobi", JacobiMethod),
+    ("Gauss-Seidel", GaussSeidelMethod),
+    ("SOR", SORMethod),
+]
+
+CONVERGENCE_METHODS = [
+    ("Gauss-Seidel", GaussSeidelMethod),
+    ("SOR", SORMethod),
+    ("SSOR", SSORMethod),
+    ("Grad. conj.", ConjugateGradientMethod),
+]
+
+
+def dominant_system(n, seed=0):
+    """Matriz densa estrictamente diagonal dominante y lado derecho aleatorios"""
+    rng = np.random.default_rng(seed)
+    A = rng.random((n, n))
+    A += np.diag(A.sum(axis=1) + 1.0)
+    return A, rng.random(n)
+
+
+def laplacian_2d(m, diagonal=4.0):
+    """Laplaciano de 5 puntos en una malla m x m (CSR); diagonal > 4 lo hace dominante"""
+    n = m * m
+    k = np.arange(n)
+    i, j = np.divmod(k, m)
+    rows, cols, values = [k], [k], [np.full(n, diagonal)]
+    for mask, offset in ((j > 0, -1), (j < m - 1, 1), (i > 0, -m), (i < m - 1, m)):
+        rows.append(k[mask])
+        cols.append(k[mask] + offset)
+        values.append(-np.ones(mask.sum()))
+    return CSRMatrix.from_triplets(
+        np.concatenate(rows), np.concatenate(cols), np.concatenate(values), (n, n)
+    )
+
+
+def time_sweeps(method_class, A, b, sweeps, **options):
+    start = time.perf_counter()
+    # Tolerancia mínima: se ejecutan exactamente sweeps barridos
+    result = method_class().solve(A, b, None, 1e-15, sweeps, keep_history=False, **options)
+    return (time.perf_counter() - start) * 1000 / result['iterations_count']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 2000])
+    parser.add_argument("--grid", type=int, default=316)
+    parser.add_argument("--sweeps", type=int, default=50)
+    parser.add_argument("--convergence-grid", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    print(f"{'Método':<14}{'n':>8}{'ms/barrido':>14}")
+    for n in args.sizes:
+        A, b = dominant_system(n)
+        for name, method_class in METHODS:
+            print(f"{name:<14}{n:>8}{time_sweeps(method_class, A, b, args.sweeps):>14.3f}")
+
+    A = laplacian_2d(args.grid, diagonal=4.5)
+    b = np.ones(A.shape[0])
+    print(f"\nLaplaciano 2D en CSR: n = {A.shape[0]}, nnz = {A.nnz}")
+    for name, method_class in METHODS:
+        print(f"{name:<14}{A.shape[0]:>8}{time_sweeps(method_class, A, b, args.sweeps):>14.3f}")
+
+    # Laplaciano sin desplazar: Jacobi y Gauss-Seidel convergen muy despacio
+    A = laplacian_2d(args.convergence_grid)
+    b = np.ones(A.shape[0])
+    print(f"\nIteraciones hasta 1e-8 (laplaciano {args.convergence_grid} x {args.convergence_grid})")
+    print(f"{'Método':<14}{'iteraciones':>12}{'ω':>10}{'s':>10}")
+    for name, method_class in CONVERGENCE_METHODS:
+        start = time.perf_counter()
+        result = method_class().solve(A, b, None, 1e-8, 20000, keep_history=False)
+        elapsed = time.perf_counter() - start
+        omega = f"{result['omega']:.4f}" if 'omega' in result else "-"
+        print(f"{name:<14}{result['iterations_count']:>12}{omega:>10}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_newton_multiplicity.py
+"""Iteraciones de Newton-Raphson con y sin detección automática de multiplicidad.
+
+Raíces simples con inicio lejano (Newton avanza linealmente al principio y no
+debe confundirse con una raíz múltiple) y raíces múltiples, donde el cambio a
+Newton modificado debe ahorrar iteraciones. Termina con código 1 si la detección
+empeora alguna raíz simple, para poder usarlo como verificación en CI.
+
+Uso:
+    python -m benchmarks.bench_newton_multiplicity [--tolerance 1e-8] [--iterations 100]
+"""
+import argparse
+import sys
+
+from modules.root_finding.newton_raphson import NewtonRaphsonMethod
+
+SIMPLE_ROOTS = [
+    ("x^2 - 2", 1000),
+    ("x^3 - 1", 100),
+    ("x^10 - 1", 0.5),
+    ("x^10 - 1", 5),
+    ("exp(x) - 1", 30),
+    ("x*exp(x) - 1", 10),
+    ("cos(x) - x", 1),
+]
+
+MULTIPLE_ROOTS = [
+    ("(x - 1)^2*exp(x)", 0.3),
+    ("(x - 1)^3", 2),
+    ("(x - 2)^4*(x + 1)", 3),
+    ("(x^2 - 2)^2", 1000),
+]
+
+
+def run(equation, x0, tolerance, iterations, auto):
+    result = NewtonRaphsonMethod().solve(equation, x0, tolerance, iterations, auto_multiplicity=auto)
+    if not result['success']:
+        return None, result['error']
+    return len(result['iterations']), result.get('estimated_multiplicity', 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tolerance", type=float, default=1e-8)
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'Ecuación':<22}{'x0':>8}{'Newton':>10}{'auto':>8}{'m':>4}")
+    for group, cases in (("simple", SIMPLE_ROOTS), ("múltiple", MULTIPLE_ROOTS)):
+        for equation, x0 in cases:
+            plain, _ = run(equation, x0, args.tolerance, args.iterations, False)
+            auto, multiplicity = run(equation, x0, args.tolerance, args.iterations, True)
+            print(f"{equation:<22}{x0:>8}{str(plain):>10}{str(auto):>8}{str(multiplicity):>4}")
+            # En una raíz simple la detección no puede costar iteraciones ni hacer fallar a Newton
+            if group == "simple" and (auto is None or plain is None or auto > plain or multiplicity != 1):
+                failures.append(f"{equation} desde {x0}")
+
+    if failures:
+        print("\n✖ La detección de multiplicidad empeoró raíces simples: " + ", ".join(failures))
+        return 1
+    print("\n✓ Ninguna raíz simple empeora")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+# benchmarks/bench_nonlinear_systems.py
+"""Newton frente a Broyden en un sistema no lineal tridiagonal de n incógnitas.
+
+Uso:
+    python -m benchmarks.bench_nonlinear_systems [--size 50] [--repeat 5]
+"""
+import argparse
+import time
+
+from modules.nonlinear_systems.broyden import BroydenMethod
+from modules.nonlinear_systems.newton_system import NewtonSystemMethod
+
+METHODS = [
+    ("Newton", NewtonSystemMethod),
+    ("Broyden", BroydenMethod),
+]
+
+
+def broyden_tridiagonal(n):
+    """Problema tridiagonal de Broyden: (3 - 2 x_i) x_i - x_(i-1) - 2 x_(i+1) + 1 = 0"""
+    variables = [f"x{i}" for i in range(n)]
+    equations = []
+    for i, var in enumerate(variables):
+        left = variables[i - 1] if i > 0 else "0"
+        right = variables[i + 1] if i < n - 1 else "0"
+        equations.append(f"(3 - 2*{var})*{var} - {left} - 2*{right} + 1")
+    return equations, variables
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=1e-10)
+    args = parser.parse_args(argv)
+
+    equations, variables = broyden_tridiagonal(args.size)
+    initial_guess = [-1.0] * args.size
+
+    print(f"{'Método':<10}{'iteraciones':>12}{'F(x)':>8}{'J(x)':>8}{'residuo':>12}{'ms':>10}")
+    for name, method_class in METHODS:
+        method = method_class()
+        # La primera llamada parsea y compila el sistema (queda en la caché)
+        method.solve(equations, variables, initial_guess, args.tolerance, 100)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            result = method.solve(equations, variables, initial_guess, args.tolerance, 100)
+        elapsed = (time.perf_counter() - start) / args.repeat * 1000
+
+        if not result['success']:
+            print(f"{name:<10}error: {result['error']}")
+            continue
+        print(f"{name:<10}{result['iterations_count']:>12}{result['function_calls']:>8}"
+              f"{result['jacobian_evaluations']:>8}{result['final_residual']:>12.2e}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
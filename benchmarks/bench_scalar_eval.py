@@ -0,0 +1,41 @@
+# benchmarks/bench_scalar_eval.py
+"""Latencia por llamada: función numpy vs. función escalar (math) de EquationParser.
+
+Uso:
+    python -m benchmarks.bench_scalar_eval
+"""
+import timeit
+
+from modules.equation_parser import EquationParser
+
+EQUATIONS = [
+    "x^2 - 4",
+    "exp(-x) - x",
+    "x^3 - 2x - 5",
+    "sin(x)*exp(x) - cos(x)",
+    "sqrt(x^2 + 1) - log(x + 2)",
+    "atan(x)*cosh(x) + tanh(x)",
+]
+
+
+def time_per_call(func, value, number):
+    """Tiempo medio por llamada en nanosegundos (mejor de 7 repeticiones)"""
+    timer = timeit.Timer("func(value)", globals={"func": func, "value": value})
+    return min(timer.repeat(repeat=7, number=number)) / number * 1e9
+
+
+def main(number=20000):
+    parser = EquationParser()
+    x = 0.7
+
+    print(f"{'Ecuación':<30} {'numpy (ns)':>12} {'math (ns)':>12} {'speedup':>9}")
+    print("-" * 66)
+    for equation in EQUATIONS:
+        result = parser.parse_equation(equation, ["x"])
+        numpy_ns = time_per_call(result["numpy_function"], x, number)
+        scalar_ns = time_per_call(result["scalar_function"], x, number)
+        print(f"{equation:<30} {numpy_ns:>12.0f} {scalar_ns:>12.0f} {numpy_ns / scalar_ns:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
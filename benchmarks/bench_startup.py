@@ -0,0 +1,73 @@
+# benchmarks/bench_startup.py
+"""Mide el tiempo de importación en frío de app.py con `python -X importtime`.
+
+Termina con código 1 si el tiempo acumulado supera el presupuesto, para poder
+usarlo como verificación en CI.
+
+Uso:
+    python -m benchmarks.bench_startup [--budget-ms 1500] [--module app] [--top 15]
+
+El presupuesto también puede fijarse con la variable STARTUP_BUDGET_MS.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET_MS = 1500
+
+
+def measure_import(module):
+    """Importa el módulo en un intérprete nuevo y devuelve [(self_us, cumulative_us, nombre)]"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"No se pudo importar '{module}':\n{completed.stderr}")
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--budget-ms", type=float,
+        default=float(os.environ.get("STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)),
+    )
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    rows = measure_import(args.module)
+    # La última línea corresponde al módulo importado desde -c (nivel superior)
+    total_ms = next(
+        cumulative for _, cumulative, name in reversed(rows) if name.strip() == args.module
+    ) / 1000
+
+    print(f"Importaciones más costosas (tiempo propio) al cargar '{args.module}':")
+    for self_us, cumulative_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  (acumulado {cumulative_us / 1000:8.1f} ms)  {name.strip()}")
+
+    print(f"\nTiempo de importación de '{args.module}': {total_ms:.1f} ms "
+          f"(presupuesto {args.budget_ms:.0f} ms)")
+
+    if total_ms > args.budget_ms:
+        print("✖ Se superó el presupuesto de arranque")
+        return 1
+    print("✓ Dentro del presupuesto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+import numpy as np
+import sympy as sp
+
+
+class Dual:
+    """Número dual a + b·ε (ε² = 0): b arrastra la primera derivada"""
+
+    __slots__ = ("real", "eps")
+    # Los escalares numpy deben delegar en __radd__/__rmul__ en lugar de crear arrays de objetos
+    __array_ufunc__ = None
+
+    def __init__(self, real, eps=0.0):
+        self.real = real
+        self.eps = eps
+
+    def chain(self, f, f1, f2=None):
+        """g(self) dadas g, g' (g'' no hace falta para primer orden)"""
+        a = self.real
+        return Dual(f(a), f1(a) * self.eps)
+
+    def parts(self):
+        return self.real, self.eps
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real + other.real, self.eps + other.eps)
+        return Dual(self.real + other, self.eps)
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real * other.real, self.real * other.eps + self.eps * other.real)
+        return Dual(self.real * other, self.eps * other)
+
+    __rmul__ = __mul__
+
+
+class HyperDual:
+    """Número hiper-dual a + b·ε1 + c·ε2 + d·ε1ε2 (ε1² = ε2² = 0).
+
+    Sembrando b = c = 1, d = 0 en la variable, la componente d de f es f''.
+    """
+
+    __slots__ = ("real", "eps1", "eps2", "eps12")
+    __array_ufunc__ = None
+
+    def __init__(self, real, eps1=0.0, eps2=0.0, eps12=0.0):
+        self.real = real
+        self.eps1 = eps1
+        self.eps2 = eps2
+        self.eps12 = eps12
+
+    def chain(self, f, f1, f2):
+        """g(self) = g(a) + g'(a)(b ε1 + c ε2) + (g'(a) d + g''(a) b c) ε1ε2"""
+        a = self.real
+        d1 = f1(a)
+        return HyperDual(
+            f(a), d1 * self.eps1, d1 * self.eps2,
+            d1 * self.eps12 + f2(a) * self.eps1 * self.eps2,
+        )
+
+    def parts(self):
+        return self.real, self.eps1, self.eps12
+
+    def __add__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.real + other.real, self.eps1 + other.eps1,
+                             self.eps2 + other.eps2, self.eps12 + other.eps12)
+        return HyperDual(self.real + other, self.eps1, self.eps2, self.eps12)
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(
+                self.real * other.real,
+                self.real * other.eps1 + self.eps1 * other.real,
+                self.real * other.eps2 + self.eps2 * other.real,
+                self.real * other.eps12 + self.eps1 * other.eps2
+                + self.eps2 * other.eps1 + self.eps12 * other.real,
+            )
+        return HyperDual(self.real * other, self.eps1 * other,
+                         self.eps2 * other, self.eps12 * other)
+
+    __rmul__ = __mul__
+
+
+# (g, g', g'') de cada función elemental, evaluadas con numpy (escalares, arrays o complejos)
+ELEMENTARY = {
+    sp.sin: (np.sin, np.cos, lambda a: -np.sin(a)),
+    sp.cos: (np.cos, lambda a: -np.sin(a), lambda a: -np.cos(a)),
+    sp.tan: (np.tan, lambda a: 1 / np.cos(a) ** 2, lambda a: 2 * np.tan(a) / np.cos(a) ** 2),
+    sp.exp: (np.exp, np.exp, np.exp),
+    sp.log: (np.log, lambda a: 1 / a, lambda a: -1 / a ** 2),
+    sp.asin: (np.arcsin, lambda a: 1 / np.sqrt(1 - a * a), lambda a: a / (1 - a * a) ** 1.5),
+    sp.acos: (np.arccos, lambda a: -1 / np.sqrt(1 - a * a), lambda a: -a / (1 - a * a) ** 1.5),
+    sp.atan: (np.arctan, lambda a: 1 / (1 + a * a), lambda a: -2 * a / (1 + a * a) ** 2),
+    sp.sinh: (np.sinh, np.cosh, np.sinh),
+    sp.cosh: (np.cosh, np.sinh, np.cosh),
+    sp.tanh: (np.tanh, lambda a: 1 - np.tanh(a) ** 2,
+              lambda a: -2 * np.tanh(a) * (1 - np.tanh(a) ** 2)),
+    sp.asinh: (np.arcsinh, lambda a: 1 / np.sqrt(a * a + 1), lambda a: -a / (a * a + 1) ** 1.5),
+    sp.acosh: (np.arccosh, lambda a: 1 / np.sqrt(a * a - 1), lambda a: -a / (a * a - 1) ** 1.5),
+    sp.atanh: (np.arctanh, lambda a: 1 / (1 - a * a), lambda a: 2 * a / (1 - a * a) ** 2),
+    sp.Abs: (np.abs, np.sign, np.zeros_like),
+}
+
+
+def _power(base, exponent):
+    """base**exponent con número constante como exponente (x^n, sqrt(x) = x^(1/2), 1/x)"""
+    if not isinstance(base, (Dual, HyperDual)):
+        return base ** exponent
+    return base.chain(
+        lambda a: a ** exponent,
+        lambda a: exponent * a ** (exponent - 1),
+        lambda a: exponent * (exponent - 1) * a ** (exponent - 2),
+    )
+
+
+def _apply(function, value):
+    f, f1, f2 = ELEMENTARY[function]
+    if isinstance(value, (Dual, HyperDual)):
+        return value.chain(f, f1, f2)
+    return f(value)
+
+
+def _exp_log_power(base, exponent):
+    """base**exponent con exponente variable: exp(exponente·log(base))"""
+    return _apply(sp.exp, exponent * _apply(sp.log, base))
+
+
+class ForwardDerivative:
+    """Diferenciación automática en modo directo sobre el árbol de una expresión SymPy.
+
+    El árbol se aplana una vez en una cinta (cada subexpresión repetida aparece una
+    sola vez) y cada evaluación la recorre con números duales (orden 1) o
+    hiper-duales (orden 2). Devuelve (f, f') o (f, f', f'') numéricos en una pasada,
+    sin construir ni compilar la derivada simbólica, cuyo tamaño puede crecer
+    exponencialmente con el anidamiento de la expresión.
+
+    Admite +, *, potencias y las funciones de ELEMENTARY; cualquier otro nodo
+    (floor, Piecewise, ...) lanza NotImplementedError al construir la cinta.
+    """
+
+    def __init__(self, expr, variable, parameters=(), order=1):
+        if order not in (1, 2):
+            raise ValueError("La diferenciación automática admite orden 1 o 2")
+        self.expr = expr
+        self.variable = variable
+        self.parameters = list(parameters)
+        self.order = order
+        self._number = Dual if order == 1 else HyperDual
+        self._tape = []
+        self._output = self._record(expr, {})
+
+    def __call__(self, x, *parameter_values):
+        # Escalares numpy: dominio fuera de rango da nan (como numpy), no complejos de Python
+        x = np.asarray(x)[()]
+        seed = (1.0,) if self.order == 1 else (1.0, 1.0, 0.0)
+        inputs = {self.variable: self._number(x, *seed)}
+        inputs.update(zip(self.parameters, (np.asarray(p)[()] for p in parameter_values)))
+
+        values = []
+        for operation, operands in self._tape:
+            values.append(operation(inputs, values, operands))
+
+        result = values[self._output]
+        if isinstance(result, (Dual, HyperDual)):
+            return result.parts()
+        # f no depende de la variable: derivadas nulas
+        return (result,) + (0.0 * result,) * self.order
+
+    def _record(self, node, seen):
+        """Añade node (y sus hijos) a la cinta; devuelve su posición"""
+        if node in seen:
+            return seen[node]
+
+        if node.is_Symbol:
+            if node != self.variable and node not in self.parameters:
+                raise NotImplementedError(f"Símbolo no declarado: {node}")
+            step = (lambda inputs, values, symbol: inputs[symbol], node)
+        elif node.is_number:
+            constant = complex(node) if node.is_real is False else float(node)
+            step = (lambda inputs, values, c: c, constant)
+        else:
+            operands = [self._record(arg, seen) for arg in node.args]
+            step = (self._operation(node, operands), operands)
+
+        self._tape.append(step)
+        seen[node] = len(self._tape) - 1
+        return seen[node]
+
+    def _operation(self, node, operands):
+        if node.is_Add:
+            return lambda inputs, values, ops: sum((values[k] for k in ops[1:]), values[ops[0]])
+        if node.is_Mul:
+            def product(inputs, values, ops):
+                result = values[ops[0]]
+                for k in ops[1:]:
+                    result = values[k] * result
+                return result
+            return product
+        if node.is_Pow:
+            if node.exp.is_number:
+                exponent = float(node.exp) if node.exp.is_real else complex(node.exp)
+                return lambda inputs, values, ops: _power(values[ops[0]], exponent)
+            return lambda inputs, values, ops: _exp_log_power(values[ops[0]], values[ops[1]])
+        if node.func in ELEMENTARY and len(node.args) == 1:
+            function = node.func
+            return lambda inputs, values, ops: _apply(function, values[ops[0]])
+        raise NotImplementedError(f"Operación no soportada por la diferenciación automática: {node.func}")
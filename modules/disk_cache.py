@@ -0,0 +1,191 @@
+# modules/disk_cache.py
+import hashlib
+import json
+import linecache
+import os
+import tempfile
+
+import sympy as sp
+
+# Variables de entorno para activar la caché en los workers sin tocar código
+CACHE_DIR_ENV = "CALCULADORA_CACHE_DIR"
+CACHE_MAX_MB_ENV = "CALCULADORA_CACHE_MAX_MB"
+
+
+class ExpressionDiskCache:
+    """Caché en disco de expresiones parseadas y del código generado por lambdify.
+
+    Cada entrada es un JSON con el srepr de la expresión y el código fuente de las
+    funciones numpy y math, guardado bajo el hash de su contenido. Las escrituras son
+    atómicas (archivo temporal + os.replace), así que varios procesos pueden leer a
+    la vez sin ver archivos a medio escribir. Cuando el directorio supera max_bytes
+    se eliminan las entradas usadas hace más tiempo.
+
+    El directorio debe ser escribible sólo por el propio servicio: su contenido se
+    evalúa como código al cargarlo.
+    """
+
+    FORMAT_VERSION = 1
+    _namespaces = {}
+    _sympy_namespace = None
+
+    def __init__(self, directory, max_bytes=50 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_environment(cls):
+        """Crea la caché si CALCULADORA_CACHE_DIR está definida; si no, devuelve None"""
+        directory = os.environ.get(CACHE_DIR_ENV)
+        if not directory:
+            return None
+        max_mb = float(os.environ.get(CACHE_MAX_MB_ENV, 50))
+        return cls(directory, max_bytes=int(max_mb * 1024 * 1024))
+
+    def key(self, processed_eq, variables):
+        content = json.dumps(
+            [self.FORMAT_VERSION, sp.__version__, processed_eq, list(variables)]
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def load(self, processed_eq, variables):
+        """Devuelve (expresión, función numpy, función math o None) o None si no existe"""
+        path = self._path(self.key(processed_eq, variables))
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entry = json.load(fh)
+            expr = eval(entry["srepr"], dict(self._sympy_names()))
+            numpy_func = self._function_from_source(entry["numpy_source"], ("numpy", "math"))
+            scalar_func = None
+            if entry.get("scalar_source"):
+                scalar_func = self._function_from_source(entry["scalar_source"], ("math",))
+        except FileNotFoundError:
+            # Entrada inexistente o desalojada por otro proceso
+            self.misses += 1
+            return None
+        except Exception:
+            # Entrada corrupta (cualquier error al reconstruirla): se borra para no
+            # volver a leerla en cada parseo y cuenta como fallo
+            self.misses += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        self.hits += 1
+        try:
+            # Marca de uso para el desalojo por antigüedad
+            os.utime(path)
+        except OSError:
+            pass
+        return expr, numpy_func, scalar_func
+
+    def store(self, processed_eq, variables, expr, numpy_func, scalar_func=None):
+        """Guarda una entrada; si el código no es reproducible fuera de lambdify no hace nada"""
+        numpy_source = self._source_of(numpy_func, ("numpy", "math"))
+        if numpy_source is None:
+            return False
+        scalar_source = self._source_of(scalar_func, ("math",)) if scalar_func else None
+
+        entry = {
+            "equation": processed_eq,
+            "variables": list(variables),
+            "srepr": sp.srepr(expr),
+            "numpy_source": numpy_source,
+            "scalar_source": scalar_source,
+        }
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh)
+            os.replace(tmp_path, self._path(self.key(processed_eq, variables)))
+        except OSError:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self):
+        """Elimina las entradas más antiguas hasta quedar por debajo de max_bytes"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, name in sorted(entries):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            # Margen del 10% para no desalojar en cada escritura
+            if total <= self.max_bytes * 0.9:
+                break
+        return removed
+
+    def info(self):
+        return {
+            "directory": self.directory,
+            "hits": self.hits,
+            "misses": self.misses,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    @classmethod
+    def _sympy_names(cls):
+        if cls._sympy_namespace is None:
+            namespace = {}
+            exec("from sympy import *", namespace)
+            # srepr sólo necesita constructores de SymPy, nada de builtins
+            namespace["__builtins__"] = {}
+            cls._sympy_namespace = namespace
+        return cls._sympy_namespace
+
+    @classmethod
+    def _namespace(cls, modules):
+        """Espacio de nombres base que lambdify usa para estos módulos"""
+        if modules not in cls._namespaces:
+            cls._namespaces[modules] = dict(sp.lambdify([], 0, modules=list(modules)).__globals__)
+        return cls._namespaces[modules]
+
+    @classmethod
+    def _source_of(cls, func, modules):
+        code = getattr(func, "__code__", None)
+        if code is None:
+            return None
+        # Sólo es reproducible si todos los nombres globales están en el espacio base
+        namespace = cls._namespace(modules)
+        if any(name not in namespace for name in code.co_names):
+            return None
+        lines = linecache.getlines(code.co_filename)
+        return "".join(lines) or None
+
+    @classmethod
+    def _function_from_source(cls, source, modules):
+        namespace = dict(cls._namespace(modules))
+        local_names = {}
+        exec(compile(source, "<lambdifygenerated-disk>", "exec"), namespace, local_names)
+        return local_names["_lambdifygenerated"]
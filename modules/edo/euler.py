@@ -35,7 +35,7 @@ class EulerMethod:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, ['t', 'y'])
-            f = result['numpy_function']
+            f = result['scalar_function']
 
             t = np.arange(t0_val, tf_val + h_val, h_val)
             n = len(t)
@@ -38,7 +38,7 @@ class ModifiedEulerMethod:
 
             # Parsear ecuación
             result = self.parser.parse_equation(equation_str, ['t', 'y'])
-            f = result['numpy_function']
+            f = result['scalar_function']
 
             # Crear arreglo de tiempo
             t = np.arange(t0_val, tf_val + h_val, h_val)
@@ -152,7 +152,7 @@ class ModifiedEulerMethod:
 
             # Parsear ecuación
             result = self.parser.parse_equation(equation_str, ['t', 'y'])
-            f = result['numpy_function']
+            f = result['scalar_function']
 
             # Inicializar arrays
             t_list = [t0_val]
@@ -0,0 +1,199 @@
+# modules/equation_lexer.py
+# Verificación sintáctica ligera (sin SymPy) para validar mientras se escribe.
+# Acepta un superconjunto de lo que EquationParser puede parsear: si aquí falla,
+# parse_expr también fallaría; si pasa, la validación completa decide.
+
+# Reemplazos de símbolos "bonitos" por sintaxis SymPy (usados también por EquationParser)
+EQUATION_REPLACEMENTS = {
+    "^": "**",      # potencia visual
+    "√": "sqrt",    # raíz
+    "π": "pi",      # pi
+    "÷": "/",       # si algún día pones ÷
+    "×": "*",       # si usas × en vez de *
+    "ln": "log",    # log natural
+}
+
+NUMBER = "number"
+NAME = "name"
+OPERATOR = "op"
+
+_OPERATORS = ("**", "//", "+", "-", "*", "/", "%", "(", ")", ",", "!")
+
+
+def preprocess_equation(equation_str):
+    """Preprocesa la ecuación para hacerla compatible con SymPy."""
+    if equation_str is None:
+        return ""
+
+    # Quitar espacios
+    equation_str = equation_str.replace(" ", "")
+
+    for old, new in EQUATION_REPLACEMENTS.items():
+        equation_str = equation_str.replace(old, new)
+
+    return equation_str
+
+
+class EquationSyntaxError(ValueError):
+    def __init__(self, message, position):
+        super().__init__(f"{message} (posición {position + 1})")
+        self.position = position
+
+
+def tokenize(text):
+    """Divide una ecuación preprocesada en tokens (tipo, valor, posición)"""
+    tokens = []
+    i, n = 0, len(text)
+
+    while i < n:
+        ch = text[i]
+
+        if ch.isdigit() or (ch == "." and i + 1 < n and text[i + 1].isdigit()):
+            start = i
+            while i < n and text[i].isdigit():
+                i += 1
+            if i < n and text[i] == ".":
+                i += 1
+                while i < n and text[i].isdigit():
+                    i += 1
+            # Exponente sólo si le siguen dígitos: "2e-3" es un número, "2e" es 2*e
+            if i < n and text[i] in "eE":
+                j = i + 1
+                if j < n and text[j] in "+-":
+                    j += 1
+                if j < n and text[j].isdigit():
+                    i = j
+                    while i < n and text[i].isdigit():
+                        i += 1
+            tokens.append((NUMBER, text[start:i], start))
+            continue
+
+        if ch.isalpha() or ch == "_":
+            start = i
+            while i < n and (text[i].isalnum() or text[i] == "_"):
+                i += 1
+            tokens.append((NAME, text[start:i], start))
+            continue
+
+        for op in _OPERATORS:
+            if text.startswith(op, i):
+                tokens.append((OPERATOR, op, i))
+                i += len(op)
+                break
+        else:
+            raise EquationSyntaxError(f"Carácter no permitido '{ch}'", i)
+
+    return tokens
+
+
+class _Checker:
+    """Analizador descendente recursivo; sólo verifica, no construye nada.
+
+    expr    := term (('+' | '-') term)*
+    term    := unary (('*' | '/' | '//' | '%') unary | unary)*   (multiplicación implícita)
+    unary   := ('+' | '-') unary | power
+    power   := postfix ('**' unary)?
+    postfix := primary '!'*
+    primary := NUMBER | NAME ('(' expr (',' expr)* ')')? | '(' expr ')'
+    """
+
+    def __init__(self, tokens, length):
+        self.tokens = tokens
+        self.length = length
+        self.index = 0
+
+    def check(self):
+        if not self.tokens:
+            raise EquationSyntaxError("La ecuación no puede estar vacía", 0)
+        self.expr()
+        if self.index < len(self.tokens):
+            _, value, position = self.tokens[self.index]
+            if value == ")":
+                raise EquationSyntaxError("Paréntesis ')' sin abrir", position)
+            raise EquationSyntaxError(f"Token inesperado '{value}'", position)
+
+    def peek(self):
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return None
+
+    def accept(self, *values):
+        token = self.peek()
+        if token is not None and token[0] == OPERATOR and token[1] in values:
+            self.index += 1
+            return token
+        return None
+
+    def expr(self):
+        self.term()
+        while self.accept("+", "-"):
+            self.term()
+
+    def term(self):
+        self.unary()
+        while True:
+            if self.accept("*", "/", "//", "%"):
+                self.unary()
+            elif self.starts_operand():
+                self.unary()
+            else:
+                return
+
+    def unary(self):
+        if self.accept("+", "-"):
+            self.unary()
+        else:
+            self.power()
+
+    def power(self):
+        self.postfix()
+        if self.accept("**"):
+            self.unary()
+
+    def postfix(self):
+        self.primary()
+        while self.accept("!"):
+            pass
+
+    def primary(self):
+        token = self.peek()
+        if token is None:
+            raise EquationSyntaxError("Expresión incompleta, se esperaba un operando", self.length)
+
+        kind, value, position = token
+        if kind == NUMBER:
+            self.index += 1
+        elif kind == NAME:
+            self.index += 1
+            if self.accept("("):
+                self.expr()
+                while self.accept(","):
+                    self.expr()
+                self.close(position)
+        elif value == "(":
+            self.index += 1
+            self.expr()
+            self.close(position)
+        else:
+            raise EquationSyntaxError(f"Se esperaba un operando antes de '{value}'", position)
+
+    def close(self, open_position):
+        if not self.accept(")"):
+            token = self.peek()
+            if token is None:
+                raise EquationSyntaxError("Paréntesis sin cerrar", open_position)
+            raise EquationSyntaxError(f"Se esperaba ')' y se encontró '{token[1]}'", token[2])
+
+    def starts_operand(self):
+        token = self.peek()
+        return token is not None and (token[0] in (NUMBER, NAME) or token[1] == "(")
+
+
+def quick_check(equation_str):
+    """Verificación sintáctica rápida. Devuelve (es_válida, mensaje)"""
+    text = preprocess_equation(equation_str)
+    try:
+        _Checker(tokenize(text), len(text)).check()
+        return True, "Sintaxis válida"
+    except EquationSyntaxError as e:
+        return False, str(e)
@@ -1,5 +1,14 @@
+import cmath
+import linecache
+import threading
+from collections import OrderedDict
+
 import sympy as sp
 import numpy as np
+from modules.autodiff import ForwardDerivative
+from modules.disk_cache import ExpressionDiskCache
+from modules.equation_lexer import preprocess_equation
+from modules.evaluation import StackedFunction, VectorizedEvaluator
 from sympy.parsing.sympy_parser import (
     parse_expr,
     standard_transformations,
@@ -7,6 +16,340 @@ from sympy.parsing.sympy_parser import (
 )
 
 
+def scalar_lambdify(args, expr, fallback, **kwargs):
+    """Compila expr con el módulo math para evaluar floats de Python sin pasar por numpy.
+
+    Si math no puede evaluar un punto (dominio, desbordamiento o un argumento que
+    no es escalar) se delega en la versión numpy, que conserva su semántica
+    (nan/inf con advertencia).
+    """
+    try:
+        fast = sp.lambdify(args, expr, modules=["math"], **kwargs)
+    except Exception:
+        return fallback
+    return guard_scalar(fast, expr, fallback)
+
+
+def guard_scalar(fast, expr, fallback):
+    """Protege una función math ya compilada con la versión numpy como respaldo"""
+    expressions = expr if isinstance(expr, (list, tuple)) else [expr]
+    expressions = [e for e in expressions if isinstance(e, sp.Basic)]
+    # Sumas y productos de floats no lanzan excepciones (desbordan a inf). Las
+    # funciones (sin, log, ...) y las potencias sí pueden fallar donde numpy devuelve
+    # nan/inf: raíces de negativos, x**n demasiado grande (OverflowError) y
+    # divisiones, que SymPy representa como x*y**-1 (ZeroDivisionError)
+    needs_guard = any(e.atoms(sp.Function) or e.atoms(sp.Pow) for e in expressions)
+    if not needs_guard:
+        return fast
+
+    def scalar_function(*values):
+        try:
+            return fast(*values)
+        except (ValueError, OverflowError, TypeError, ZeroDivisionError):
+            # Como escalares numpy: un float de Python elevado a una potencia negativa
+            # lanzaría ZeroDivisionError también en la versión numpy
+            return fallback(*(np.asarray(v, dtype=float)[()] for v in values))
+
+    scalar_function.__wrapped__ = fast
+    return scalar_function
+
+
+# Funciones de cmath con el mismo nombre que las de math: tienen prioridad sobre math
+CMATH_NAMESPACE = {
+    name: getattr(cmath, name)
+    for name in (
+        "sqrt", "exp", "log", "log10", "sin", "cos", "tan", "asin", "acos", "atan",
+        "sinh", "cosh", "tanh", "asinh", "acosh", "atanh", "pi", "e",
+    )
+}
+
+
+def complex_lambdify(args, expr, fallback, **kwargs):
+    """Compila expr para números complejos de Python (cmath) con respaldo numpy complex128.
+
+    Las funciones sin versión compleja en cmath (floor, gamma, ...) o los puntos
+    singulares se evalúan con la función numpy sobre complex128.
+    """
+    def complex_fallback(*values):
+        return fallback(*(np.complex128(value) for value in values))
+
+    try:
+        fast = sp.lambdify(args, expr, modules=[CMATH_NAMESPACE, "math"], **kwargs)
+    except Exception:
+        return complex_fallback
+
+    def complex_function(*values):
+        values = [complex(value) for value in values]
+        try:
+            return fast(*values)
+        except (ValueError, OverflowError, TypeError, ZeroDivisionError):
+            return complex_fallback(*values)
+
+    complex_function.__wrapped__ = fast
+    return complex_function
+
+
+def polynomial_coefficients(expr, symbol):
+    """Coeficientes numéricos (de mayor a menor grado) si expr es un polinomio en symbol; si no, None"""
+    if not expr.is_polynomial(symbol):
+        return None
+    try:
+        coeffs = sp.Poly(expr, symbol).all_coeffs()
+    except sp.PolynomialError:
+        return None
+    # Coeficientes simbólicos (otras variables o parámetros): no es un polinomio numérico
+    if any(c.free_symbols for c in coeffs):
+        return None
+
+    values = np.array([complex(c) for c in coeffs])
+    if np.all(values.imag == 0):
+        values = values.real
+    return values
+
+
+class ExpressionCache:
+    """Caché LRU acotada de expresiones compiladas, compartida por todo el proceso"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                _, evicted = self._entries.popitem(last=False)
+                self.evictions += 1
+                self._release(evicted)
+
+    def clear(self):
+        with self._lock:
+            for entry in self._entries.values():
+                self._release(entry)
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    @staticmethod
+    def _release(entry):
+        """Libera el código fuente que lambdify registra en linecache"""
+        functions = list(entry.values())
+        if isinstance(entry.get("derivatives"), DerivativeStore):
+            functions.extend(entry["derivatives"].compiled_functions())
+
+        for value in functions:
+            # Los envoltorios (VectorizedEvaluator, StackedFunction, guard_scalar)
+            # exponen la función generada en numpy_function o __wrapped__
+            value = getattr(value, "numpy_function", value)
+            code = getattr(getattr(value, "__wrapped__", value), "__code__", None)
+            if code is not None and code.co_filename.startswith("<lambdifygenerated"):
+                linecache.cache.pop(code.co_filename, None)
+
+
+# Tamaño (sp.count_ops) de la derivada simbólica a partir del cual conviene la
+# diferenciación automática en lugar de compilar la derivada
+AD_OPS_THRESHOLD = 200
+
+
+def estimated_derivative_ops(expr, symbol, order=1):
+    """Estimación de sp.count_ops de la derivada de orden n, sin derivar.
+
+    Recorre el árbol una vez aplicando las reglas de derivación a los tamaños:
+    (u v)' = u' v + u v' copia los demás factores, f(g)' = f'(g) g' copia g, etc.
+    Para órdenes mayores se repite el mismo factor de crecimiento d(f) / f.
+    """
+    memo = {}
+
+    def visit(node):
+        """(tamaño de node, tamaño estimado de su derivada, depende de symbol)"""
+        if node in memo:
+            return memo[node]
+        if node.is_Atom:
+            result = (0, 0, node == symbol)
+        else:
+            children = [visit(arg) for arg in node.args]
+            size = sum(c[0] for c in children) + max(len(children) - 1, 1)
+            dependent = [i for i, c in enumerate(children) if c[2]]
+            if not dependent:
+                result = (size, 0, False)
+            elif node.is_Add:
+                result = (size, sum(children[i][1] for i in dependent) + len(dependent) - 1, True)
+            elif node.is_Mul:
+                # Un término por factor dependiente: su derivada por los demás factores
+                others = size - sum(c[0] for c in children)
+                derivative = sum(children[i][1] + size - children[i][0] for i in dependent)
+                result = (size, derivative + others + len(dependent) - 1, True)
+            else:
+                # Potencias y funciones: f'(g) cuesta como f(g), más el factor g'
+                derivative = sum(size + children[i][1] + 2 for i in dependent)
+                result = (size, derivative + len(dependent) - 1, True)
+        memo[node] = result
+        return result
+
+    size, derivative, _ = visit(expr)
+    if order <= 1 or derivative == 0:
+        return derivative if order >= 1 else size
+    return derivative * (derivative / max(size, 1)) ** (order - 1)
+
+
+class DerivativeStore:
+    """Cadena de derivadas de una expresión, calculadas bajo demanda y memorizadas"""
+
+    def __init__(self, expr, symbols, parameters=None):
+        self.expr = expr
+        self.symbols = symbols
+        self.parameters = parameters or {}
+        # Las funciones compiladas reciben (variables..., parámetros...)
+        self.args = list(symbols.values()) + list(self.parameters.values())
+        self._chains = {}
+        self._functions = {}
+        self._lock = threading.Lock()
+
+    def expression(self, order, variable=None):
+        """Derivada simbólica de orden n respecto a la variable (por defecto la primera)"""
+        if order < 0:
+            raise ValueError("El orden de la derivada no puede ser negativo")
+
+        var = self._variable(variable)
+        with self._lock:
+            chain = self._chains.setdefault(var, [self.expr])
+            # Sólo se deriva a partir de la última derivada conocida
+            while len(chain) <= order:
+                chain.append(sp.diff(chain[-1], self.symbols[var]))
+            return chain[order]
+
+    def function(self, order, variable=None, scalar=False):
+        """Versión numpy de la derivada de orden n.
+
+        scalar=True compila para floats con math; scalar="complex" para complejos con cmath.
+        """
+        var = self._variable(variable)
+        args = self.args
+
+        def build():
+            numpy_func = sp.lambdify(
+                args, self.expression(order, var), modules=["numpy", "math"]
+            )
+            if not scalar:
+                return numpy_func
+            if scalar == "complex":
+                return complex_lambdify(args, self.expression(order, var), numpy_func)
+            return scalar_lambdify(args, self.expression(order, var), numpy_func)
+
+        return self._cached((var, order, scalar), build)
+
+    def kernel(self, order, variable=None, scalar=False):
+        """Función que devuelve (f, f', ..., f^(k)) en una sola llamada.
+
+        Las derivadas se compilan juntas tras aplicar sp.cse al conjunto, de modo
+        que las subexpresiones comunes (exp(x)*sin(x), etc.) se evalúan una vez.
+        scalar tiene el mismo significado que en function.
+        """
+        var = self._variable(variable)
+        args = self.args
+
+        def build():
+            expressions = [self.expression(n, var) for n in range(order + 1)]
+            numpy_kernel = sp.lambdify(
+                args, expressions, modules=["numpy", "math"], cse=True
+            )
+            if not scalar:
+                return numpy_kernel
+            if scalar == "complex":
+                return complex_lambdify(args, expressions, numpy_kernel, cse=True)
+            return scalar_lambdify(args, expressions, numpy_kernel, cse=True)
+
+        return self._cached((var, "kernel", order, scalar), build)
+
+    def forward_kernel(self, order, variable=None):
+        """Como kernel, pero con diferenciación automática (duales) sobre el árbol de f.
+
+        Lanza NotImplementedError si la expresión usa una operación no soportada.
+        """
+        var = self._variable(variable)
+        return self._cached(
+            (var, "forward", order),
+            lambda: ForwardDerivative(
+                self.expr, self.symbols[var], list(self.parameters.values()), order
+            ),
+        )
+
+    def auto_kernel(self, order, variable=None, scalar=False, ops_threshold=AD_OPS_THRESHOLD):
+        """kernel simbólico, o forward_kernel si la derivada de mayor orden supera
+        ops_threshold operaciones (compilarla con lambdify y CSE sería lo más costoso).
+
+        El tamaño de la derivada se estima sobre el árbol de f (ver
+        estimated_derivative_ops); sólo se mide con sp.count_ops si ya estaba calculada.
+        """
+        if order <= 2 and self.derivative_ops(order, variable) > ops_threshold:
+            try:
+                return self.forward_kernel(order, variable)
+            except NotImplementedError:
+                pass
+        return self.kernel(order, variable, scalar)
+
+    def derivative_ops(self, order, variable=None):
+        """Tamaño de la derivada de orden n: medido si ya se derivó, estimado si no"""
+        var = self._variable(variable)
+        with self._lock:
+            chain = self._chains.get(var, [self.expr])
+        if len(chain) > order:
+            return sp.count_ops(chain[order])
+        return estimated_derivative_ops(self.expr, self.symbols[var], order)
+
+    def _cached(self, key, build):
+        with self._lock:
+            func = self._functions.get(key)
+        if func is not None:
+            return func
+
+        func = build()
+        with self._lock:
+            return self._functions.setdefault(key, func)
+
+    def compiled_functions(self):
+        with self._lock:
+            return list(self._functions.values())
+
+    def _variable(self, variable):
+        if variable is None:
+            return next(iter(self.symbols))
+        if variable not in self.symbols:
+            raise ValueError(f"Variable desconocida: {variable}")
+        return variable
+
+
+# Caché única para todas las instancias de EquationParser (y por ende de InputValidator)
+_expression_cache = ExpressionCache()
+
+# Caché opcional en disco para arranques en caliente (ver ExpressionDiskCache)
+_disk_cache = ExpressionDiskCache.from_environment()
+
+
 class EquationParser:
     def __init__(self):
         self.supported_functions = {
@@ -28,73 +371,212 @@ class EquationParser:
             "e": "E",  # e de Euler
         }
 
-    def parse_equation(self, equation_str, variables):
-        """Convierte string de ecuación a función SymPy y numpy"""
+    def parse_equation(self, equation_str, variables, parameters=None):
+        """Convierte string de ecuación a función SymPy y numpy.
+
+        Los parámetros declarados (p. ej. ['a', 'b'] en "x^3 - a*x + b") quedan
+        simbólicos: las funciones compiladas reciben (variables..., parámetros...)
+        y difunden sobre arrays de parámetros, así que la ecuación se parsea una vez.
+        """
+        if isinstance(equation_str, (list, tuple)):
+            return self.parse_system(equation_str, variables)
+
+        parameters = tuple(parameters or ())
         try:
-            # 1) Preprocesar (reemplazos de símbolos)
-            processed_eq = self.preprocess_equation(equation_str)
+            # La clave normalizada hace que "x^2" y "x ** 2" compartan entrada
+            key = (self.preprocess_equation(equation_str), tuple(variables), parameters)
+        except Exception as e:
+            raise ValueError(f"Error al parsear ecuación: {str(e)}")
 
-            # 2) Crear símbolos
-            symbols = {var: sp.Symbol(var) for var in variables}
+        if set(parameters) & set(variables):
+            raise ValueError("Un parámetro no puede ser también variable")
 
-            # 3) Diccionario local: funciones + constantes + variables
-            local_dict = {}
-            for name, sym_name in self.supported_functions.items():
-                if hasattr(sp, sym_name):
-                    local_dict[name] = getattr(sp, sym_name)
-            local_dict.update(symbols)
+        cached = _expression_cache.get(key)
+        if cached is not None:
+            return cached
 
-            # 4) Activar multiplicación implícita: 2x, 3(x+1), xsin(x), etc.
-            transformations = standard_transformations + (
-                implicit_multiplication_application,
-            )
+        result = self._compile(key[0], variables, parameters)
+        _expression_cache.put(key, result)
+        return result
 
-            expr = parse_expr(
-                processed_eq,
-                local_dict=local_dict,
-                transformations=transformations,
-            )
+    def parse_system(self, equations, variables):
+        """Parsea un sistema de ecuaciones sobre símbolos compartidos.
 
-            # 5) Función numpy para evaluación numérica
-            numpy_func = sp.lambdify(
-                list(symbols.values()), expr, modules=["numpy", "math"]
+        Devuelve una función F(x) -> ndarray de forma (m,) y su jacobiano simbólico
+        compilado con CSE, J(x) -> ndarray de forma (m, n). Ambas aceptan x con
+        forma (n, ...) para evaluar muchos puntos en una sola llamada.
+        """
+        try:
+            processed = tuple(self.preprocess_equation(eq) for eq in equations)
+            key = ("system", processed, tuple(variables))
+        except Exception as e:
+            raise ValueError(f"Error al parsear sistema: {str(e)}")
+
+        if not processed:
+            raise ValueError("El sistema debe tener al menos una ecuación")
+
+        cached = _expression_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._compile_system(processed, variables)
+        _expression_cache.put(key, result)
+        return result
+
+    def polynomial_coefficients(self, equation_str, variable="x"):
+        """Coeficientes (de mayor a menor grado) si la ecuación es un polinomio numérico
+        en la variable, o None.
+
+        No forma parte de parse_equation (sp.Poly de x^100000 tarda segundos): se calcula
+        la primera vez que lo pide un método de raíces de polinomios y queda guardado en
+        la entrada de la caché de expresiones.
+        """
+        result = self.parse_equation(equation_str, [variable])
+        if "polynomial" not in result:
+            result["polynomial"] = polynomial_coefficients(
+                result["expression"], result["symbols"][variable]
             )
+        return result["polynomial"]
+
+    def derivative_kernel(self, equation_str, variables, order, variable=None, scalar=False):
+        """Kernel compilado que devuelve f y sus derivadas hasta el orden dado"""
+        result = self.parse_equation(equation_str, variables)
+        return result["derivatives"].kernel(order, variable, scalar)
+
+    @staticmethod
+    def cache_info():
+        """Contadores de aciertos, fallos y desalojos de la caché de expresiones"""
+        return _expression_cache.info()
+
+    @staticmethod
+    def clear_cache():
+        """Vacía la caché de expresiones compartida"""
+        _expression_cache.clear()
+
+    @staticmethod
+    def enable_disk_cache(directory, max_bytes=50 * 1024 * 1024):
+        """Activa la caché en disco compartida por todos los procesos que usen el directorio"""
+        global _disk_cache
+        _disk_cache = ExpressionDiskCache(directory, max_bytes)
+        return _disk_cache
+
+    @staticmethod
+    def disable_disk_cache():
+        global _disk_cache
+        _disk_cache = None
+
+    def _compile(self, processed_eq, variables, parameters=()):
+        """Parsea y compila una ecuación ya preprocesada"""
+        try:
+            # 1) Crear símbolos (variables y parámetros)
+            symbols = {var: sp.Symbol(var) for var in variables}
+            param_symbols = {name: sp.Symbol(name) for name in parameters}
+            args = list(symbols.values()) + list(param_symbols.values())
+            arg_names = tuple(variables) + tuple(parameters)
+
+            # 2) Consultar la caché en disco antes de parsear
+            disk_cache = _disk_cache
+            loaded = disk_cache.load(processed_eq, arg_names) if disk_cache else None
+
+            if loaded is not None:
+                expr, numpy_func, scalar_fast = loaded
+                scalar_func = (
+                    guard_scalar(scalar_fast, expr, numpy_func) if scalar_fast else numpy_func
+                )
+            else:
+                expr = self._parse(processed_eq, {**symbols, **param_symbols})
+
+                # 3) Función numpy para evaluación numérica
+                numpy_func = sp.lambdify(args, expr, modules=["numpy", "math"])
+
+                # 4) Función escalar (math) para los métodos iterativos
+                scalar_func = scalar_lambdify(args, expr, numpy_func)
+
+                if disk_cache:
+                    scalar_fast = getattr(scalar_func, "__wrapped__", scalar_func)
+                    disk_cache.store(
+                        processed_eq, arg_names, expr, numpy_func,
+                        scalar_fast if scalar_fast is not numpy_func else None,
+                    )
+
+            # 5) Evaluación vectorizada con forma garantizada (integración, gráficas)
+            vector_func = VectorizedEvaluator(numpy_func, scalar_func)
 
             # 6) Función sympy para cálculos simbólicos
             sympy_func = lambda **kwargs: expr.subs(kwargs)
 
+            # 7) Derivadas perezosas, compartidas entre métodos y peticiones
+            derivatives = DerivativeStore(expr, symbols, param_symbols)
+
             return {
                 "expression": expr,
                 "numpy_function": numpy_func,
+                "scalar_function": scalar_func,
+                "vector_function": vector_func,
                 "sympy_function": sympy_func,
                 "symbols": symbols,
+                "parameters": param_symbols,
+                "derivatives": derivatives,
             }
 
         except Exception as e:
             raise ValueError(f"Error al parsear ecuación: {str(e)}")
 
-    def preprocess_equation(self, equation_str):
-        """Preprocesa la ecuación para hacerla compatible con SymPy."""
-        if equation_str is None:
-            return ""
-
-        # Quitar espacios
-        equation_str = equation_str.replace(" ", "")
-
-        # Reemplazar símbolos bonitos por sintaxis SymPy
-        replacements = {
-            "^": "**",      # potencia visual
-            "√": "sqrt",    # raíz
-            "π": "pi",      # pi
-            "÷": "/",       # si algún día pones ÷
-            "×": "*",       # si usas × en vez de *
-            "ln": "log",    # log natural
-        }
+    def _compile_system(self, processed, variables):
+        """Parsea y compila un sistema de ecuaciones ya preprocesadas"""
+        try:
+            symbols = {var: sp.Symbol(var) for var in variables}
+            args = list(symbols.values())
 
-        for old, new in replacements.items():
-            equation_str = equation_str.replace(old, new)
+            expressions = [self._parse(eq, symbols) for eq in processed]
+            matrix = sp.Matrix(expressions)
+            jacobian = matrix.jacobian(args)
 
-        return equation_str
+            # Un solo kernel para todas las componentes y otro para el jacobiano,
+            # ambos con subexpresiones comunes compartidas
+            numpy_func = sp.lambdify(args, expressions, modules=["numpy", "math"], cse=True)
+            jacobian_func = sp.lambdify(
+                args, jacobian.tolist(), modules=["numpy", "math"], cse=True
+            )
+
+            return {
+                "expressions": expressions,
+                "matrix": matrix,
+                "jacobian": jacobian,
+                "numpy_function": numpy_func,
+                "function": StackedFunction(numpy_func, (len(expressions),)),
+                "jacobian_function": StackedFunction(jacobian_func, jacobian.shape),
+                "symbols": symbols,
+            }
+
+        except Exception as e:
+            raise ValueError(f"Error al parsear sistema: {str(e)}")
+
+    def _parse(self, processed_eq, symbols):
+        """Convierte el texto preprocesado en una expresión SymPy"""
+        # Diccionario local: funciones + constantes + variables
+        local_dict = {}
+        for name, sym_name in self.supported_functions.items():
+            if hasattr(sp, sym_name):
+                local_dict[name] = getattr(sp, sym_name)
+        local_dict.update(symbols)
+
+        # Activar multiplicación implícita: 2x, 3(x+1), xsin(x), etc.
+        transformations = standard_transformations + (
+            implicit_multiplication_application,
+        )
+
+        return parse_expr(
+            processed_eq,
+            local_dict=local_dict,
+            transformations=transformations,
+        )
+
+    def preprocess_equation(self, equation_str):
+        """Preprocesa la ecuación para hacerla compatible con SymPy."""
+        # La tabla de reemplazos vive en equation_lexer para que el verificador
+        # rápido y el parser completo acepten exactamente la misma gramática
+        return preprocess_equation(equation_str)
 
     def validate_equation(self, equation_str, variables):
         """Valida si la ecuación es correcta."""
@@ -0,0 +1,170 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class VectorizedEvaluator:
+    """Evaluación vectorizada con garantía de forma sobre una función lambdify de numpy.
+
+    - El resultado siempre tiene la forma de difusión (broadcast) de las entradas y
+      un dtype flotante, incluso si la ecuación es constante ("5", "pi").
+    - Acepta un buffer preasignado en out=; las entradas grandes se evalúan por
+      bloques para que los temporales no crezcan con el número de puntos.
+    - Si la función numpy no acepta arrays, evalúa elemento a elemento con la
+      función escalar y lo registra en fallbacks / last_fallback.
+    """
+
+    def __init__(self, numpy_function, scalar_function=None, chunk_size=65536):
+        self.numpy_function = numpy_function
+        self.scalar_function = scalar_function or numpy_function
+        self.chunk_size = chunk_size
+        self.fallbacks = 0
+        self.last_fallback = False
+
+    def __call__(self, *values, out=None):
+        arrays = [np.asarray(value) for value in values]
+        shape = np.broadcast_shapes(*(array.shape for array in arrays))
+        # El 0.0 es un escalar "débil": int -> float64, float32 se conserva
+        dtype = np.result_type(*arrays, 0.0)
+
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"El buffer out tiene forma {out.shape}, se esperaba {shape}")
+
+        self.last_fallback = False
+        if out.size > self.chunk_size and self._can_chunk(arrays, out):
+            flat_out = out.reshape(-1)
+            flat_arrays = [array.reshape(-1) if array.ndim else array for array in arrays]
+            for start in range(0, flat_out.size, self.chunk_size):
+                stop = start + self.chunk_size
+                chunk = [array[start:stop] if array.ndim else array for array in flat_arrays]
+                self._evaluate_into(flat_out[start:stop], chunk)
+        else:
+            self._evaluate_into(out, arrays)
+
+        return out
+
+    def _evaluate_into(self, out, arrays):
+        try:
+            # out[...] = difunde los resultados escalares a toda la forma
+            out[...] = self.numpy_function(*arrays)
+        except (TypeError, ValueError):
+            self._elementwise_into(out, arrays)
+
+    def _elementwise_into(self, out, arrays):
+        self.fallbacks += 1
+        self.last_fallback = True
+
+        broadcast = np.broadcast_arrays(*arrays, out)[:-1]
+        for index in np.ndindex(out.shape):
+            out[index] = self.scalar_function(*(array[index].item() for array in broadcast))
+
+    @staticmethod
+    def _can_chunk(arrays, out):
+        """Sólo se trocea si las entradas no escalares ya tienen la forma completa"""
+        if not out.flags.c_contiguous:
+            return False
+        return all(array.ndim == 0 or array.shape == out.shape for array in arrays)
+
+
+class MemoizedFunction:
+    """Envuelve una función escalar de los métodos iterativos.
+
+    Recuerda los últimos valores calculados (un punto repetido no se vuelve a
+    evaluar) y cuenta las evaluaciones reales en calls, para que function_calls
+    refleje el trabajo hecho y no una fórmula fija.
+    """
+
+    def __init__(self, function, maxsize=16):
+        self.function = function
+        self.maxsize = maxsize
+        self.calls = 0
+        self.hits = 0
+        self._values = OrderedDict()
+
+    def __call__(self, x):
+        try:
+            value = self._values[x]
+        except KeyError:
+            pass
+        except TypeError:
+            # Argumento no hashable (p. ej. un array): se evalúa sin memorizar
+            self.calls += 1
+            return self.function(x)
+        else:
+            self.hits += 1
+            self._values.move_to_end(x)
+            return value
+
+        value = self.function(x)
+        self.calls += 1
+        self._values[x] = value
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+        return value
+
+
+class StackedFunction:
+    """Envuelve una función lambdify que devuelve listas (anidadas) y entrega un ndarray.
+
+    Recibe el vector de variables x con forma (n,) o (n, ...) para evaluar por lotes
+    y devuelve un array de forma shape + forma_de_lote. Las componentes constantes se
+    difunden a la forma del lote, igual que en VectorizedEvaluator.
+    """
+
+    def __init__(self, numpy_function, shape):
+        self.numpy_function = numpy_function
+        self.shape = tuple(shape)
+
+    def __call__(self, x, out=None):
+        x = np.asarray(x, dtype=float)
+        values = self.numpy_function(*x)
+
+        flat = values
+        for _ in range(len(self.shape) - 1):
+            flat = [item for row in flat for item in row]
+
+        batch_shape = np.broadcast_shapes(x.shape[1:], *(np.shape(value) for value in flat))
+        if out is None:
+            out = np.empty(self.shape + batch_shape, dtype=np.result_type(x, *flat, 0.0))
+        elif out.shape != self.shape + batch_shape:
+            raise ValueError(
+                f"El buffer out tiene forma {out.shape}, se esperaba {self.shape + batch_shape}"
+            )
+        elif not out.flags.c_contiguous:
+            raise ValueError("El buffer out debe ser contiguo (orden C)")
+
+        flat_out = out.reshape((-1,) + batch_shape)
+        for i, value in enumerate(flat):
+            flat_out[i] = value
+        return out
+
+
+def broadcast_parameters(parameters):
+    """Normaliza una malla de parámetros {nombre: valores} a arrays de forma común.
+
+    Devuelve (nombres, arrays, forma). Los valores pueden ser escalares, listas o
+    arrays compatibles por difusión (p. ej. los de np.meshgrid).
+    """
+    if not parameters:
+        raise ValueError("Debe indicar al menos un parámetro")
+
+    names = list(parameters)
+    try:
+        arrays = np.broadcast_arrays(*(np.asarray(parameters[name], dtype=float) for name in names))
+    except ValueError:
+        raise ValueError("Los arrays de parámetros no tienen formas compatibles")
+    return names, arrays, arrays[0].shape
+
+
+def weighted_node_sum(function, nodes, weights, param_arrays, shape):
+    """Suma ponderada sum_i w_i f(x_i, p) evaluada de una vez para toda la malla de parámetros.
+
+    Los nodos van en el eje 0 y los parámetros en los siguientes, así que una sola
+    llamada a la función cubre nodos x parámetros; el resultado tiene forma shape.
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    values = function(nodes.reshape(nodes.shape + (1,) * len(shape)), *param_arrays)
+    values = np.broadcast_to(values, nodes.shape + tuple(shape))
+    return np.tensordot(np.asarray(weights, dtype=float), values, axes=(0, 0))
@@ -1,5 +1,6 @@
 import numpy as np
 from modules.equation_parser import EquationParser
+from modules.evaluation import broadcast_parameters, weighted_node_sum
 from modules.validation import InputValidator
 
 class SimpsonIntegration:
@@ -26,7 +27,7 @@ class SimpsonIntegration:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, ['x'])
-            f = result['numpy_function']
+            f = result['vector_function']
 
             h = (b_val - a_val) / n_val
             x = np.linspace(a_val, b_val, n_val + 1)
@@ -76,7 +77,7 @@ class SimpsonIntegration:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, ['x'])
-            f = result['numpy_function']
+            f = result['vector_function']
 
             h = (b_val - a_val) / n_val
             x = np.linspace(a_val, b_val, n_val + 1)
@@ -109,6 +110,92 @@ class SimpsonIntegration:
                 'error': str(e)
             }
 
+    def simpson_13_batch(self, equation_str, a, b, n, parameters):
+        """Regla de Simpson 1/3 compuesta sobre una malla de parámetros {nombre: valores}"""
+        try:
+            valid_interval, (a_val, b_val) = self.validator.validate_interval(str(a), str(b))
+            if not valid_interval:
+                raise ValueError(f"Intervalo inválido: {a_val}")
+
+            valid_n, n_val = self.validator.validate_positive_integer(str(n), 2)
+            if not valid_n:
+                raise ValueError(f"Número de intervalos inválido: {n_val}")
+
+            if n_val % 2 != 0:
+                raise ValueError("n debe ser par para Simpson 1/3")
+
+            names, param_arrays, shape = broadcast_parameters(parameters)
+            result = self.parser.parse_equation(equation_str, ['x'], names)
+            f = result['vector_function']
+
+            h = (b_val - a_val) / n_val
+            x = np.linspace(a_val, b_val, n_val + 1)
+            weights = np.where(np.arange(n_val + 1) % 2 == 1, 4.0, 2.0)
+            weights[[0, -1]] = 1.0
+            weights *= h / 3
+
+            integrals = weighted_node_sum(f, x, weights, param_arrays, shape)
+
+            return {
+                'success': True,
+                'integrals': integrals,
+                'parameters': dict(zip(names, param_arrays)),
+                'method': 'Simpson 1/3',
+                'intervals': n_val,
+                'step_size': h,
+                'function_evaluations': (n_val + 1) * integrals.size,
+                'message': f'{integrals.size} integrales calculadas exitosamente'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def simpson_38_batch(self, equation_str, a, b, n, parameters):
+        """Regla de Simpson 3/8 compuesta sobre una malla de parámetros {nombre: valores}"""
+        try:
+            valid_interval, (a_val, b_val) = self.validator.validate_interval(str(a), str(b))
+            if not valid_interval:
+                raise ValueError(f"Intervalo inválido: {a_val}")
+
+            valid_n, n_val = self.validator.validate_positive_integer(str(n), 3)
+            if not valid_n:
+                raise ValueError(f"Número de intervalos inválido: {n_val}")
+
+            if n_val % 3 != 0:
+                raise ValueError("n debe ser múltiplo de 3 para Simpson 3/8")
+
+            names, param_arrays, shape = broadcast_parameters(parameters)
+            result = self.parser.parse_equation(equation_str, ['x'], names)
+            f = result['vector_function']
+
+            h = (b_val - a_val) / n_val
+            x = np.linspace(a_val, b_val, n_val + 1)
+            weights = np.where(np.arange(n_val + 1) % 3 == 0, 2.0, 3.0)
+            weights[[0, -1]] = 1.0
+            weights *= 3 * h / 8
+
+            integrals = weighted_node_sum(f, x, weights, param_arrays, shape)
+
+            return {
+                'success': True,
+                'integrals': integrals,
+                'parameters': dict(zip(names, param_arrays)),
+                'method': 'Simpson 3/8',
+                'intervals': n_val,
+                'step_size': h,
+                'function_evaluations': (n_val + 1) * integrals.size,
+                'message': f'{integrals.size} integrales calculadas exitosamente'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
     def estimate_error(self, f, a, b, n, method):
         h = (b - a) / n
         if method == '1/3':
@@ -1,5 +1,6 @@
 import numpy as np
 from modules.equation_parser import EquationParser
+from modules.evaluation import broadcast_parameters, weighted_node_sum
 from modules.validation import InputValidator
 
 class TrapezoidalRule:
@@ -24,7 +25,7 @@ class TrapezoidalRule:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, ['x'])
-            f = result['numpy_function']
+            f = result['vector_function']
 
             h = (b_val - a_val) / n_val
             x = np.linspace(a_val, b_val, n_val + 1)
@@ -52,4 +53,43 @@ class TrapezoidalRule:
             return {
                 'success': False,
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+
+    def solve_batch(self, equation_str, a, b, n, parameters):
+        """Regla del trapecio compuesta sobre una malla de parámetros {nombre: valores}"""
+        try:
+            valid_interval, (a_val, b_val) = self.validator.validate_interval(str(a), str(b))
+            if not valid_interval:
+                raise ValueError(f"Intervalo inválido: {a_val}")
+
+            valid_n, n_val = self.validator.validate_positive_integer(str(n), 1)
+            if not valid_n:
+                raise ValueError(f"Número de intervalos inválido: {n_val}")
+
+            names, param_arrays, shape = broadcast_parameters(parameters)
+            result = self.parser.parse_equation(equation_str, ['x'], names)
+            f = result['vector_function']
+
+            h = (b_val - a_val) / n_val
+            x = np.linspace(a_val, b_val, n_val + 1)
+            weights = np.full(n_val + 1, h)
+            weights[[0, -1]] = h / 2
+
+            integrals = weighted_node_sum(f, x, weights, param_arrays, shape)
+
+            return {
+                'success': True,
+                'integrals': integrals,
+                'parameters': dict(zip(names, param_arrays)),
+                'method': 'Trapecio Compuesto',
+                'intervals': n_val,
+                'step_size': h,
+                'function_evaluations': (n_val + 1) * integrals.size,
+                'message': f'{integrals.size} integrales calculadas exitosamente'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
@@ -1,18 +1,40 @@
 import numpy as np
+from modules.linear_systems.sparse import CSRMatrix
+from modules.linear_systems.splitting import (
+    as_matrix,
+    diagonal,
+    diagonal_splitting,
+    forward_substitution,
+    greedy_coloring,
+    take_rows,
+    triangular_splitting,
+)
 from modules.validation import InputValidator
 
 class GaussSeidelMethod:
     def __init__(self):
         self.validator = InputValidator()
 
-    def solve(self, A, b, initial_guess=None, tolerance=1e-6, max_iterations=1000):
-        """Resuelve Ax = b usando el método de Gauss-Seidel"""
+    def solve(self, A, b, initial_guess=None, tolerance=1e-6, max_iterations=1000,
+              ordering="natural", keep_history=True):
+        """Resuelve Ax = b usando el método de Gauss-Seidel.
+
+        Cada barrido se escribe como (D + L) x_new = b - U x_old: U x_old es un solo
+        producto matriz-vector y el sistema triangular se resuelve por sustitución
+        hacia adelante (por bloques si A es densa, por niveles si es CSR). Como el residuo vale
+        A x_new - b = U (x_new - x_old), sale gratis del producto del barrido siguiente.
+
+        ordering="multicolor" agrupa las incógnitas por colores sin acoplamiento entre
+        sí (rojo-negro en mallas de 5 puntos) y actualiza cada color como un bloque
+        vectorizado; converge a la misma solución con otro orden de actualización.
+        """
         try:
             # Validar matriz y vector
-            if not isinstance(A, (list, np.ndarray)) or not isinstance(b, (list, np.ndarray)):
-                raise ValueError("A y b deben ser listas o arrays numpy")
+            if not isinstance(A, (list, np.ndarray, CSRMatrix)) or not isinstance(b, (list, np.ndarray)):
+                raise ValueError("A debe ser una lista, un array numpy o una CSRMatrix y b una lista o array")
 
-            A_arr = np.array(A, dtype=float)
+            # Una CSRMatrix se conserva dispersa: cada barrido cuesta O(nnz)
+            A_arr = as_matrix(A)
             b_arr = np.array(b, dtype=float)
 
             n = len(b_arr)
@@ -36,27 +58,21 @@ class GaussSeidelMethod:
                     raise ValueError("El vector inicial debe tener el mismo tamaño que b")
                 x = np.array(initial_guess, dtype=float)
 
-            iterations = []
-            for k in range(iter_val):
-                x_old = x.copy()
-
-                for i in range(n):
-                    sigma1 = np.dot(A_arr[i, :i], x[:i])
-                    sigma2 = np.dot(A_arr[i, i + 1:], x_old[i + 1:])
-                    x[i] = (b_arr[i] - sigma1 - sigma2) / A_arr[i, i]
+            if np.any(diagonal(A_arr) == 0):
+                raise ValueError("La diagonal de A no puede tener ceros")
 
-                error = np.linalg.norm(x - x_old, ord=np.inf)
-                residual = np.linalg.norm(np.dot(A_arr, x) - b_arr, ord=np.inf)
-
-                iterations.append({
-                    'Iteración': k + 1,
-                    'x': x.copy(),
-                    'Error': error,
-                    'Residual': residual
-                })
-
-                if error < tol_val:
-                    break
+            if ordering == "natural":
+                x, iterations, error, residual = self._natural_sweeps(
+                    A_arr, b_arr, x, tol_val, iter_val, keep_history
+                )
+                colors = None
+            elif ordering == "multicolor":
+                colors = greedy_coloring(A_arr)
+                x, iterations, error, residual = self._multicolor_sweeps(
+                    A_arr, b_arr, x, colors, tol_val, iter_val, keep_history
+                )
+            else:
+                raise ValueError(f"Ordenamiento desconocido: {ordering}")
 
             return {
                 'success': True,
@@ -66,6 +82,8 @@ class GaussSeidelMethod:
                 'final_error': error,
                 'final_residual': residual,
                 'iterations_count': len(iterations),
+                'ordering': ordering,
+                'colors': len(colors) if colors is not None else None,
                 'message': 'Método completado exitosamente'
             }
 
@@ -73,4 +91,84 @@ class GaussSeidelMethod:
             return {
                 'success': False,
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+
+    def _splitting(self, A):
+        """A = M + N con M triangular inferior: M = D + L en Gauss-Seidel"""
+        return triangular_splitting(A)
+
+    def _natural_sweeps(self, A, b, x, tolerance, max_iterations, keep_history):
+        """Barridos M x_new = b - N x_old con buffers que se alternan entre iteraciones"""
+        M, N = self._splitting(A)
+        lower = forward_substitution(M)
+
+        n = len(b)
+        x_new = np.empty(n)
+        Nx = N @ x
+        Nx_new = np.empty(n)
+        rhs = np.empty(n)
+
+        iterations = []
+        for k in range(max_iterations):
+            np.subtract(b, Nx, out=rhs)
+            lower.solve(rhs, out=x_new)
+
+            # A x_new - b = M x_new + N x_new - b = N x_new - N x_old
+            N.dot(x_new, out=Nx_new)
+            np.subtract(Nx_new, Nx, out=rhs)
+            residual = np.abs(rhs, out=rhs).max()
+            np.subtract(x_new, x, out=rhs)
+            error = np.abs(rhs, out=rhs).max()
+
+            iterations.append({
+                'Iteración': k + 1,
+                'x': x_new.copy() if keep_history else None,
+                'Error': error,
+                'Residual': residual
+            })
+
+            x, x_new = x_new, x
+            Nx, Nx_new = Nx_new, Nx
+
+            if error < tolerance:
+                break
+
+        return x, iterations, error, residual
+
+    def _multicolor_sweeps(self, A, b, x, colors, tolerance, max_iterations, keep_history):
+        """Cada color se actualiza de una vez: sus incógnitas no se acoplan entre sí"""
+        D, R = diagonal_splitting(A)
+        # Filas de R de cada color, contiguas, precalculadas una vez
+        blocks = [(idx, take_rows(R, idx), b[idx], D[idx]) for idx in colors]
+
+        x = x.copy()
+        x_old = np.empty_like(x)
+        work = np.empty_like(x)
+
+        iterations = []
+        for k in range(max_iterations):
+            x_old[...] = x
+            for idx, rows, b_color, d_color in blocks:
+                x[idx] = self._color_update(x[idx], (b_color - rows.dot(x)) / d_color)
+
+            np.subtract(x, x_old, out=work)
+            error = np.abs(work, out=work).max()
+            A.dot(x, out=work)
+            work -= b
+            residual = np.abs(work, out=work).max()
+
+            iterations.append({
+                'Iteración': k + 1,
+                'x': x.copy() if keep_history else None,
+                'Error': error,
+                'Residual': residual
+            })
+
+            if error < tolerance:
+                break
+
+        return x, iterations, error, residual
+
+    def _color_update(self, x_color, gauss_seidel_value):
+        """Valor nuevo de las incógnitas de un color (Gauss-Seidel: el valor sin relajar)"""
+        return gauss_seidel_value
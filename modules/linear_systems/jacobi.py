@@ -1,17 +1,26 @@
 import numpy as np
+from modules.linear_systems.sparse import CSRMatrix
+from modules.linear_systems.splitting import as_matrix, diagonal_splitting, is_diagonally_dominant
 from modules.validation import InputValidator
 
 class JacobiMethod:
     def __init__(self):
         self.validator = InputValidator()
 
-    def solve(self, A, b, initial_guess=None, tolerance=1e-6, max_iterations=1000):
-        """Resuelve Ax = b usando el método de Jacobi"""
+    def solve(self, A, b, initial_guess=None, tolerance=1e-6, max_iterations=1000, keep_history=True):
+        """Resuelve Ax = b usando el método de Jacobi.
+
+        Con A = D + R precalculado, cada barrido es x_new = (b - R @ x) / D: un solo
+        producto matriz-vector (BLAS) sobre buffers reservados una vez que se
+        alternan entre iteraciones. R @ x_new sirve a la vez para el residuo y para
+        el barrido siguiente. keep_history=False no copia x en cada iteración.
+        """
         try:
-            if not isinstance(A, (list, np.ndarray)) or not isinstance(b, (list, np.ndarray)):
-                raise ValueError("A y b deben ser listas o arrays numpy")
+            if not isinstance(A, (list, np.ndarray, CSRMatrix)) or not isinstance(b, (list, np.ndarray)):
+                raise ValueError("A debe ser una lista, un array numpy o una CSRMatrix y b una lista o array")
 
-            A_arr = np.array(A, dtype=float)
+            # Una CSRMatrix se conserva dispersa: cada barrido cuesta O(nnz)
+            A_arr = as_matrix(A)
             b_arr = np.array(b, dtype=float)
 
             n = len(b_arr)
@@ -27,7 +36,7 @@ class JacobiMethod:
             if not valid_iter:
                 raise ValueError(f"Iteraciones inválidas: {iter_val}")
 
-            if not self.is_diagonally_dominant(A_arr):
+            if not is_diagonally_dominant(A_arr):
                 return {
                     'success': False,
                     'error': 'La matriz no es diagonalmente dominante. La convergencia no está garantizada.'
@@ -40,35 +49,43 @@ class JacobiMethod:
                     raise ValueError("El vector inicial debe tener el mismo tamaño que b")
                 x = np.array(initial_guess, dtype=float)
 
+            D, R = diagonal_splitting(A_arr)
+
+            # Buffers de trabajo: x y x_new se intercambian en cada barrido
+            x_new = np.empty(n)
+            Rx = R @ x
+            work = np.empty(n)
+
             iterations = []
             for k in range(iter_val):
-                x_new = np.zeros_like(x)
+                np.subtract(b_arr, Rx, out=x_new)
+                np.divide(x_new, D, out=x_new)
 
-                for i in range(n):
-                    sigma = 0
-                    for j in range(n):
-                        if j != i:
-                            sigma += A_arr[i, j] * x[j]
-                    x_new[i] = (b_arr[i] - sigma) / A_arr[i, i]
+                np.subtract(x_new, x, out=work)
+                error = np.abs(work, out=work).max()
 
-                error = np.linalg.norm(x_new - x, ord=np.inf)
-                residual = np.linalg.norm(np.dot(A_arr, x_new) - b_arr, ord=np.inf)
+                # Ax_new - b = D x_new + R x_new - b; R x_new se reutiliza en el próximo barrido
+                R.dot(x_new, out=Rx)
+                np.multiply(D, x_new, out=work)
+                work += Rx
+                work -= b_arr
+                residual = np.abs(work, out=work).max()
 
                 iterations.append({
                     'Iteración': k + 1,
-                    'x': x_new.copy(),
+                    'x': x_new.copy() if keep_history else None,
                     'Error': error,
                     'Residual': residual
                 })
 
+                x, x_new = x_new, x
+
                 if error < tol_val:
                     break
 
-                x = x_new
-
             return {
                 'success': True,
-                'solution': x_new,
+                'solution': x,
                 'iterations': iterations,
                 'converged': error < tol_val,
                 'final_error': error,
@@ -85,9 +102,4 @@ class JacobiMethod:
 
     def is_diagonally_dominant(self, A):
         """Verifica si la matriz es diagonalmente dominante"""
-        n = A.shape[0]
-        for i in range(n):
-            row_sum = np.sum(np.abs(A[i, :])) - np.abs(A[i, i])
-            if np.abs(A[i, i]) <= row_sum:
-                return False
-        return True
\ No newline at end of file
+        return is_diagonally_dominant(as_matrix(A))
@@ -0,0 +1,82 @@
+import numpy as np
+from modules.validation import InputValidator
+
+class LUDecomposition:
+    def __init__(self):
+        self.validator = InputValidator()
+
+    def solve(self, A, b):
+        """Resuelve Ax = b factorizando PA = LU (pivoteo parcial)"""
+        try:
+            if not isinstance(A, (list, np.ndarray)) or not isinstance(b, (list, np.ndarray)):
+                raise ValueError("A y b deben ser listas o arrays numpy")
+
+            A_arr = np.array(A, dtype=float)
+            b_arr = np.array(b, dtype=float)
+
+            n = len(b_arr)
+
+            if A_arr.shape != (n, n):
+                raise ValueError("La matriz A debe ser cuadrada y coincidir con el tamaño de b")
+
+            lu, piv = self.factor(A_arr)
+            x = self.solve_factored(lu, piv, b_arr)
+            residual = np.linalg.norm(np.dot(A_arr, x) - b_arr)
+
+            return {
+                'success': True,
+                'solution': x,
+                'residual': residual,
+                'L': np.tril(lu, -1) + np.eye(n),
+                'U': np.triu(lu),
+                'permutation': piv,
+                'message': 'Factorización LU completada exitosamente'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @staticmethod
+    def factor(A):
+        """Factorización PA = LU de Doolittle con pivoteo parcial.
+
+        Devuelve (lu, piv): L (diagonal unitaria implícita) y U comparten la matriz lu;
+        piv[i] es la fila de A que ocupa la posición i. Cada paso de eliminación es
+        una actualización de rango uno vectorizada sobre el bloque restante.
+        """
+        lu = np.array(A, dtype=float)
+        n = lu.shape[0]
+        piv = np.arange(n)
+        scale = np.abs(lu).max() if lu.size else 0.0
+
+        for k in range(n):
+            p = k + np.argmax(np.abs(lu[k:, k]))
+            if abs(lu[p, k]) <= 1e-14 * scale or scale == 0:
+                raise ValueError("Sistema singular o mal condicionado")
+            if p != k:
+                lu[[k, p]] = lu[[p, k]]
+                piv[[k, p]] = piv[[p, k]]
+
+            lu[k + 1:, k] /= lu[k, k]
+            lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+
+        return lu, piv
+
+    @staticmethod
+    def solve_factored(lu, piv, b):
+        """Resuelve Ax = b con una factorización de factor (b puede tener varias columnas)"""
+        y = np.array(b, dtype=float)[piv]
+        n = lu.shape[0]
+
+        # Sustitución hacia adelante (L con diagonal unitaria)
+        for i in range(1, n):
+            y[i] -= np.dot(lu[i, :i], y[:i])
+
+        # Sustitución hacia atrás
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - np.dot(lu[i, i + 1:], y[i + 1:])) / lu[i, i]
+
+        return y
@@ -0,0 +1,186 @@
+import numpy as np
+
+
+class CSRMatrix:
+    """Matriz dispersa en formato CSR (filas comprimidas) sobre arrays de numpy.
+
+    indptr[i]:indptr[i + 1] delimita en indices / data las columnas y valores no
+    nulos de la fila i. El producto matriz-vector cuesta O(nnz). Expone shape,
+    dot(x, out=None) y @ como un ndarray, así que los métodos iterativos la usan
+    sin distinguirla de una matriz densa.
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+        if len(self.indptr) != self.shape[0] + 1:
+            raise ValueError("indptr debe tener una entrada más que filas la matriz")
+        if len(self.data) != len(self.indices) or self.indptr[-1] != len(self.data):
+            raise ValueError("data e indices deben tener nnz = indptr[-1] elementos")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= self.shape[1]):
+            raise ValueError("Índice de columna fuera de rango")
+
+        # Fila de cada elemento no nulo: el producto se reduce con np.bincount
+        self._rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    @classmethod
+    def from_triplets(cls, rows, cols, values, shape=None):
+        """Construye la matriz a partir de tripletes (i, j, valor); los repetidos se suman"""
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+        values = np.asarray(values, dtype=float)
+        if not (len(rows) == len(cols) == len(values)):
+            raise ValueError("Los tripletes deben tener la misma cantidad de filas, columnas y valores")
+        if shape is None:
+            shape = (int(rows.max()) + 1, int(cols.max()) + 1) if len(rows) else (0, 0)
+        if len(rows) and (rows.min() < 0 or rows.max() >= shape[0]
+                          or cols.min() < 0 or cols.max() >= shape[1]):
+            raise ValueError("Índice de triplete fuera del tamaño de la matriz")
+
+        # Ordenar por (fila, columna) y sumar duplicados
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        if len(rows):
+            new_entry = np.ones(len(rows), dtype=bool)
+            new_entry[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            starts = np.flatnonzero(new_entry)
+            values = np.add.reduceat(values, starts)
+            rows, cols = rows[starts], cols[starts]
+
+        indptr = np.zeros(shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(values, cols, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype=float)
+        rows, cols = np.nonzero(A)
+        return cls.from_triplets(rows, cols, A[rows, cols], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def nonzero(self):
+        """(filas, columnas) de los elementos almacenados, como np.nonzero"""
+        return self._rows.copy(), self.indices.copy()
+
+    def to_dense(self):
+        dense = np.zeros(self.shape)
+        dense[self._rows, self.indices] = self.data
+        return dense
+
+    def dot(self, x, out=None):
+        """A @ x en O(nnz)"""
+        products = self.data * x[self.indices]
+        result = np.bincount(self._rows, weights=products, minlength=self.shape[0])
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    def __matmul__(self, x):
+        return self.dot(np.asarray(x, dtype=float))
+
+    def diagonal(self):
+        diagonal = np.zeros(min(self.shape))
+        on_diagonal = self._rows == self.indices
+        diagonal[self.indices[on_diagonal]] = self.data[on_diagonal]
+        return diagonal
+
+    def abs_row_sums(self):
+        return np.bincount(self._rows, weights=np.abs(self.data), minlength=self.shape[0])
+
+    def select(self, mask):
+        """Submatriz con los elementos no nulos donde mask es True (misma forma)"""
+        return CSRMatrix.from_triplets(
+            self._rows[mask], self.indices[mask], self.data[mask], self.shape
+        )
+
+    def tril(self, k=0):
+        return self.select(self.indices - self._rows <= k)
+
+    def triu(self, k=0):
+        return self.select(self.indices - self._rows >= k)
+
+    def without_diagonal(self):
+        return self.select(self.indices != self._rows)
+
+    def with_diagonal(self, values):
+        """Copia con la diagonal sustituida por values (se almacena aunque valga 0)"""
+        off = self.indices != self._rows
+        n = min(self.shape)
+        return CSRMatrix.from_triplets(
+            np.concatenate([self._rows[off], np.arange(n)]),
+            np.concatenate([self.indices[off], np.arange(n)]),
+            np.concatenate([self.data[off], np.broadcast_to(values, n)]),
+            self.shape,
+        )
+
+    def reversed(self):
+        """P A P con P la permutación que invierte el orden: triangular superior <-> inferior"""
+        n, m = self.shape
+        return CSRMatrix.from_triplets(n - 1 - self._rows, m - 1 - self.indices, self.data, self.shape)
+
+    def take_rows(self, rows):
+        """Matriz con sólo las filas indicadas (forma len(rows) x columnas)"""
+        rows = np.asarray(rows, dtype=np.intp)
+        counts = self.indptr[rows + 1] - self.indptr[rows]
+        starts = np.repeat(self.indptr[rows], counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = starts + offsets
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.intp)
+        np.cumsum(counts, out=indptr[1:])
+        return CSRMatrix(self.data[positions], self.indices[positions], indptr,
+                         (len(rows), self.shape[1]))
+
+    def transpose(self):
+        return CSRMatrix.from_triplets(self.indices, self._rows, self.data,
+                                       (self.shape[1], self.shape[0]))
+
+    @property
+    def T(self):
+        return self.transpose()
+
+
+class LevelScheduledSubstitution:
+    """Resuelve M x = rhs con M dispersa triangular inferior por niveles.
+
+    El nivel de una fila es uno más que el máximo nivel de las filas de las que
+    depende; las filas de un mismo nivel son independientes y se resuelven de una
+    vez con operaciones vectorizadas (en una malla de 5 puntos en orden natural
+    los niveles son las antidiagonales). Cada resolución cuesta O(nnz).
+    """
+
+    def __init__(self, lower):
+        n = lower.shape[0]
+        diagonal = lower.diagonal()
+        if np.any(diagonal == 0):
+            raise ValueError("La diagonal de A no puede tener ceros")
+        strict = lower.tril(-1)
+
+        # Niveles de dependencia (una pasada secuencial al construir)
+        levels = np.zeros(n, dtype=np.intp)
+        indptr, indices = strict.indptr, strict.indices
+        for i in range(n):
+            start, stop = indptr[i], indptr[i + 1]
+            if stop > start:
+                levels[i] = levels[indices[start:stop]].max() + 1
+
+        self.size = n
+        self.steps = []
+        order = np.argsort(levels, kind="stable")
+        boundaries = np.flatnonzero(np.diff(levels[order])) + 1
+        for rows in np.split(order, boundaries):
+            self.steps.append((rows, strict.take_rows(rows), diagonal[rows]))
+
+    def solve(self, rhs, out=None):
+        if out is None:
+            out = np.empty(self.size)
+        for rows, block, diagonal in self.steps:
+            out[rows] = (rhs[rows] - block.dot(out)) / diagonal
+        return out
@@ -0,0 +1,175 @@
+import numpy as np
+from modules.linear_systems.sparse import CSRMatrix, LevelScheduledSubstitution
+
+# Todas las funciones aceptan un ndarray denso o una CSRMatrix; el resultado
+# conserva el formato de A.
+
+
+def as_matrix(A):
+    """CSRMatrix tal cual; cualquier otra entrada como ndarray float"""
+    if isinstance(A, CSRMatrix):
+        return A
+    return np.array(A, dtype=float)
+
+
+def diagonal(A):
+    return A.diagonal() if isinstance(A, CSRMatrix) else np.diag(A).copy()
+
+
+def diagonal_splitting(A):
+    """Separa A = D + R (diagonal y resto) una sola vez para los métodos iterativos.
+
+    Devuelve (D, R) con D como vector y R como matriz de diagonal nula, de modo
+    que cada barrido de Jacobi sea un único producto matriz-vector R @ x.
+    """
+    if isinstance(A, CSRMatrix):
+        return A.diagonal(), A.without_diagonal()
+    D = np.diag(A).copy()
+    R = np.array(A, dtype=float)
+    np.fill_diagonal(R, 0.0)
+    return D, R
+
+
+def is_diagonally_dominant(A):
+    """|a_ii| > sum_(j != i) |a_ij| en todas las filas"""
+    diag = np.abs(diagonal(A))
+    row_sums = A.abs_row_sums() if isinstance(A, CSRMatrix) else np.abs(A).sum(axis=1)
+    return bool(np.all(diag > row_sums - diag))
+
+
+def triangular_splitting(A):
+    """Separa A = M + N con M = D + L (triangular inferior) y N = U (estrictamente superior)"""
+    if isinstance(A, CSRMatrix):
+        return A.tril(), A.triu(1)
+    A = np.asarray(A, dtype=float)
+    return np.tril(A), np.triu(A, 1)
+
+
+def relaxed_splitting(A, omega):
+    """A = M + N para SOR: M = D/ω + L (inferior), N = (1 - 1/ω) D + U. Con ω = 1 es Gauss-Seidel"""
+    D = diagonal(A)
+    if isinstance(A, CSRMatrix):
+        return A.tril().with_diagonal(D / omega), A.triu(1).with_diagonal((1 - 1 / omega) * D)
+    M, N = triangular_splitting(A)
+    np.fill_diagonal(M, D / omega)
+    np.fill_diagonal(N, (1 - 1 / omega) * D)
+    return M, N
+
+
+def backward_splitting(A, omega):
+    """Splitting del barrido hacia atrás de SSOR: M = D/ω + U (superior), N = (1 - 1/ω) D + L"""
+    D = diagonal(A)
+    if isinstance(A, CSRMatrix):
+        return A.triu().with_diagonal(D / omega), A.tril(-1).with_diagonal((1 - 1 / omega) * D)
+    A = np.asarray(A, dtype=float)
+    M, N = np.triu(A), np.tril(A, -1)
+    np.fill_diagonal(M, D / omega)
+    np.fill_diagonal(N, (1 - 1 / omega) * D)
+    return M, N
+
+
+def forward_substitution(lower):
+    """Resolvedor de M x = rhs adecuado al formato de M (bloques densos o niveles CSR)"""
+    if isinstance(lower, CSRMatrix):
+        return LevelScheduledSubstitution(lower)
+    return ForwardSubstitution(lower)
+
+
+class BackwardSubstitution:
+    """Resuelve M x = rhs con M triangular superior invirtiendo el orden de las
+    incógnitas, que la convierte en triangular inferior"""
+
+    def __init__(self, upper):
+        if isinstance(upper, CSRMatrix):
+            self.lower = forward_substitution(upper.reversed())
+        else:
+            self.lower = forward_substitution(np.asarray(upper)[::-1, ::-1])
+        self._work = np.empty(upper.shape[0])
+
+    def solve(self, rhs, out=None):
+        self.lower.solve(rhs[::-1].copy(), out=self._work)
+        if out is None:
+            return self._work[::-1].copy()
+        out[...] = self._work[::-1]
+        return out
+
+
+def take_rows(A, rows):
+    """Filas de A como matriz contigua (densa) o CSR"""
+    if isinstance(A, CSRMatrix):
+        return A.take_rows(rows)
+    return np.ascontiguousarray(A[rows])
+
+
+class ForwardSubstitution:
+    """Resuelve M x = rhs con M triangular inferior, por bloques.
+
+    Al construirse guarda, para cada bloque de filas, la inversa del bloque
+    diagonal y el panel M[bloque, :inicio] a su izquierda (copia contigua). Cada
+    resolución son entonces dos productos matriz-vector por bloque, en lugar de
+    un np.dot sobre cortes nuevos por cada fila.
+    """
+
+    def __init__(self, lower, block_size=64):
+        lower = np.asarray(lower, dtype=float)
+        n = lower.shape[0]
+        self.size = n
+        self.blocks = []
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            inverse = np.linalg.inv(lower[start:stop, start:stop])
+            panel = np.ascontiguousarray(lower[start:stop, :start])
+            self.blocks.append((start, stop, inverse, panel))
+        self._work = np.empty(min(block_size, n))
+
+    def solve(self, rhs, out=None):
+        if out is None:
+            out = np.empty(self.size)
+        for start, stop, inverse, panel in self.blocks:
+            work = self._work[:stop - start]
+            if start:
+                np.dot(panel, out[:start], out=work)
+                np.subtract(rhs[start:stop], work, out=work)
+            else:
+                work[...] = rhs[start:stop]
+            np.dot(inverse, work, out=out[start:stop])
+        return out
+
+
+def greedy_coloring(A):
+    """Colorea las incógnitas para que ningún par acoplado (a_ij != 0) comparta color.
+
+    Devuelve una lista de arrays de índices, uno por color. En una malla con
+    estencil de 5 puntos resultan dos colores: el ordenamiento rojo-negro.
+    """
+    n = A.shape[0]
+    if isinstance(A, CSRMatrix):
+        # Vecinos de i: columnas no nulas de la fila i en A y en Aᵀ
+        rows, cols = A.nonzero()
+        pattern = CSRMatrix.from_triplets(
+            np.concatenate([rows, cols]), np.concatenate([cols, rows]),
+            np.ones(2 * A.nnz), A.shape,
+        )
+        neighbors = [pattern.indices[pattern.indptr[i]:pattern.indptr[i + 1]] for i in range(n)]
+    else:
+        A = np.asarray(A)
+        coupled = (A != 0) | (A.T != 0)
+        neighbors = [np.flatnonzero(row) for row in coupled]
+
+    colors = np.full(n, -1)
+    for i in range(n):
+        used = colors[neighbors[i]]
+        color = 0
+        while color in used:
+            color += 1
+        colors[i] = color
+
+    return [np.flatnonzero(colors == c) for c in range(colors.max() + 1)] if n else []
+
+
+def is_symmetric(A, rtol=1e-10, seed=0):
+    """Prueba A = Aᵀ sólo con productos matriz-vector: yᵀ(A x) = xᵀ(A y) para x, y aleatorios"""
+    rng = np.random.default_rng(seed)
+    x, y = rng.standard_normal((2, A.shape[0]))
+    yAx, xAy = y @ A.dot(x), x @ A.dot(y)
+    return bool(abs(yAx - xAy) <= rtol * max(abs(yAx), abs(xAy), 1.0))
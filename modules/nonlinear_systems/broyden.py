@@ -0,0 +1,75 @@
+import numpy as np
+from modules.linear_systems.lu_decomposition import LUDecomposition
+from modules.nonlinear_systems.newton_system import NewtonSystemMethod
+
+class BroydenMethod(NewtonSystemMethod):
+    def solve(self, equations, variables, initial_guess, tolerance, max_iterations):
+        """Método cuasi-Newton de Broyden ("bueno") para sistemas no lineales F(x) = 0.
+
+        El jacobiano se evalúa y factoriza (LU) sólo al inicio; a partir de ahí la
+        inversa aproximada H ≈ J⁻¹ se corrige con actualizaciones de rango uno
+        (Sherman-Morrison), O(n²) por iteración en lugar de evaluar J y refactorizar.
+        Si la actualización se degenera se vuelve a evaluar el jacobiano.
+        """
+        try:
+            system, x, tol_val, iter_val = self._prepare(
+                equations, variables, initial_guess, tolerance, max_iterations
+            )
+            F = system['function']
+            J = system['jacobian_function']
+
+            fx = F(x)
+            H = self._inverse_jacobian(J, x)
+            function_calls, jacobian_evaluations = 1, 1
+            iterations = []
+            error = np.inf
+
+            # Una actualización degenerada puede desbordar H: se detecta en F(x) no finita
+            with np.errstate(over='ignore', invalid='ignore'):
+                for k in range(iter_val):
+                    s = -H @ fx
+                    x = x + s
+                    fx_new = F(x)
+                    function_calls += 1
+                    if not np.all(np.isfinite(fx_new)):
+                        raise ValueError("La iteración divergió: pruebe con otro vector inicial")
+
+                    error = np.linalg.norm(s, ord=np.inf)
+                    residual = np.linalg.norm(fx_new, ord=np.inf)
+
+                    iterations.append({
+                        'Iteración': k + 1,
+                        'x': x.copy(),
+                        'Error': error,
+                        'Residual': residual
+                    })
+
+                    if error < tol_val or residual < tol_val:
+                        fx = fx_new
+                        break
+
+                    # H <- H + (s - H y) sᵀH / (sᵀ H y), con y = F(x_new) - F(x)
+                    Hy = H @ (fx_new - fx)
+                    denominator = s @ Hy
+                    if abs(denominator) <= 1e-14 * np.linalg.norm(s) * np.linalg.norm(Hy):
+                        H = self._inverse_jacobian(J, x)
+                        jacobian_evaluations += 1
+                    else:
+                        H += np.outer(s - Hy, s @ H) / denominator
+                    fx = fx_new
+
+            return self._result(x, fx, iterations, error, tol_val,
+                                function_calls, jacobian_evaluations)
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @staticmethod
+    def _inverse_jacobian(J, x):
+        """J(x)⁻¹ a partir de su factorización LU"""
+        jx = J(x)
+        lu, piv = LUDecomposition.factor(jx)
+        return LUDecomposition.solve_factored(lu, piv, np.eye(jx.shape[0]))
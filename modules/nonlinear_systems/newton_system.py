@@ -0,0 +1,112 @@
+import numpy as np
+from modules.equation_parser import EquationParser
+from modules.linear_systems.lu_decomposition import LUDecomposition
+from modules.validation import InputValidator
+
+class NewtonSystemMethod:
+    def __init__(self):
+        self.parser = EquationParser()
+        self.validator = InputValidator()
+
+    def solve(self, equations, variables, initial_guess, tolerance, max_iterations):
+        """Método de Newton para sistemas no lineales F(x) = 0.
+
+        Cada iteración evalúa F y el jacobiano J (compilados una vez con CSE por
+        parse_system y guardados en la caché de expresiones) y resuelve J dx = -F
+        con una factorización LU.
+        """
+        try:
+            system, x, tol_val, iter_val = self._prepare(
+                equations, variables, initial_guess, tolerance, max_iterations
+            )
+            F = system['function']
+            J = system['jacobian_function']
+
+            fx = F(x)
+            function_calls, jacobian_evaluations = 1, 0
+            iterations = []
+            error = np.inf
+
+            for k in range(iter_val):
+                jx = J(x)
+                jacobian_evaluations += 1
+
+                lu, piv = LUDecomposition.factor(jx)
+                dx = LUDecomposition.solve_factored(lu, piv, -fx)
+                x = x + dx
+                fx = F(x)
+                function_calls += 1
+                if not np.all(np.isfinite(fx)):
+                    raise ValueError("La iteración divergió: pruebe con otro vector inicial")
+
+                error = np.linalg.norm(dx, ord=np.inf)
+                residual = np.linalg.norm(fx, ord=np.inf)
+
+                iterations.append({
+                    'Iteración': k + 1,
+                    'x': x.copy(),
+                    'Error': error,
+                    'Residual': residual
+                })
+
+                if error < tol_val or residual < tol_val:
+                    break
+
+            return self._result(x, fx, iterations, error, tol_val,
+                                function_calls, jacobian_evaluations)
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def _prepare(self, equations, variables, initial_guess, tolerance, max_iterations):
+        """Valida las entradas y parsea el sistema; devuelve (sistema, x0, tolerancia, iteraciones)"""
+        if isinstance(equations, str):
+            equations = [eq for eq in equations.replace(';', '\n').split('\n') if eq.strip()]
+        if isinstance(variables, str):
+            variables = variables.replace(',', ' ').split()
+
+        equations, variables = list(equations), list(variables)
+        if not variables:
+            raise ValueError("Debe indicar las incógnitas del sistema")
+        if len(equations) != len(variables):
+            raise ValueError(
+                f"El sistema tiene {len(equations)} ecuaciones y {len(variables)} incógnitas"
+            )
+
+        if initial_guess is None:
+            x0 = np.zeros(len(variables))
+        else:
+            if len(initial_guess) != len(variables):
+                raise ValueError("El vector inicial debe tener una componente por incógnita")
+            x0 = np.array(initial_guess, dtype=float)
+
+        valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+        if not valid_tol:
+            raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+        valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+        if not valid_iter:
+            raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+        system = self.parser.parse_system(equations, variables)
+        return system, x0, tol_val, iter_val
+
+    @staticmethod
+    def _result(x, fx, iterations, error, tolerance, function_calls, jacobian_evaluations):
+        residual = np.linalg.norm(fx, ord=np.inf)
+
+        return {
+            'success': True,
+            'solution': x,
+            'iterations': iterations,
+            'converged': error < tolerance or residual < tolerance,
+            'final_error': error,
+            'final_residual': residual,
+            'iterations_count': len(iterations),
+            'function_calls': function_calls,
+            'jacobian_evaluations': jacobian_evaluations,
+            'message': 'Método completado exitosamente'
+        }
@@ -13,7 +13,7 @@ class InteractivePlotter:
         try:
             # Crear puntos para la función
             x = np.linspace(x_range[0], x_range[1], 1000)
-            y = equation_data['numpy_function'](x)
+            y = equation_data['vector_function'](x)
 
             fig = go.Figure()
 
@@ -25,8 +25,8 @@ class InteractivePlotter:
                 line=dict(color=self.colors[0], width=2)
             ))
 
-            # Graficar raíz encontrada
-            if root_data.get('root') is not None:
+            # Graficar raíz encontrada (una raíz compleja no tiene lugar en el eje x)
+            if root_data.get('root') is not None and np.imag(root_data['root']) == 0:
                 fig.add_trace(go.Scatter(
                     x=[root_data['root']], y=[0],
                     mode='markers',
@@ -34,6 +34,19 @@ class InteractivePlotter:
                     marker=dict(color='red', size=10, symbol='x')
                 ))
 
+            # Todas las raíces (búsqueda global, polinomios); sólo las reales van al eje x
+            roots = root_data.get('roots')
+            real_roots = []
+            if isinstance(roots, list):
+                real_roots = [np.real(root) for root in roots if np.imag(root) == 0]
+            if real_roots:
+                fig.add_trace(go.Scatter(
+                    x=real_roots, y=[0] * len(real_roots),
+                    mode='markers',
+                    name='Raíces',
+                    marker=dict(color='red', size=10, symbol='x')
+                ))
+
             # Graficar iteraciones si están disponibles
             if root_data.get('iterations'):
                 iterations = root_data['iterations']
@@ -42,8 +55,8 @@ class InteractivePlotter:
                 for iter in iterations:
                     if 'c' in iter:  # Bisección, falsa posición
                         iter_points.append((iter['c'], 0))
-                    elif 'x_new' in iter:  # Newton, secante
-                        iter_points.append((iter['x_new'], 0))
+                    elif 'x_new' in iter and np.imag(iter['x_new']) == 0:  # Newton, secante
+                        iter_points.append((np.real(iter['x_new']), 0))
 
                 if iter_points:
                     iter_x, iter_y = zip(*iter_points)
@@ -80,7 +93,7 @@ class InteractivePlotter:
         try:
             # Crear puntos para la función
             x_dense = np.linspace(a, b, 1000)
-            y_dense = equation_data['numpy_function'](x_dense)
+            y_dense = equation_data['vector_function'](x_dense)
 
             fig = go.Figure()
 
@@ -196,4 +209,67 @@ class InteractivePlotter:
             fig.add_annotation(text=f"Error al generar gráfica: {str(e)}",
                                xref="paper", yref="paper", x=0.5, y=0.5,
                                showarrow=False)
-            return fig
\ No newline at end of file
+            return fig
+
+    def plot_basins(self, basin_data):
+        """Mapa de cuencas de atracción de Newton multi-inicio (NewtonRaphsonMethod.solve_multistart)"""
+        try:
+            starts = np.asarray(basin_data['starts'])
+            labels = np.asarray(basin_data['labels'])
+            iterations = np.asarray(basin_data['iterations_count'])
+            cluster_roots = basin_data['cluster_roots']
+
+            if starts.ndim == 1:
+                # Inicios reales: una sola fila sobre el eje x
+                x, y = starts.real, [0]
+                labels, iterations = labels[None, :], iterations[None, :]
+            else:
+                x, y = starts.real[0, :], starts.imag[:, 0]
+
+            # Escala discreta: un color por raíz, los no convergidos (nan) quedan en blanco
+            n_roots = max(len(cluster_roots), 1)
+            colorscale = []
+            for k in range(n_roots):
+                color = self.colors[k % len(self.colors)]
+                colorscale += [[k / n_roots, color], [(k + 1) / n_roots, color]]
+
+            z = np.where(labels >= 0, labels, np.nan).astype(float)
+
+            fig = go.Figure()
+            fig.add_trace(go.Heatmap(
+                x=x, y=y, z=z,
+                zmin=-0.5, zmax=n_roots - 0.5,
+                colorscale=colorscale,
+                customdata=iterations,
+                hovertemplate="x₀ = %{x:.4f} %{y:+.4f}i<br>raíz #%{z}<br>"
+                              "iteraciones: %{customdata}<extra></extra>",
+                colorbar=dict(
+                    title="Raíz",
+                    tickvals=list(range(len(cluster_roots))),
+                    ticktext=[f"{root:.4g}" for root in cluster_roots]
+                )
+            ))
+
+            if cluster_roots:
+                fig.add_trace(go.Scatter(
+                    x=[np.real(root) for root in cluster_roots],
+                    y=[np.imag(root) for root in cluster_roots],
+                    mode='markers',
+                    name='Raíces',
+                    marker=dict(color='black', size=10, symbol='x')
+                ))
+
+            fig.update_layout(
+                title="Cuencas de atracción - Newton multi-inicio",
+                xaxis_title="Re(x₀)",
+                yaxis_title="Im(x₀)" if starts.ndim > 1 else "",
+            )
+
+            return fig
+
+        except Exception as e:
+            fig = go.Figure()
+            fig.add_annotation(text=f"Error al generar gráfica: {str(e)}",
+                               xref="paper", yref="paper", x=0.5, y=0.5,
+                               showarrow=False)
+            return fig
@@ -0,0 +1,124 @@
+# modules/root_finding/acceleration.py
+# Aceleración de sucesiones que convergen linealmente (Aitken Δ², Steffensen) y
+# estimación de la multiplicidad de una raíz a partir de la razón de convergencia.
+import math
+
+# Claves con el nuevo iterado en las tablas de iteraciones de cada método
+ITERATE_KEYS = ('x_new', 'c', 'x2')
+
+
+def aitken_delta2(x0, x1, x2):
+    """Extrapolación Δ² de Aitken de tres iterados consecutivos (x2 si no es aplicable)"""
+    denominator = x2 - 2 * x1 + x0
+    if denominator == 0:
+        return x2
+    return x2 - (x2 - x1) ** 2 / denominator
+
+
+def aitken_sequence(values):
+    """Aplica Aitken Δ² a cada terna consecutiva de la sucesión"""
+    return [aitken_delta2(*values[k:k + 3]) for k in range(len(values) - 2)]
+
+
+def iterates(result):
+    """Sucesión de iterados de un resultado de cualquier método de modules.root_finding"""
+    values = []
+    for row in result.get('iterations', []):
+        for key in ITERATE_KEYS:
+            if key in row:
+                values.append(row[key])
+                break
+    return values
+
+
+def accelerate_result(result):
+    """Raíz extrapolada con Aitken a partir de la tabla de iteraciones de un método.
+
+    Sólo se extrapola si la sucesión converge linealmente con razón estable; con
+    convergencia cuadrática o con los últimos pasos en el nivel del redondeo
+    Aitken no mejora el último iterado y se devuelve éste.
+    """
+    values = iterates(result)
+    if len(values) < 3:
+        return {'accelerated_root': values[-1] if values else None, 'sequence': values}
+    sequence = aitken_sequence(values)
+    ratio = convergence_ratio(values)
+    linear = ratio is not None and ratio >= 0.1
+    return {'accelerated_root': sequence[-1] if linear else values[-1], 'sequence': sequence}
+
+
+def convergence_ratio(values, window=3):
+    """Razón q de convergencia lineal |Δx_k+1| / |Δx_k|, o None si aún no es estable.
+
+    Se consideran estables las últimas `window` razones si difieren menos de 0.05.
+    Con convergencia cuadrática la razón tiende a 0.
+    """
+    steps = [abs(b - a) for a, b in zip(values, values[1:])]
+    ratios = [b / a for a, b in zip(steps, steps[1:]) if a > 0]
+    if len(ratios) < window:
+        return None
+    recent = ratios[-window:]
+    if max(recent) - min(recent) > 0.05:
+        return None
+    return sum(recent) / window
+
+
+def multiplicity_from_ratio(ratio):
+    """Newton en una raíz de multiplicidad m converge con razón (m - 1) / m"""
+    if ratio is None or not 0 <= ratio < 1:
+        return 1
+    return max(1, round(1 / (1 - ratio)))
+
+
+def multiplicity_from_newton(newton_step, x, window=3):
+    """Multiplicidad de la raíz cercana a x a partir de unos pocos pasos de Newton desde x.
+
+    newton_step(x) devuelve f(x) / f'(x). Es el mismo estimador por razón de
+    convergencia que usa Newton-Raphson, aplicado a una sucesión corta, para los
+    métodos cuyos iterados convergen cuadráticamente aunque la raíz sea múltiple.
+    """
+    values = [x]
+    for _ in range(window + 1):
+        step = newton_step(values[-1])
+        if step == 0 or not math.isfinite(abs(step)):
+            break
+        values.append(values[-1] - step)
+    return multiplicity_from_ratio(convergence_ratio(values, window))
+
+
+def steffensen(g, x0, tolerance, max_iterations, max_relative_jump=0.5):
+    """Iteración de punto fijo x = g(x) acelerada con Steffensen (Aitken sobre cada terna).
+
+    Devuelve (x, iteraciones, convergió, evaluaciones de g). Con g el paso de Newton
+    recupera convergencia cuadrática en raíces múltiples. Lejos del punto fijo la
+    extrapolación no es fiable (con razón cercana a 1 salta a otro punto fijo o a
+    un punto crítico): si mueve g(g(x)) más de max_relative_jump * max(1, |g(g(x))|)
+    se descarta y se toma g(g(x)).
+    """
+    x = x0
+    iterations = []
+    calls = 0
+
+    for i in range(max_iterations):
+        x1 = g(x)
+        x2 = g(x1)
+        calls += 2
+        x_new = aitken_delta2(x, x1, x2)
+        if abs(x_new - x2) > max_relative_jump * max(1.0, abs(x2)):
+            x_new = x2
+        error = abs(x_new - x)
+
+        iterations.append({
+            'Iteración': i + 1,
+            'x': x,
+            'g(x)': x1,
+            'g(g(x))': x2,
+            'x_new': x_new,
+            'Error': error
+        })
+
+        if error < tolerance:
+            return x_new, iterations, True, calls
+        x = x_new
+
+    return x, iterations, False, calls
@@ -0,0 +1,214 @@
+import numpy as np
+from modules.equation_parser import EquationParser
+from modules.root_finding.bracketing import bisect_brackets
+from modules.validation import InputValidator
+
+# Razón áurea inversa para la búsqueda de mínimos de |f|
+_INV_PHI = (np.sqrt(5) - 1) / 2
+
+
+class AllRootsFinder:
+    def __init__(self):
+        self.parser = EquationParser()
+        self.validator = InputValidator()
+
+    def find_all_roots(self, equation_str, a, b, tolerance=1e-10, samples=1000,
+                       max_iterations=200, refinements=3):
+        """Busca todas las raíces reales en [a, b] sin que el usuario elija intervalos.
+
+        1. Muestrea f en una malla uniforme con una sola llamada vectorizada.
+        2. Refina la malla donde |f| tiene un mínimo local sin cambio de signo o donde
+           las muestras sugieren un polo (|f| crece hacia un cambio de signo, valores
+           no finitos).
+        3. Refina a la vez todos los cambios de signo con bisección por lotes y todos
+           los mínimos cercanos a cero (raíces de multiplicidad par) con sección áurea.
+        4. Descarta polos y elimina raíces duplicadas.
+        """
+        try:
+            valid_interval, (a_val, b_val) = self.validator.validate_interval(str(a), str(b))
+            if not valid_interval:
+                raise ValueError(f"Intervalo inválido: {a_val}")
+
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_samples, samples_val = self.validator.validate_positive_integer(str(samples), 3)
+            if not valid_samples:
+                raise ValueError(f"Número de muestras inválido: {samples_val}")
+
+            result = self.parser.parse_equation(equation_str, ['x'])
+            f = result['vector_function']
+
+            # Polos y bordes del dominio producen inf/nan esperados durante el barrido
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                roots, kinds, poles, samples_used, function_calls = self._scan(
+                    f, a_val, b_val, tol_val, samples_val, max_iterations, refinements
+                )
+                values = f(roots) if roots.size else roots
+
+            return {
+                'success': True,
+                'roots': roots.tolist(),
+                'function_values': np.asarray(values).tolist(),
+                'kinds': kinds,
+                'poles': sorted(float(p) for p in poles),
+                'samples': samples_used,
+                'function_calls': function_calls + roots.size,
+                'message': f'Se encontraron {roots.size} raíces en [{a_val}, {b_val}]'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'roots': []
+            }
+
+    def _scan(self, f, a_val, b_val, tol_val, samples_val, max_iterations, refinements):
+        """Barrido, refinamiento y pulido; devuelve (raíces, tipos, polos, muestras, llamadas)"""
+        x = np.linspace(a_val, b_val, samples_val)
+        y = f(x)
+        function_calls = x.size
+
+        for _ in range(refinements):
+            flagged = self._suspicious_intervals(y)
+            if not flagged.any():
+                break
+            x, y, calls = self._refine(f, x, y, flagged)
+            function_calls += calls
+
+        finite = np.isfinite(y)
+        roots, kinds = [], []
+
+        # Muestras que ya son raíces exactas
+        exact = finite & (y == 0)
+        roots.extend(x[exact])
+        kinds.extend(['muestra exacta'] * int(exact.sum()))
+
+        # Cambios de signo: se refinan todos juntos
+        sign_change = np.flatnonzero(finite[:-1] & finite[1:] & (y[:-1] * y[1:] < 0))
+        poles = []
+        if sign_change.size:
+            batch = bisect_brackets(f, x[sign_change], x[sign_change + 1], tol_val, max_iterations)
+            function_calls += batch['function_calls']
+            candidates = batch['roots']
+            f_candidates = f(candidates)
+            function_calls += candidates.size
+
+            # En un polo |f| crece al acercarse; en una raíz decrece
+            f_ends = np.minimum(np.abs(y[sign_change]), np.abs(y[sign_change + 1]))
+            is_root = (np.abs(f_candidates) < tol_val) | (np.abs(f_candidates) <= f_ends)
+            roots.extend(candidates[is_root])
+            kinds.extend(['cambio de signo'] * int(is_root.sum()))
+            poles.extend(candidates[~is_root])
+
+        # Mínimos locales de |f| sin cambio de signo: posibles raíces tangentes
+        minima = self._near_zero_minima(y)
+        if minima.size:
+            x_min, f_min, calls = self._golden_minimize(
+                f, x[minima - 1], x[minima + 1], tol_val, max_iterations
+            )
+            function_calls += calls
+            touches = np.abs(f_min) < tol_val
+            roots.extend(x_min[touches])
+            kinds.extend(['mínimo tangente'] * int(touches.sum()))
+
+        roots, kinds = self._deduplicate(
+            np.array(roots, dtype=float), kinds,
+            max(10 * tol_val, 1e-8 * max(1.0, abs(a_val), abs(b_val)))
+        )
+        # + 0.0 normaliza -0.0
+        return roots + 0.0, kinds, poles, int(x.size), int(function_calls)
+
+    @staticmethod
+    def _suspicious_intervals(y):
+        """Marca los subintervalos [x_i, x_i+1] que conviene muestrear con más detalle"""
+        abs_y = np.abs(y)
+        finite = np.isfinite(y)
+        # Borde del dominio (una muestra finita y la otra no)
+        flagged = finite[:-1] ^ finite[1:]
+
+        # Mínimo local de |f| sin cambio de signo: refinar a ambos lados
+        interior = np.zeros_like(finite)
+        interior[1:-1] = (
+            finite[1:-1] & (abs_y[1:-1] <= abs_y[:-2]) & (abs_y[1:-1] <= abs_y[2:])
+            & (y[1:-1] * y[:-2] > 0) & (y[1:-1] * y[2:] > 0)
+        )
+        flagged |= interior[:-1] | interior[1:]
+
+        # Cambio de signo con |f| creciendo hacia el hueco: posible polo
+        if y.size >= 4:
+            sign_change = y[:-1] * y[1:] < 0
+            grows = np.zeros_like(sign_change)
+            grows[1:-1] = (abs_y[1:-2] > abs_y[:-3]) & (abs_y[2:-1] > abs_y[3:])
+            flagged |= sign_change & grows
+
+        return flagged
+
+    @staticmethod
+    def _refine(f, x, y, flagged, points=8):
+        """Inserta puntos equiespaciados en los subintervalos marcados (una sola evaluación)"""
+        left = x[:-1][flagged]
+        width = x[1:][flagged] - left
+        t = np.linspace(0, 1, points + 2)[1:-1]
+        new_x = (left[:, None] + width[:, None] * t).ravel()
+        new_y = f(new_x)
+
+        merged_x = np.concatenate([x, new_x])
+        order = np.argsort(merged_x, kind='stable')
+        return merged_x[order], np.concatenate([y, new_y])[order], new_x.size
+
+    @staticmethod
+    def _near_zero_minima(y):
+        """Índices de mínimos locales estrictos de |f| sin cambio de signo alrededor"""
+        if y.size < 3:
+            return np.array([], dtype=int)
+        abs_y = np.abs(y)
+        mid = slice(1, -1)
+        is_min = (
+            np.isfinite(y[mid]) & (y[mid] != 0)
+            & (abs_y[mid] <= abs_y[:-2]) & (abs_y[mid] < abs_y[2:])
+            & (y[mid] * y[:-2] > 0) & (y[mid] * y[2:] > 0)
+        )
+        return np.flatnonzero(is_min) + 1
+
+    @staticmethod
+    def _golden_minimize(f, lo, hi, tolerance, max_iterations):
+        """Sección áurea vectorizada de |f| sobre todos los intervalos [lo, hi] a la vez"""
+        lo, hi = lo.astype(float), hi.astype(float)
+        c = hi - _INV_PHI * (hi - lo)
+        d = lo + _INV_PHI * (hi - lo)
+        fc, fd = np.abs(f(c)), np.abs(f(d))
+        calls = 2 * lo.size
+
+        for _ in range(max_iterations):
+            if np.all(hi - lo < tolerance):
+                break
+            left = fc < fd
+            hi = np.where(left, d, hi)
+            lo = np.where(left, lo, c)
+
+            # Se reutiliza el punto interior que sigue dentro del intervalo
+            c_old, d_old, fc_old, fd_old = c, d, fc, fd
+            c = np.where(left, hi - _INV_PHI * (hi - lo), d_old)
+            d = np.where(left, c_old, lo + _INV_PHI * (hi - lo))
+            f_new = np.abs(f(np.where(left, c, d)))
+            calls += lo.size
+            fc = np.where(left, f_new, fd_old)
+            fd = np.where(left, fc_old, f_new)
+
+        x_min = np.where(fc < fd, c, d)
+        return x_min, f(x_min), calls + lo.size
+
+    @staticmethod
+    def _deduplicate(roots, kinds, distance):
+        """Ordena y fusiona raíces más cercanas que distance"""
+        if roots.size == 0:
+            return roots, []
+        order = np.argsort(roots)
+        roots = roots[order]
+        kinds = [kinds[i] for i in order]
+
+        keep = np.concatenate([[True], np.diff(roots) > distance])
+        return roots[keep], [kind for kind, k in zip(kinds, keep) if k]
@@ -1,5 +1,7 @@
 import numpy as np
 from modules.equation_parser import EquationParser
+from modules.evaluation import MemoizedFunction, broadcast_parameters
+from modules.root_finding.bracketing import bisect_brackets
 from modules.validation import InputValidator
 
 
@@ -26,7 +28,7 @@ class BisectionMethod:
 
             # Parsear ecuación
             result = self.parser.parse_equation(equation_str, ['x'])
-            f = result['numpy_function']
+            f = MemoizedFunction(result['scalar_function'])
 
             # Verificar condiciones
             fa, fb = f(a_val), f(b_val)
@@ -67,7 +69,7 @@ class BisectionMethod:
                 'iterations': iterations,
                 'converged': abs(fc) < tol_val,
                 'final_error': abs(b_current - a_current) / 2,
-                'function_calls': len(iterations) + 2,  # f(a), f(b) inicial + f(c) en cada iteración
+                'function_calls': f.calls,
                 'message': 'Método completado exitosamente'
             }
 
@@ -77,4 +79,75 @@ class BisectionMethod:
                 'error': str(e),
                 'root': None,
                 'iterations': []
-            }
\ No newline at end of file
+            }
+
+    def solve_many(self, equation_str, a, b, tolerance, max_iterations):
+        """Bisección sobre muchos intervalos de la misma función a la vez.
+
+        a, b y tolerance pueden ser arrays (una tolerancia por intervalo). Devuelve
+        arrays de raíces, iteraciones y banderas de convergencia con la forma común.
+        """
+        try:
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            result = self.parser.parse_equation(equation_str, ['x'])
+
+            batch = bisect_brackets(result['vector_function'], a, b, tolerance, iter_val)
+            batch.update({
+                'success': True,
+                'message': self._batch_message(batch)
+            })
+            return batch
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'roots': None
+            }
+
+    def solve_batch(self, equation_str, a, b, tolerance, max_iterations, parameters):
+        """Bisección vectorizada sobre una malla de parámetros.
+
+        parameters: {nombre: valores}, p. ej. {'a': A, 'b': B} para "x^3 - a*x + b".
+        La ecuación se parsea una sola vez y cada iteración evalúa todos los
+        parámetros en una sola llamada vectorizada.
+        """
+        try:
+            valid_interval, (a_val, b_val) = self.validator.validate_interval(str(a), str(b))
+            if not valid_interval:
+                raise ValueError(f"Intervalo inválido: {a_val}")
+
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            names, param_arrays, shape = broadcast_parameters(parameters)
+            result = self.parser.parse_equation(equation_str, ['x'], names)
+
+            batch = bisect_brackets(result['vector_function'], a_val, b_val,
+                                    tol_val, iter_val, param_arrays)
+            batch.update({
+                'success': True,
+                'parameters': dict(zip(names, param_arrays)),
+                'message': self._batch_message(batch)
+            })
+            return batch
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'roots': None
+            }
+
+    @staticmethod
+    def _batch_message(batch):
+        converged = batch['converged']
+        return f'{int(converged.sum())} de {converged.size} casos convergieron'
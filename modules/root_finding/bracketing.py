@@ -0,0 +1,82 @@
+# modules/root_finding/bracketing.py
+import numpy as np
+
+
+def bisect_brackets(f, a, b, tolerance, max_iterations, parameters=()):
+    """Bisección por lotes: avanza todos los intervalos [a, b] a la vez con NumPy.
+
+    f es una función vectorizada f(x, *parámetros). a, b, tolerance y cada parámetro
+    pueden ser escalares o arrays compatibles por difusión; el resultado tiene la
+    forma común. En cada iteración sólo se evalúan los intervalos que siguen activos:
+    los convergidos se eliminan de los arrays de trabajo (compactación), de modo que
+    el coste decae con el número de intervalos pendientes.
+
+    Los intervalos sin cambio de signo, invertidos o no finitos se marcan en
+    valid_bracket y su raíz queda en nan.
+    """
+    arrays = np.broadcast_arrays(
+        np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+        np.asarray(tolerance, dtype=float), *(np.asarray(p) for p in parameters)
+    )
+    shape = arrays[0].shape
+    a_flat, b_flat, tol_flat = (np.ravel(array) for array in arrays[:3])
+    params_flat = [np.ravel(array) for array in arrays[3:]]
+    size = a_flat.size
+
+    if np.any(tol_flat <= 0):
+        raise ValueError("Las tolerancias deben ser positivas")
+
+    roots = np.full(size, np.nan)
+    iterations = np.zeros(size, dtype=int)
+    converged = np.zeros(size, dtype=bool)
+
+    fa = np.asarray(f(a_flat, *params_flat), dtype=float).reshape(size)
+    fb = np.asarray(f(b_flat, *params_flat), dtype=float).reshape(size)
+    function_calls = 2 * size
+
+    valid = np.isfinite(a_flat) & np.isfinite(b_flat) & (a_flat < b_flat) & (fa * fb <= 0)
+
+    # Un extremo que ya es raíz exacta no necesita iterar
+    for endpoint, f_endpoint in ((a_flat, fa), (b_flat, fb)):
+        exact = valid & ~converged & (f_endpoint == 0)
+        roots[exact] = endpoint[exact]
+        converged |= exact
+
+    index = np.flatnonzero(valid & ~converged)
+    a_act, b_act, fa_act, tol_act = a_flat[index], b_flat[index], fa[index], tol_flat[index]
+    params_act = [p[index] for p in params_flat]
+
+    for i in range(1, max_iterations + 1):
+        if index.size == 0:
+            break
+
+        c = (a_act + b_act) / 2
+        fc = np.asarray(f(c, *params_act), dtype=float).reshape(index.size)
+        function_calls += index.size
+
+        done = (np.abs(fc) < tol_act) | ((b_act - a_act) / 2 < tol_act)
+        last = i == max_iterations
+        if done.any() or last:
+            finished = done | last
+            roots[index[finished]] = c[finished]
+            iterations[index[finished]] = i
+            converged[index[done]] = True
+
+        left = fa_act * fc < 0
+        b_act = np.where(left, c, b_act)
+        a_act = np.where(left, a_act, c)
+        fa_act = np.where(left, fa_act, fc)
+
+        if done.any():
+            keep = ~done
+            index = index[keep]
+            a_act, b_act, fa_act, tol_act = a_act[keep], b_act[keep], fa_act[keep], tol_act[keep]
+            params_act = [p[keep] for p in params_act]
+
+    return {
+        'roots': roots.reshape(shape),
+        'iterations_count': iterations.reshape(shape),
+        'converged': converged.reshape(shape),
+        'valid_bracket': valid.reshape(shape),
+        'function_calls': function_calls
+    }
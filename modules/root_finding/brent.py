@@ -0,0 +1,129 @@
+import numpy as np
+from modules.equation_parser import EquationParser
+from modules.evaluation import MemoizedFunction
+from modules.validation import InputValidator
+
+
+class BrentMethod:
+    def __init__(self):
+        self.parser = EquationParser()
+        self.validator = InputValidator()
+
+    def solve(self, equation_str, a, b, tolerance, max_iterations):
+        """Método de Brent: interpolación cuadrática inversa, secante y bisección.
+
+        Mantiene siempre un intervalo con cambio de signo, como bisección, así que la
+        convergencia está garantizada; cuando la interpolación se comporta bien avanza
+        de forma superlineal y cuando no, cae a un paso de bisección.
+        """
+        try:
+            # Validar entradas
+            valid_interval, (a_val, b_val) = self.validator.validate_interval(str(a), str(b))
+            if not valid_interval:
+                raise ValueError(f"Intervalo inválido: {a_val}")
+
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            result = self.parser.parse_equation(equation_str, ['x'])
+            f = MemoizedFunction(result['scalar_function'])
+
+            x_pre, x_cur = a_val, b_val
+            f_pre, f_cur = f(x_pre), f(x_cur)
+
+            if f_pre * f_cur > 0:
+                raise ValueError("La función debe cambiar de signo en el intervalo [a, b]")
+
+            iterations = []
+            # x_blk es el extremo opuesto del intervalo; s_pre / s_cur los dos últimos pasos
+            x_blk, f_blk = x_pre, f_pre
+            s_pre = s_cur = x_cur - x_pre
+            converged = f_pre == 0 or f_cur == 0
+            if f_pre == 0:
+                x_cur, f_cur = x_pre, f_pre
+            half_width = abs(x_cur - x_pre) / 2
+
+            for i in range(iter_val):
+                if converged:
+                    break
+
+                if f_pre * f_cur < 0:
+                    x_blk, f_blk = x_pre, f_pre
+                    s_pre = s_cur = x_cur - x_pre
+
+                # x_cur debe ser siempre la mejor aproximación
+                if abs(f_blk) < abs(f_cur):
+                    x_pre, x_cur, x_blk = x_cur, x_blk, x_cur
+                    f_pre, f_cur, f_blk = f_cur, f_blk, f_cur
+
+                delta = (tol_val + 4 * np.finfo(float).eps * abs(x_cur)) / 2
+                s_bis = (x_blk - x_cur) / 2
+                half_width = abs(s_bis)
+                bracket = (min(x_cur, x_blk), max(x_cur, x_blk))
+
+                if f_cur == 0 or abs(f_cur) < tol_val or abs(s_bis) < delta:
+                    converged = True
+                    break
+
+                step = 'Bisección'
+                if abs(s_pre) > delta and abs(f_cur) < abs(f_pre):
+                    if x_pre == x_blk:
+                        s_try = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+                        kind = 'Secante'
+                    else:
+                        d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+                        d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                        s_try = -f_cur * (f_blk * d_blk - f_pre * d_pre) / (d_blk * d_pre * (f_blk - f_pre))
+                        kind = 'Interp. cuadrática inversa'
+
+                    # Se acepta la interpolación sólo si reduce el intervalo lo suficiente
+                    if 2 * abs(s_try) < min(abs(s_pre), 3 * abs(s_bis) - delta):
+                        s_pre, s_cur = s_cur, s_try
+                        step = kind
+                    else:
+                        s_pre = s_cur = s_bis
+                else:
+                    s_pre = s_cur = s_bis
+
+                x_pre, f_pre = x_cur, f_cur
+                if abs(s_cur) > delta:
+                    x_cur += s_cur
+                else:
+                    x_cur += delta if s_bis > 0 else -delta
+                f_cur = f(x_cur)
+
+                iterations.append({
+                    'Iteración': i + 1,
+                    'a': bracket[0],
+                    'b': bracket[1],
+                    'c': x_cur,
+                    'f(c)': f_cur,
+                    'Paso': step,
+                    'Error': half_width
+                })
+
+            if not converged and abs(f_cur) < tol_val:
+                converged = True
+
+            return {
+                'success': True,
+                'root': x_cur,
+                'iterations': iterations,
+                'converged': converged,
+                'final_error': half_width,
+                'function_calls': f.calls,
+                'message': 'Método completado exitosamente'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'root': None,
+                'iterations': []
+            }
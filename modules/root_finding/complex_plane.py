@@ -0,0 +1,22 @@
+# modules/root_finding/complex_plane.py
+# Utilidades compartidas por los métodos que buscan raíces en el plano complejo
+
+
+def off_real_axis(z, offset=0.1):
+    """Desplaza un valor inicial real fuera del eje real.
+
+    Con f de coeficientes reales, Newton y la secante nunca abandonan el eje real
+    si empiezan en él, y no pueden alcanzar una raíz compleja.
+    """
+    z = complex(z)
+    if z.imag == 0:
+        return complex(z.real, offset * max(1.0, abs(z.real)))
+    return z
+
+
+def real_if_negligible(z, tolerance):
+    """Devuelve float si la parte imaginaria es despreciable frente a |z|"""
+    z = complex(z)
+    if abs(z.imag) <= tolerance * max(1.0, abs(z)):
+        return z.real + 0.0
+    return z
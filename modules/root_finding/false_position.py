@@ -1,5 +1,6 @@
 import numpy as np
 from modules.equation_parser import EquationParser
+from modules.evaluation import MemoizedFunction, broadcast_parameters
 from modules.validation import InputValidator
 
 class FalsePositionMethod:
@@ -28,7 +29,7 @@ class FalsePositionMethod:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, ['x'])
-            f = result['numpy_function']
+            f = MemoizedFunction(result['scalar_function'])
 
             fa, fb = f(a_val), f(b_val)
 
@@ -68,7 +69,7 @@ class FalsePositionMethod:
                 'iterations': iterations,
                 'converged': abs(fc) < tol_val,
                 'final_error': abs(fc),
-                'function_calls': len(iterations) * 3,
+                'function_calls': f.calls,
                 'message': 'Método completado exitosamente'
             }
 
@@ -78,4 +79,75 @@ class FalsePositionMethod:
                 'error': str(e),
                 'root': None,
                 'iterations': []
-            }
\ No newline at end of file
+            }
+
+    def solve_batch(self, equation_str, a, b, tolerance, max_iterations, parameters):
+        """Falsa posición vectorizada sobre una malla de parámetros {nombre: valores}"""
+        try:
+            valid_interval, (a_val, b_val) = self.validator.validate_interval(str(a), str(b))
+            if not valid_interval:
+                raise ValueError(f"Intervalo inválido: {a_val}")
+
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            names, param_arrays, shape = broadcast_parameters(parameters)
+            result = self.parser.parse_equation(equation_str, ['x'], names)
+            f = result['vector_function']
+
+            a_curr = np.full(shape, a_val)
+            b_curr = np.full(shape, b_val)
+            fa = f(a_curr, *param_arrays)
+            fb = f(b_curr, *param_arrays)
+
+            # Los parámetros sin cambio de signo quedan fuera (raíz nan)
+            active = fa * fb <= 0
+            roots = np.full(shape, np.nan)
+            converged = np.zeros(shape, dtype=bool)
+            iterations = np.zeros(shape, dtype=int)
+            function_calls = 2 * a_curr.size
+
+            for _ in range(iter_val):
+                if not active.any():
+                    break
+
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    c = (a_curr * fb - b_curr * fa) / (fb - fa)
+                c = np.where(active, c, a_curr)
+                fc = f(c, *param_arrays)
+                function_calls += c.size
+                iterations += active
+
+                roots = np.where(active, c, roots)
+                done = active & (np.abs(fc) < tol_val)
+                converged |= done
+
+                move_b = active & ~done & (fa * fc < 0)
+                move_a = active & ~done & ~move_b
+                b_curr = np.where(move_b, c, b_curr)
+                fb = np.where(move_b, fc, fb)
+                a_curr = np.where(move_a, c, a_curr)
+                fa = np.where(move_a, fc, fa)
+                active &= ~done
+
+            return {
+                'success': True,
+                'roots': roots,
+                'converged': converged,
+                'iterations_count': iterations,
+                'parameters': dict(zip(names, param_arrays)),
+                'function_calls': function_calls,
+                'message': f'{int(converged.sum())} de {converged.size} casos convergieron'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'roots': None
+            }
@@ -0,0 +1,107 @@
+import cmath
+
+from modules.equation_parser import EquationParser
+from modules.evaluation import MemoizedFunction
+from modules.root_finding.complex_plane import real_if_negligible
+from modules.validation import InputValidator
+
+
+class MullerMethod:
+    def __init__(self):
+        self.parser = EquationParser()
+        self.validator = InputValidator()
+
+    def solve(self, equation_str, x0, x1, x2, tolerance, max_iterations):
+        """Método de Muller: parábola por tres puntos y raíz más cercana a x2.
+
+        Trabaja en aritmética compleja (cmath), así que puede llegar a raíces
+        complejas aunque los tres valores iniciales sean reales (p. ej. x^2 + 1).
+        Sólo necesita una evaluación de f por iteración.
+        """
+        try:
+            # Validar entradas (admite complejos como '1+2i')
+            points = []
+            for name, value in (('x0', x0), ('x1', x1), ('x2', x2)):
+                valid, point = self.validator.validate_complex_input(value)
+                if not valid:
+                    raise ValueError(f"{name} inválido: {point}")
+                points.append(point)
+
+            if len(set(points)) < 3:
+                raise ValueError("Los tres valores iniciales deben ser distintos")
+
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            result = self.parser.parse_equation(equation_str, ['x'])
+            f = MemoizedFunction(result['derivatives'].function(0, scalar="complex"))
+
+            x0_curr, x1_curr, x2_curr = points
+            f0, f1, f2 = f(x0_curr), f(x1_curr), f(x2_curr)
+            iterations = []
+
+            if not all(cmath.isfinite(value) for value in (f0, f1, f2)):
+                raise ValueError("La función no es finita en alguno de los valores iniciales")
+
+            for i in range(iter_val):
+                h1, h2 = x1_curr - x0_curr, x2_curr - x1_curr
+                d1, d2 = (f1 - f0) / h1, (f2 - f1) / h2
+                a = (d2 - d1) / (h2 + h1)
+                b = a * h2 + d2
+                c = f2
+
+                # Se elige el signo que maximiza |denominador| (raíz más cercana a x2)
+                disc = cmath.sqrt(b * b - 4 * a * c)
+                denominator = b + disc if abs(b + disc) >= abs(b - disc) else b - disc
+                if abs(denominator) < 1e-15:
+                    raise ValueError("Denominador cercano a cero")
+
+                x3 = x2_curr - 2 * c / denominator
+                f3 = f(x3)
+                if not cmath.isfinite(f3):
+                    raise ValueError(f"La función no es finita en x = {x3}")
+                error = abs(x3 - x2_curr)
+
+                iterations.append({
+                    'Iteración': i + 1,
+                    'x0': x0_curr,
+                    'x1': x1_curr,
+                    'x2': x2_curr,
+                    'x_new': x3,
+                    'f(x_new)': f3,
+                    'Error': error
+                })
+
+                # Sólo el paso decide la convergencia: con |f| ya pequeño el paso siguiente
+                # es diminuto, y así final_error coincide con converged
+                if error < tol_val:
+                    break
+
+                # Se arrastran los valores ya calculados: una evaluación por iteración
+                x0_curr, f0 = x1_curr, f1
+                x1_curr, f1 = x2_curr, f2
+                x2_curr, f2 = x3, f3
+
+            return {
+                'success': True,
+                'root': real_if_negligible(x3, tol_val),
+                'iterations': iterations,
+                'converged': error < tol_val,
+                'final_error': error,
+                'final_residual': abs(f3),
+                'function_calls': f.calls,
+                'message': 'Método completado exitosamente'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'root': None,
+                'iterations': []
+            }
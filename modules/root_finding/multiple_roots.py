@@ -1,15 +1,23 @@
 import sympy as sp
-import numpy as np
-from modules.equation_parser import EquationParser
+from modules.autodiff import ForwardDerivative
+from modules.equation_parser import AD_OPS_THRESHOLD, EquationParser
+from modules.evaluation import MemoizedFunction
+from modules.root_finding.acceleration import accelerate_result, multiplicity_from_newton, steffensen
 from modules.validation import InputValidator
 
 class MultipleRootsMethod:
     def __init__(self):
         self.parser = EquationParser()
         self.validator = InputValidator()
+        # Derivadas simbólicas más grandes que esto se sustituyen por diferenciación automática
+        self.ad_ops_threshold = AD_OPS_THRESHOLD
 
-    def solve(self, equation_str, initial_guess, tolerance, max_iterations):
-        """Método de Newton modificado para raíces múltiples"""
+    def solve(self, equation_str, initial_guess, tolerance, max_iterations, accelerate=None):
+        """Método de Newton modificado para raíces múltiples.
+
+        accelerate='aitken' añade la raíz extrapolada con Aitken Δ² de los últimos
+        iterados; accelerate='steffensen' itera con Steffensen sobre el paso del método.
+        """
         try:
             # Validar entradas
             valid_guess, x0 = self.validator.validate_numeric_input(str(initial_guess))
@@ -24,68 +32,89 @@ class MultipleRootsMethod:
             if not valid_iter:
                 raise ValueError(f"Iteraciones inválidas: {iter_val}")
 
+            if accelerate not in (None, 'aitken', 'steffensen'):
+                raise ValueError(f"Aceleración desconocida: {accelerate}")
+
             # Validar ecuación
             valid_eq, msg = self.validator.validate_equation(equation_str, ['x'])
             if not valid_eq:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, ['x'])
-            expr = result['expression']
-            x_sym = result['symbols']['x']
+            derivatives = result['derivatives']
 
-            # Calcular primera y segunda derivada
-            f_prime = sp.diff(expr, x_sym)
-            f_double_prime = sp.diff(f_prime, x_sym)
+            # f, f' y f'' en una sola pasada (subexpresiones comunes compartidas, o
+            # números hiper-duales si f'' es demasiado grande para compilarla)
+            compiled = derivatives.auto_kernel(2, scalar=True, ops_threshold=self.ad_ops_threshold)
+            automatic = isinstance(compiled, ForwardDerivative)
+            kernel = MemoizedFunction(compiled)
 
-            f = result['numpy_function']
-            f_p = sp.lambdify(x_sym, f_prime, modules=['numpy', 'math'])
-            f_pp = sp.lambdify(x_sym, f_double_prime, modules=['numpy', 'math'])
+            # Primera y segunda derivada simbólicas (memorizadas); con AD no se calculan
+            f_prime = None if automatic else derivatives.expression(1)
+            f_double_prime = None if automatic else derivatives.expression(2)
 
             x = x0
-            iterations = []
+            if accelerate == 'steffensen':
+                x_new, iterations, _, _ = steffensen(
+                    lambda t: self._step(kernel, t, tol_val), x, tol_val, iter_val
+                )
+                error = iterations[-1]['Error']
+                # Steffensen también atrae los puntos fijos espurios del paso (f' = 0 con f != 0)
+                fx, fpx, _ = kernel(x_new)
+                if abs(fx) >= tol_val and abs(fx) >= tol_val ** 0.5 * abs(fpx):
+                    raise ValueError("Steffensen convergió a un punto crítico de f que no es raíz")
+            else:
+                iterations = []
 
-            for i in range(iter_val):
-                fx = f(x)
-                fpx = f_p(x)
-                fppx = f_pp(x)
+                for i in range(iter_val):
+                    fx, fpx, fppx = kernel(x)
 
-                denominator = fpx ** 2 - fx * fppx
-                if abs(denominator) < 1e-15:
-                    raise ValueError("Denominador cercano a cero")
+                    denominator = fpx ** 2 - fx * fppx
+                    if abs(denominator) < 1e-15:
+                        # f, f' y f'' se anulan a la vez sólo muy cerca de la raíz
+                        if abs(fx) < tol_val:
+                            x_new, error = x, 0.0
+                            break
+                        raise ValueError("Denominador cercano a cero")
 
-                x_new = x - (fx * fpx) / denominator
-                error = abs(x_new - x)
+                    x_new = x - (fx * fpx) / denominator
+                    error = abs(x_new - x)
 
-                iterations.append({
-                    'Iteración': i + 1,
-                    'x': x,
-                    'f(x)': fx,
-                    "f'(x)": fpx,
-                    "f''(x)": fppx,
-                    'x_new': x_new,
-                    'Error': error
-                })
+                    iterations.append({
+                        'Iteración': i + 1,
+                        'x': x,
+                        'f(x)': fx,
+                        "f'(x)": fpx,
+                        "f''(x)": fppx,
+                        'x_new': x_new,
+                        'Error': error
+                    })
 
-                if error < tol_val:
-                    break
+                    if error < tol_val:
+                        break
 
-                x = x_new
+                    x = x_new
 
             # Estimar multiplicidad
-            multiplicity = self.estimate_multiplicity(f, f_p, x_new)
+            multiplicity = self.estimate_multiplicity(kernel, x_new)
 
-            return {
+            response = {
                 'success': True,
                 'root': x_new,
                 'iterations': iterations,
                 'converged': error < tol_val,
                 'final_error': error,
                 'estimated_multiplicity': multiplicity,
-                'function_calls': len(iterations) * 3,
-                'first_derivative': sp.latex(f_prime),
-                'second_derivative': sp.latex(f_double_prime),
+                'acceleration': accelerate,
+                'function_calls': kernel.calls,
+                'first_derivative': sp.latex(f_prime) if f_prime is not None else None,
+                'second_derivative': sp.latex(f_double_prime) if f_double_prime is not None else None,
+                'automatic_differentiation': automatic,
                 'message': 'Método completado exitosamente'
             }
+            if accelerate == 'aitken':
+                response['accelerated_root'] = accelerate_result(response)['accelerated_root']
+            return response
 
         except Exception as e:
             return {
@@ -95,15 +124,30 @@ class MultipleRootsMethod:
                 'iterations': []
             }
 
-    def estimate_multiplicity(self, f, f_prime, root, h=1e-5):
-        """Estima la multiplicidad de la raíz"""
-        try:
-            f_root = f(root)
-            f_prime_root = f_prime(root)
+    @staticmethod
+    def _step(kernel, x, tolerance):
+        """Un paso x - f f' / (f'² - f f''); x si ya es la raíz"""
+        fx, fpx, fppx = kernel(x)
+        denominator = fpx ** 2 - fx * fppx
+        if abs(denominator) < 1e-15:
+            if abs(fx) < tolerance:
+                return x
+            raise ValueError("Denominador cercano a cero")
+        return x - (fx * fpx) / denominator
+
+    def estimate_multiplicity(self, kernel, root, h=1e-3):
+        """Estima la multiplicidad de la raíz.
+
+        Los iterados de este método convergen cuadráticamente sea cual sea m, así
+        que no revelan la multiplicidad. Se dan unos pasos de Newton desde r + h y
+        se aplica el mismo estimador por razón de convergencia que Newton-Raphson:
+        en una raíz de multiplicidad m la razón entre pasos es (m - 1) / m.
+        """
+        def newton_step(x):
+            fx, fpx = kernel(x)[:2]
+            return fx / fpx
 
-            if abs(f_prime_root) < 1e-10:
-                return 2
-            else:
-                return 1
-        except:
-            return 1
\ No newline at end of file
+        try:
+            return multiplicity_from_newton(newton_step, root + h * max(1.0, abs(root)))
+        except Exception:
+            return 1
@@ -1,6 +1,16 @@
 import sympy as sp
 import numpy as np
-from modules.equation_parser import EquationParser
+from modules.autodiff import ForwardDerivative
+from modules.equation_parser import AD_OPS_THRESHOLD, EquationParser
+from modules.evaluation import MemoizedFunction, broadcast_parameters
+from modules.root_finding.acceleration import (
+    accelerate_result,
+    convergence_ratio,
+    multiplicity_from_newton,
+    multiplicity_from_ratio,
+    steffensen,
+)
+from modules.root_finding.complex_plane import off_real_axis, real_if_negligible
 from modules.validation import InputValidator
 
 
@@ -8,12 +18,33 @@ class NewtonRaphsonMethod:
     def __init__(self):
         self.parser = EquationParser()
         self.validator = InputValidator()
+        # Derivadas simbólicas más grandes que esto se sustituyen por diferenciación automática
+        self.ad_ops_threshold = AD_OPS_THRESHOLD
 
-    def solve(self, equation_str, initial_guess, tolerance, max_iterations):
-        """Implementa el método de Newton-Raphson"""
+    def solve(self, equation_str, initial_guess, tolerance, max_iterations, complex_mode=False,
+              auto_multiplicity=True, accelerate=None):
+        """Implementa el método de Newton-Raphson.
+
+        Con complex_mode=True itera en el plano complejo (cmath): acepta valores
+        iniciales como '1+2i' y un inicio real se desplaza fuera del eje real.
+
+        En una raíz de multiplicidad m Newton converge sólo linealmente, con razón
+        (m - 1) / m entre pasos sucesivos. Con auto_multiplicity=True, cuando el paso
+        y |f| ya son pequeños y esa razón se estabiliza se estima m y se pasa a Newton
+        modificado x - m f/f'. Lejos de la raíz Newton también avanza linealmente, por
+        eso no se estima antes. Cada paso modificado sólo se acepta si reduce |f|; si
+        no, se vuelve al paso de Newton con m = 1.
+
+        accelerate='aitken' añade la raíz extrapolada con Aitken Δ² de los últimos
+        iterados; accelerate='steffensen' itera con Steffensen sobre el paso de
+        Newton g(x) = x - f/f', cuadrático también en raíces múltiples.
+        """
         try:
             # Validar entradas
-            valid_guess, x0 = self.validator.validate_numeric_input(str(initial_guess))
+            if complex_mode:
+                valid_guess, x0 = self.validator.validate_complex_input(initial_guess)
+            else:
+                valid_guess, x0 = self.validator.validate_numeric_input(str(initial_guess))
             if not valid_guess:
                 raise ValueError(f"Valor inicial inválido: {x0}")
 
@@ -25,58 +56,309 @@ class NewtonRaphsonMethod:
             if not valid_iter:
                 raise ValueError(f"Iteraciones inválidas: {iter_val}")
 
+            if accelerate not in (None, 'aitken', 'steffensen'):
+                raise ValueError(f"Aceleración desconocida: {accelerate}")
+
             # Parsear ecuación
             result = self.parser.parse_equation(equation_str, ['x'])
-            expr = result['expression']
-            x_sym = result['symbols']['x']
+            # f y f' en una sola pasada (subexpresiones comunes compartidas, o AD si f' es enorme)
+            kernel = result['derivatives'].auto_kernel(
+                1, scalar="complex" if complex_mode else True, ops_threshold=self.ad_ops_threshold
+            )
+            automatic = isinstance(kernel, ForwardDerivative)
+            # Con AD no se deriva simbólicamente: no hay expresión de f' que mostrar
+            derivative = None if automatic else result['derivatives'].expression(1)
+            f_and_prime = MemoizedFunction(kernel)
 
-            # Calcular derivada
-            derivative = sp.diff(expr, x_sym)
-            f_prime = sp.lambdify(x_sym, derivative, modules=['numpy', 'math'])
-            f = result['numpy_function']
+            x = off_real_axis(x0) if complex_mode else x0
+            if accelerate == 'steffensen':
+                x_new, error, iterations = self._steffensen_iterations(f_and_prime, x, tol_val, iter_val)
+                multiplicity = multiplicity_from_newton(
+                    lambda t: self._newton_step(f_and_prime, t, tol_val),
+                    x_new + 1e-3 * max(1.0, abs(x_new))
+                )
+                modified_from = None
+            else:
+                x_new, error, iterations, multiplicity, modified_from = self._newton_iterations(
+                    f_and_prime, x, tol_val, iter_val, auto_multiplicity
+                )
 
-            x = x0
-            iterations = []
+            if complex_mode:
+                x_new = real_if_negligible(x_new, tol_val)
 
-            for i in range(iter_val):
-                fx = f(x)
-                fpx = f_prime(x)
+            response = {
+                'success': True,
+                'root': x_new,
+                'iterations': iterations,
+                'converged': error < tol_val,
+                'final_error': error,
+                'estimated_multiplicity': multiplicity,
+                'modified_from_iteration': modified_from,
+                'acceleration': accelerate,
+                'function_calls': f_and_prime.calls,  # cada llamada evalúa f(x) y f'(x) juntas
+                'derivative_expression': sp.latex(derivative) if derivative is not None else None,
+                'automatic_differentiation': automatic,
+                'message': 'Método completado exitosamente'
+            }
+            if accelerate == 'aitken':
+                response['accelerated_root'] = accelerate_result(response)['accelerated_root']
+            return response
 
-                if abs(fpx) < 1e-15:
-                    raise ValueError("Derivada cercana a cero. Posible punto estacionario.")
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'root': None,
+                'iterations': []
+            }
+
+    @staticmethod
+    def _newton_step(f_and_prime, x, tolerance):
+        """f(x) / f'(x); 0 si f' se anula en la raíz misma"""
+        fx, fpx = f_and_prime(x)
+        if abs(fpx) < 1e-15:
+            if abs(fx) < tolerance:
+                return 0.0
+            raise ValueError("Derivada cercana a cero. Posible punto estacionario.")
+        return fx / fpx
+
+    def _steffensen_iterations(self, f_and_prime, x, tolerance, max_iterations):
+        """Steffensen sobre el paso de Newton: (raíz, error, iteraciones)"""
+        x_new, iterations, _, _ = steffensen(
+            lambda t: t - self._newton_step(f_and_prime, t, tolerance), x, tolerance, max_iterations
+        )
+        return x_new, iterations[-1]['Error'], iterations
 
-                x_new = x - fx / fpx
-                error = abs(x_new - x)
+    def _newton_iterations(self, f_and_prime, x, tolerance, max_iterations, auto_multiplicity):
+        """Iteración de Newton con cambio automático a Newton modificado.
 
-                iterations.append({
-                    'Iteración': i + 1,
-                    'x': x,
-                    'f(x)': fx,
-                    "f'(x)": fpx,
-                    'x_new': x_new,
-                    'Error': error
-                })
+        Devuelve (raíz, error, iteraciones, multiplicidad, iteración del cambio).
+        """
+        iterations = []
+        path = [x]
+        multiplicity, modified_from = 1, None
 
-                if error < tol_val or abs(fx) < tol_val:
+        for i in range(max_iterations):
+            fx, fpx = f_and_prime(x)
+
+            if abs(fpx) < 1e-15:
+                # En una raíz múltiple f' se anula junto con f: x ya es la raíz
+                if abs(fx) < tolerance:
+                    x_new, error = x, 0.0
                     break
+                raise ValueError("Derivada cercana a cero. Posible punto estacionario.")
+
+            x_new = x - fx / fpx
+            if multiplicity > 1:
+                # f(x_mod) queda memorizada: si se acepta, es la evaluación de la próxima iteración
+                x_mod = x - multiplicity * fx / fpx
+                if abs(f_and_prime(x_mod)[0]) < abs(fx):
+                    x_new = x_mod
+                else:
+                    multiplicity, modified_from = 1, None
+                    path = [x]
+            error = abs(x_new - x)
+
+            iterations.append({
+                'Iteración': i + 1,
+                'x': x,
+                'f(x)': fx,
+                "f'(x)": fpx,
+                'x_new': x_new,
+                'Error': error
+            })
+
+            if error < tolerance or abs(fx) < tolerance:
+                break
+
+            x = x_new
+            path.append(x)
+
+            # Convergencia lineal estable cerca de la raíz: raíz múltiple, se cambia a Newton modificado
+            near_root = error <= 1e-2 * max(1.0, abs(x)) and abs(fx) < np.sqrt(tolerance)
+            if auto_multiplicity and modified_from is None and near_root:
+                estimate = multiplicity_from_ratio(convergence_ratio(path))
+                if estimate >= 2:
+                    multiplicity, modified_from = estimate, i + 2
+
+        return x_new, error, iterations, multiplicity, modified_from
+
+    def solve_batch(self, equation_str, initial_guess, tolerance, max_iterations, parameters):
+        """Newton-Raphson vectorizado sobre una malla de parámetros {nombre: valores}"""
+        try:
+            valid_guess, x0 = self.validator.validate_numeric_input(str(initial_guess))
+            if not valid_guess:
+                raise ValueError(f"Valor inicial inválido: {x0}")
+
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            names, param_arrays, shape = broadcast_parameters(parameters)
+            result = self.parser.parse_equation(equation_str, ['x'], names)
+            f_and_prime = result['derivatives'].kernel(1)
+
+            size = int(np.prod(shape))
+            roots = np.full(size, np.nan)
+            converged = np.zeros(size, dtype=bool)
+            iterations = np.zeros(size, dtype=int)
+            function_calls = 0
+
+            # Casos pendientes: los convergidos o estancados salen de los arrays de trabajo
+            index = np.arange(size)
+            x = np.full(size, x0)
+            params_act = [np.ravel(p) for p in param_arrays]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for _ in range(iter_val):
+                    if index.size == 0:
+                        break
+
+                    fx, fpx = (np.broadcast_to(v, x.shape) for v in f_and_prime(x, *params_act))
+                    function_calls += 2 * index.size
+                    iterations[index] += 1
 
-                x = x_new
+                    # Derivada nula: ese caso se abandona sin converger
+                    stalled = np.abs(fpx) < 1e-15
+                    x_new = x - fx / fpx
+
+                    done = ~stalled & ((np.abs(x_new - x) < tol_val) | (np.abs(fx) < tol_val))
+                    roots[index[done]] = x_new[done]
+                    converged[index[done]] = True
+
+                    keep = ~(done | stalled)
+                    index, x = index[keep], x_new[keep]
+                    params_act = [p[keep] for p in params_act]
 
             return {
                 'success': True,
-                'root': x_new,
-                'iterations': iterations,
-                'converged': error < tol_val,
-                'final_error': error,
-                'function_calls': len(iterations) * 2,  # f(x) y f'(x) en cada iteración
-                'derivative_expression': sp.latex(derivative),
-                'message': 'Método completado exitosamente'
+                'roots': roots.reshape(shape),
+                'converged': converged.reshape(shape),
+                'iterations_count': iterations.reshape(shape),
+                'parameters': dict(zip(names, param_arrays)),
+                'function_calls': function_calls,
+                'message': f'{int(converged.sum())} de {converged.size} casos convergieron'
             }
 
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e),
-                'root': None,
-                'iterations': []
-            }
\ No newline at end of file
+                'roots': None
+            }
+
+    def solve_multistart(self, equation_str, starts, tolerance, max_iterations, cluster_tolerance=None):
+        """Newton-Raphson desde muchos valores iniciales a la vez (reales o complejos).
+
+        starts puede tener cualquier forma, p. ej. la malla de starting_grid. Los casos
+        convergidos se retiran de los arrays de trabajo en cada iteración. Cada raíz
+        recibe una etiqueta de grupo (cuenca de atracción); -1 si no convergió.
+        """
+        try:
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            starts = np.asarray(starts)
+            dtype = np.complex128 if np.iscomplexobj(starts) else np.float64
+            shape = starts.shape
+            flat_starts = starts.astype(dtype).ravel()
+            size = flat_starts.size
+
+            result = self.parser.parse_equation(equation_str, ['x'])
+            f_and_prime = result['derivatives'].kernel(1)
+
+            roots = np.full(size, np.nan, dtype=dtype)
+            iterations = np.zeros(size, dtype=int)
+            converged = np.zeros(size, dtype=bool)
+            function_calls = 0
+
+            index = np.arange(size)
+            x = flat_starts.copy()
+
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                for i in range(1, iter_val + 1):
+                    if index.size == 0:
+                        break
+
+                    fx, fpx = (np.broadcast_to(v, x.shape) for v in f_and_prime(x))
+                    function_calls += 2 * index.size
+
+                    x_new = x - fx / fpx
+                    done = (np.abs(x_new - x) < tol_val) | (np.abs(fx) < tol_val)
+                    # Derivada nula o valores no finitos: el caso se abandona sin converger
+                    lost = ~np.isfinite(x_new) | (np.abs(fpx) < 1e-15)
+                    done &= ~lost
+
+                    roots[index[done]] = x_new[done]
+                    iterations[index[done | lost]] = i
+                    converged[index[done]] = True
+
+                    keep = ~(done | lost)
+                    index, x = index[keep], x_new[keep]
+
+            iterations[index] = iter_val
+
+            if cluster_tolerance is None:
+                cluster_tolerance = max(1e3 * tol_val, 1e-8)
+            labels, cluster_roots = self._cluster_roots(roots, converged, cluster_tolerance)
+
+            return {
+                'success': True,
+                'roots': roots.reshape(shape),
+                'iterations_count': iterations.reshape(shape),
+                'converged': converged.reshape(shape),
+                'labels': labels.reshape(shape),
+                'cluster_roots': cluster_roots,
+                'starts': starts,
+                'function_calls': function_calls,
+                'message': f'{int(converged.sum())} de {size} inicios convergieron '
+                           f'a {len(cluster_roots)} raíces distintas'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'roots': None
+            }
+
+    @staticmethod
+    def starting_grid(real_range, imag_range=None, resolution=200):
+        """Valores iniciales equiespaciados: reales (1D) o una malla compleja (2D)"""
+        real = np.linspace(real_range[0], real_range[1], resolution)
+        if imag_range is None:
+            return real
+        imag = np.linspace(imag_range[0], imag_range[1], resolution)
+        re, im = np.meshgrid(real, imag)
+        return re + 1j * im
+
+    @staticmethod
+    def _cluster_roots(roots, converged, tolerance):
+        """Agrupa raíces a distancia < tolerance; devuelve (etiquetas, representantes)"""
+        labels = np.full(roots.shape, -1, dtype=int)
+        representatives = []
+        pending = np.flatnonzero(converged)
+
+        while pending.size:
+            center = roots[pending[0]]
+            members = np.abs(roots[pending] - center) < tolerance
+            labels[pending[members]] = len(representatives)
+            representatives.append(complex(center) if np.iscomplexobj(roots) else float(center))
+            pending = pending[~members]
+
+        # Etiquetas ordenadas por la posición de la raíz (parte real, luego imaginaria)
+        order = sorted(range(len(representatives)),
+                       key=lambda k: (np.real(representatives[k]), np.imag(representatives[k])))
+        relabel = np.empty(len(order) + 1, dtype=int)
+        relabel[-1] = -1
+        relabel[order] = np.arange(len(order))
+        return relabel[labels], [representatives[k] for k in order]
@@ -0,0 +1,168 @@
+import numpy as np
+from modules.equation_parser import EquationParser
+from modules.root_finding.complex_plane import real_if_negligible
+from modules.validation import InputValidator
+
+
+class PolynomialRootsMethod:
+    def __init__(self):
+        self.parser = EquationParser()
+        self.validator = InputValidator()
+
+    def solve(self, equation_str, tolerance=1e-12, max_iterations=50, cluster_tolerance=1e-3):
+        """Todas las raíces (reales y complejas) de un polinomio a la vez.
+
+        1. Autovalores de la matriz compañera del polinomio mónico.
+        2. Agrupa autovalores cercanos: una raíz de multiplicidad m aparece como m
+           autovalores dispersos ~eps^(1/m); su centroide es mucho más preciso. El
+           grupo sólo se acepta si |p| en el centroide está al nivel del redondeo.
+        3. Pule cada raíz con Newton modificado x -= m p/p' evaluando con Horner.
+        """
+        try:
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            coeffs = self.parser.polynomial_coefficients(equation_str, 'x')
+            if coeffs is None:
+                raise ValueError("La ecuación no es un polinomio en x con coeficientes numéricos")
+
+            coeffs = np.trim_zeros(coeffs, 'f')
+            degree = len(coeffs) - 1
+            if degree < 1:
+                raise ValueError("El polinomio es constante: no tiene raíces aisladas")
+
+            # Raíces nulas: coeficientes finales iguales a cero
+            zero_multiplicity = len(coeffs) - len(np.trim_zeros(coeffs, 'b'))
+            reduced = coeffs[:len(coeffs) - zero_multiplicity]
+
+            roots, multiplicities = [], []
+            evaluations = 0
+            if len(reduced) > 1:
+                eigenvalues = np.linalg.eigvals(self.companion_matrix(reduced))
+                roots, multiplicities, evaluations = self._cluster(
+                    reduced, eigenvalues, cluster_tolerance
+                )
+                roots, polish_evaluations = self._polish(
+                    reduced, np.array(roots), np.array(multiplicities), tol_val, iter_val
+                )
+                evaluations += polish_evaluations
+                roots = list(roots)
+
+            if zero_multiplicity:
+                roots.append(0.0)
+                multiplicities.append(zero_multiplicity)
+
+            roots = [real_if_negligible(root, tol_val) for root in roots]
+            order = sorted(range(len(roots)), key=lambda k: (np.imag(roots[k]) != 0,
+                                                             np.real(roots[k]), np.imag(roots[k])))
+            roots = [roots[k] for k in order]
+            multiplicities = [int(multiplicities[k]) for k in order]
+            residuals = [abs(self.horner(coeffs, root)[0]) for root in roots]
+
+            real_roots = [root for root in roots if not isinstance(root, complex)]
+            return {
+                'success': True,
+                'roots': roots,
+                'real_roots': real_roots,
+                'complex_roots': [root for root in roots if isinstance(root, complex)],
+                'multiplicities': multiplicities,
+                'residuals': residuals,
+                'degree': degree,
+                'coefficients': coeffs.tolist(),
+                'function_calls': evaluations + len(roots),
+                'message': f'Polinomio de grado {degree}: {len(roots)} raíces distintas '
+                           f'({len(real_roots)} reales)'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'roots': []
+            }
+
+    @staticmethod
+    def companion_matrix(coeffs):
+        """Matriz compañera (forma de Frobenius) del polinomio de coeficientes coeffs"""
+        coeffs = np.asarray(coeffs)
+        n = len(coeffs) - 1
+        matrix = np.zeros((n, n), dtype=np.result_type(coeffs, float))
+        matrix[0, :] = -coeffs[1:] / coeffs[0]
+        matrix[np.arange(1, n), np.arange(n - 1)] = 1
+        return matrix
+
+    @staticmethod
+    def horner(coeffs, z):
+        """Evalúa p(z) y p'(z) con el esquema de Horner (z puede ser un array)"""
+        p = np.zeros_like(z, dtype=np.result_type(z, coeffs, float)) + coeffs[0]
+        dp = np.zeros_like(p)
+        for c in coeffs[1:]:
+            dp = dp * z + p
+            p = p * z + c
+        return p, dp
+
+    @classmethod
+    def _rounding_bound(cls, coeffs, z):
+        """Cota del error de redondeo de Horner en z: eps * sum |a_i| |z|^i"""
+        bound, _ = cls.horner(np.abs(coeffs), np.abs(z))
+        return 2 * len(coeffs) * np.finfo(float).eps * bound
+
+    def _cluster(self, coeffs, eigenvalues, cluster_tolerance):
+        """Agrupa autovalores cercanos en raíces múltiples; devuelve (raíces, multiplicidades, evaluaciones)"""
+        pending = list(eigenvalues)
+        roots, multiplicities = [], []
+        evaluations = 0
+
+        while pending:
+            seed = pending.pop(0)
+            radius = cluster_tolerance * max(1.0, abs(seed))
+            members = [seed] + [z for z in pending if abs(z - seed) < radius]
+
+            if len(members) > 1:
+                center = np.mean(members)
+                value, _ = self.horner(coeffs, center)
+                evaluations += 1
+                # Raíz múltiple genuina: p(centroide) es puro ruido de redondeo
+                if abs(value) <= 100 * self._rounding_bound(coeffs, center):
+                    for z in members[1:]:
+                        pending.remove(z)
+                    roots.append(center)
+                    multiplicities.append(len(members))
+                    continue
+
+            roots.append(seed)
+            multiplicities.append(1)
+
+        return roots, multiplicities, evaluations
+
+    def _polish(self, coeffs, roots, multiplicities, tolerance, max_iterations):
+        """Newton modificado vectorizado; sólo acepta pasos que reducen |p|"""
+        roots = roots.astype(complex)
+        p, dp = self.horner(coeffs, roots)
+        evaluations = roots.size
+        active = np.ones(roots.size, dtype=bool)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for _ in range(max_iterations):
+                if not active.any():
+                    break
+
+                step = np.where(dp != 0, multiplicities * p / dp, 0)
+                candidate = roots - step
+                p_new, dp_new = self.horner(coeffs, candidate)
+                evaluations += int(active.sum())
+
+                improves = active & np.isfinite(candidate) & (np.abs(p_new) < np.abs(p))
+                roots = np.where(improves, candidate, roots)
+                p = np.where(improves, p_new, p)
+                dp = np.where(improves, dp_new, dp)
+
+                small = np.abs(step) <= tolerance * np.maximum(1.0, np.abs(roots))
+                active &= improves & ~small
+
+        return roots, evaluations
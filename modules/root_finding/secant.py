@@ -1,5 +1,7 @@
 import numpy as np
 from modules.equation_parser import EquationParser
+from modules.evaluation import MemoizedFunction, broadcast_parameters
+from modules.root_finding.complex_plane import off_real_axis, real_if_negligible
 from modules.validation import InputValidator
 
 class SecantMethod:
@@ -7,15 +9,24 @@ class SecantMethod:
         self.parser = EquationParser()
         self.validator = InputValidator()
 
-    def solve(self, equation_str, x0, x1, tolerance, max_iterations):
-        """Implementa el método de la secante"""
+    def solve(self, equation_str, x0, x1, tolerance, max_iterations, complex_mode=False):
+        """Implementa el método de la secante.
+
+        Con complex_mode=True itera en el plano complejo (cmath); si ambos valores
+        iniciales son reales, x1 se desplaza fuera del eje real.
+        """
         try:
             # Validar entradas
-            valid_x0, x0_val = self.validator.validate_numeric_input(str(x0))
+            if complex_mode:
+                valid_x0, x0_val = self.validator.validate_complex_input(x0)
+                valid_x1, x1_val = self.validator.validate_complex_input(x1)
+            else:
+                valid_x0, x0_val = self.validator.validate_numeric_input(str(x0))
+                valid_x1, x1_val = self.validator.validate_numeric_input(str(x1))
+
             if not valid_x0:
                 raise ValueError(f"x0 inválido: {x0_val}")
 
-            valid_x1, x1_val = self.validator.validate_numeric_input(str(x1))
             if not valid_x1:
                 raise ValueError(f"x1 inválido: {x1_val}")
 
@@ -32,14 +43,18 @@ class SecantMethod:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, ['x'])
-            f = result['numpy_function']
+            if complex_mode:
+                f = MemoizedFunction(result['derivatives'].function(0, scalar="complex"))
+                if x0_val.imag == 0 and x1_val.imag == 0:
+                    x1_val = off_real_axis(x1_val)
+            else:
+                f = MemoizedFunction(result['scalar_function'])
 
             iterations = []
             x0_curr, x1_curr = x0_val, x1_val
+            fx0, fx1 = f(x0_curr), f(x1_curr)
 
             for i in range(iter_val):
-                fx0, fx1 = f(x0_curr), f(x1_curr)
-
                 if abs(fx1 - fx0) < 1e-15:
                     raise ValueError("Diferencia de función cercana a cero")
 
@@ -61,7 +76,12 @@ class SecantMethod:
                 if error < tol_val or abs(fx2) < tol_val:
                     break
 
-                x0_curr, x1_curr = x1_curr, x2
+                # Se arrastran los valores ya calculados: una evaluación por iteración
+                x0_curr, fx0 = x1_curr, fx1
+                x1_curr, fx1 = x2, fx2
+
+            if complex_mode:
+                x2 = real_if_negligible(x2, tol_val)
 
             return {
                 'success': True,
@@ -69,7 +89,7 @@ class SecantMethod:
                 'iterations': iterations,
                 'converged': error < tol_val,
                 'final_error': error,
-                'function_calls': len(iterations) * 3,
+                'function_calls': f.calls,
                 'message': 'Método completado exitosamente'
             }
 
@@ -79,4 +99,86 @@ class SecantMethod:
                 'error': str(e),
                 'root': None,
                 'iterations': []
-            }
\ No newline at end of file
+            }
+
+    def solve_batch(self, equation_str, x0, x1, tolerance, max_iterations, parameters):
+        """Método de la secante vectorizado sobre una malla de parámetros {nombre: valores}"""
+        try:
+            valid_x0, x0_val = self.validator.validate_numeric_input(str(x0))
+            if not valid_x0:
+                raise ValueError(f"x0 inválido: {x0_val}")
+
+            valid_x1, x1_val = self.validator.validate_numeric_input(str(x1))
+            if not valid_x1:
+                raise ValueError(f"x1 inválido: {x1_val}")
+
+            valid_tol, tol_val = self.validator.validate_numeric_input(str(tolerance), 1e-15, 1, True)
+            if not valid_tol:
+                raise ValueError(f"Tolerancia inválida: {tol_val}")
+
+            valid_iter, iter_val = self.validator.validate_positive_integer(str(max_iterations), 1)
+            if not valid_iter:
+                raise ValueError(f"Iteraciones inválidas: {iter_val}")
+
+            names, param_arrays, shape = broadcast_parameters(parameters)
+            result = self.parser.parse_equation(equation_str, ['x'], names)
+            f = result['vector_function']
+
+            size = int(np.prod(shape))
+            roots = np.full(size, np.nan)
+            converged = np.zeros(size, dtype=bool)
+            iterations = np.zeros(size, dtype=int)
+
+            # Casos pendientes: los convergidos o estancados salen de los arrays de trabajo
+            index = np.arange(size)
+            params_act = [np.ravel(p) for p in param_arrays]
+            x0_curr = np.full(size, x0_val)
+            x1_curr = np.full(size, x1_val)
+            fx0 = np.broadcast_to(f(x0_curr, *params_act), (size,))
+            fx1 = np.broadcast_to(f(x1_curr, *params_act), (size,))
+            function_calls = 2 * size
+
+            for _ in range(iter_val):
+                # Diferencia de función nula: ese caso se abandona sin converger
+                stalled = np.abs(fx1 - fx0) < 1e-15
+                if stalled.any():
+                    keep = ~stalled
+                    index, x0_curr, x1_curr = index[keep], x0_curr[keep], x1_curr[keep]
+                    fx0, fx1 = fx0[keep], fx1[keep]
+                    params_act = [p[keep] for p in params_act]
+
+                if index.size == 0:
+                    break
+
+                x2 = x1_curr - fx1 * (x1_curr - x0_curr) / (fx1 - fx0)
+                fx2 = np.broadcast_to(f(x2, *params_act), x2.shape)
+                function_calls += index.size
+                iterations[index] += 1
+
+                done = (np.abs(x2 - x1_curr) < tol_val) | (np.abs(fx2) < tol_val)
+                roots[index[done]] = x2[done]
+                converged[index[done]] = True
+
+                # Se arrastran los valores ya calculados: una evaluación por iteración
+                keep = ~done
+                index = index[keep]
+                x0_curr, fx0 = x1_curr[keep], fx1[keep]
+                x1_curr, fx1 = x2[keep], fx2[keep]
+                params_act = [p[keep] for p in params_act]
+
+            return {
+                'success': True,
+                'roots': roots.reshape(shape),
+                'converged': converged.reshape(shape),
+                'iterations_count': iterations.reshape(shape),
+                'parameters': dict(zip(names, param_arrays)),
+                'function_calls': function_calls,
+                'message': f'{int(converged.sum())} de {converged.size} casos convergieron'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'roots': None
+            }
@@ -24,18 +24,15 @@ class TaylorPolynomial:
                 raise ValueError(msg)
 
             result = self.parser.parse_equation(equation_str, [variable])
-            expr = result['expression']
             x = result['symbols'][variable]
+            store = result['derivatives']
 
             taylor_poly = 0
             derivatives = []
-            derivative = None
 
             for n in range(degree_val + 1):
-                if n == 0:
-                    derivative = expr
-                else:
-                    derivative = sp.diff(derivative, x)
+                # Las derivadas ya calculadas en peticiones anteriores se reutilizan
+                derivative = store.expression(n, variable)
 
                 derivative_at_point = derivative.subs(x, point_val)
                 term = (derivative_at_point / sp.factorial(n)) * (x - point_val) ** n
@@ -60,7 +57,7 @@ class TaylorPolynomial:
                 'taylor_function': taylor_func,
                 'derivatives': derivatives,
                 'error_term': sp.latex(sp.Rational(1, sp.factorial(degree_val + 1)) *
-                               sp.diff(expr, x, degree_val + 1).subs(x, sp.Symbol('ξ')) *
+                               store.expression(degree_val + 1, variable).subs(x, sp.Symbol('ξ')) *
                                (x - point_val) ** (degree_val + 1)),
                 'message': 'Polinomio de Taylor calculado exitosamente'
             }
@@ -1,17 +1,30 @@
 import re
 import numpy as np
-from modules.equation_parser import EquationParser
+from modules.equation_lexer import quick_check
 
 
 class InputValidator:
     def __init__(self):
-        self.parser = EquationParser()
+        self._parser = None
+
+    @property
+    def parser(self):
+        """EquationParser creado en el primer uso (importar SymPy es costoso)"""
+        if self._parser is None:
+            from modules.equation_parser import EquationParser
+            self._parser = EquationParser()
+        return self._parser
 
     def validate_equation(self, equation_str, required_variables=['x']):
         """Valida que la ecuación sea sintácticamente correcta"""
         if not equation_str or equation_str.strip() == "":
             return False, "La ecuación no puede estar vacía"
 
+        # Descartar en microsegundos la entrada mal formada antes de llamar a SymPy
+        valid_syntax, msg = quick_check(equation_str)
+        if not valid_syntax:
+            return False, f"Error en la ecuación: {msg}"
+
         try:
             # Intentar parsear la ecuación
             self.parser.parse_equation(equation_str, required_variables)
@@ -19,6 +32,12 @@ class InputValidator:
         except Exception as e:
             return False, f"Error en la ecuación: {str(e)}"
 
+    def quick_validate_equation(self, equation_str):
+        """Verificación sintáctica rápida (sin SymPy), pensada para cada pulsación"""
+        if not equation_str or equation_str.strip() == "":
+            return False, "La ecuación no puede estar vacía"
+        return quick_check(equation_str)
+
     def validate_numeric_input(self, value_str, min_val=None, max_val=None, allow_negative=True):
         """Valida una entrada numérica"""
         try:
@@ -37,6 +56,19 @@ class InputValidator:
         except ValueError:
             return False, "Por favor ingrese un número válido"
 
+    def validate_complex_input(self, value_str):
+        """Valida un número complejo: '1+2i', '1 + 2j', '-i', '3' o un complex de Python"""
+        if isinstance(value_str, (int, float, complex, np.number)):
+            return True, complex(value_str)
+        try:
+            text = str(value_str).replace(" ", "").replace("*", "")
+            # 'i' / 'I' como unidad imaginaria; una unidad suelta ('-i') vale 1j
+            text = re.sub(r"(?<![\d.])[iIjJ]", "1j", text)
+            text = re.sub(r"[iIJ]", "j", text)
+            return True, complex(text)
+        except ValueError:
+            return False, "Por favor ingrese un número complejo válido (p. ej. 1+2i)"
+
     def validate_interval(self, a_str, b_str):
         """Valida que [a, b] sea un intervalo válido"""
         valid_a, a = self.validate_numeric_input(a_str)